@@ -1,21 +1,123 @@
-from .config import BossConfig
-from .auth import BossAuth
-from .browser import BossBrowser
-from .url_builder import BossUrlBuilder
-from .data_processor import BossDataProcessor
-from .scraper import BossScraper
-from .boss_scraper import BossJobScraper, search_boss_jobs, test_scraper
+"""
+Boss直聘爬虫
+
+导入本包不会加载浏览器驱动、读取代码表或访问网络：各组件在第一次被访问时
+才导入对应子模块（模块级 __getattr__）。
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# 公开名称 -> 所在子模块
+_LAZY_ATTRS = {
+    'BossConfig': '.config',
+    'BossCodeRegistry': '.code_tables',
+    'get_code_registry': '.code_tables',
+    'BossDistrictStore': '.district_store',
+    'BossAuth': '.auth',
+    'BossBrowser': '.browser',
+    'BossUrlBuilder': '.url_builder',
+    'BossDataProcessor': '.data_processor',
+    'JobRecord': '.job_record',
+    'BossJobSummary': '.summary',
+    'BossJobIndex': '.job_index',
+    'BossJobFilter': '.job_index',
+    'BossGeoIndex': '.geo_index',
+    'BossSqliteStore': '.sqlite_store',
+    'BossMongoStore': '.mongo_store',
+    'BossDedupeIndex': '.dedupe',
+    'BossCheckpointStore': '.checkpoint',
+    'BossJobStateStore': '.job_state',
+    'BossCrawlFrontier': '.frontier',
+    'BossQueryPartitioner': '.partitioner',
+    'BossApiClient': '.api_client',
+    'BossScraper': '.scraper',
+    'BossWorkerPool': '.worker_pool',
+    'BossRateScheduler': '.rate_limiter',
+    'get_rate_scheduler': '.rate_limiter',
+    'AsyncBossScraper': '.async_scraper',
+    'BossJobScraper': '.boss_scraper',
+    'search_boss_jobs': '.boss_scraper',
+    'test_scraper': '.boss_scraper',
+    'BossScraperService': '.service',
+    'BossServiceServer': '.service',
+}
+
+if TYPE_CHECKING:
+    from .config import BossConfig
+    from .code_tables import BossCodeRegistry, get_code_registry
+    from .district_store import BossDistrictStore
+    from .auth import BossAuth
+    from .browser import BossBrowser
+    from .url_builder import BossUrlBuilder
+    from .data_processor import BossDataProcessor
+    from .job_record import JobRecord
+    from .summary import BossJobSummary
+    from .job_index import BossJobFilter, BossJobIndex
+    from .geo_index import BossGeoIndex
+    from .sqlite_store import BossSqliteStore
+    from .mongo_store import BossMongoStore
+    from .dedupe import BossDedupeIndex
+    from .checkpoint import BossCheckpointStore
+    from .job_state import BossJobStateStore
+    from .frontier import BossCrawlFrontier
+    from .partitioner import BossQueryPartitioner
+    from .api_client import BossApiClient
+    from .scraper import BossScraper
+    from .worker_pool import BossWorkerPool
+    from .rate_limiter import BossRateScheduler, get_rate_scheduler
+    from .async_scraper import AsyncBossScraper
+    from .boss_scraper import BossJobScraper, search_boss_jobs, test_scraper
+    from .service import BossScraperService, BossServiceServer
+
+
+def __getattr__(name):
+    """第一次访问时导入组件并缓存到模块命名空间"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     'BossConfig',
+    'BossCodeRegistry',
+    'get_code_registry',
+    'BossDistrictStore',
     'BossAuth', 
     'BossBrowser',
     'BossUrlBuilder',
     'BossDataProcessor',
+    'JobRecord',
+    'BossJobSummary',
+    'BossJobIndex',
+    'BossJobFilter',
+    'BossGeoIndex',
+    'BossSqliteStore',
+    'BossMongoStore',
+    'BossDedupeIndex',
+    'BossCheckpointStore',
+    'BossJobStateStore',
+    'BossCrawlFrontier',
+    'BossQueryPartitioner',
+    'BossApiClient',
     'BossScraper',
+    'BossWorkerPool',
+    'BossRateScheduler',
+    'get_rate_scheduler',
+    'AsyncBossScraper',
     'BossJobScraper',
     'search_boss_jobs',
+    'BossScraperService',
+    'BossServiceServer',
     'test_scraper'
 ]
 
-__version__ = '2.0.0'
\ No newline at end of file
+__version__ = '2.0.0'
@@ -0,0 +1,125 @@
+import random
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, Optional
+from .config import BossConfig
+from .url_builder import BossUrlBuilder
+
+
+class BossApiClient:
+    """Boss直聘接口直连模块
+
+    复用浏览器登录后的cookies，通过保持连接的HTTP会话直接请求
+    joblist.json，无需渲染页面。
+    """
+
+    def __init__(self, config: Optional[BossConfig] = None,
+                 url_builder: Optional[BossUrlBuilder] = None):
+        """
+        初始化接口客户端
+
+        Args:
+            config: 配置管理器实例
+            url_builder: URL构建器实例
+        """
+        self.config = config or BossConfig()
+        self.url_builder = url_builder or BossUrlBuilder(self.config)
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """创建带连接池的HTTP会话"""
+        session = requests.Session()
+
+        pool_size = self.config.get_limit("api_pool_size")
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        session.headers.update({
+            "User-Agent": random.choice(self.config.user_agents),
+            "Accept": "application/json, text/plain, */*",
+            "Accept-Language": "zh-CN,zh;q=0.9",
+            "Referer": self.config.base_url,
+            "Connection": "keep-alive",
+        })
+        return session
+
+    def load_cookies(self, cookies: List[Dict]) -> int:
+        """
+        加载cookies到HTTP会话
+
+        Args:
+            cookies: cookies列表，格式同 BossAuth.get_current_cookies
+
+        Returns:
+            int: 成功加载的cookie数量
+        """
+        loaded = 0
+        for cookie in cookies:
+            if "name" not in cookie or "value" not in cookie:
+                continue
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ".zhipin.com"),
+                path=cookie.get("path", "/"),
+            )
+            loaded += 1
+        return loaded
+
+    def load_cookie_string(self, cookie_string: str) -> int:
+        """
+        从cookie字符串加载cookies
+
+        Args:
+            cookie_string: cookie字符串，格式: "name1=value1; name2=value2; ..."
+
+        Returns:
+            int: 成功加载的cookie数量
+        """
+        cookies = []
+        for item in cookie_string.split(";"):
+            item = item.strip()
+            if "=" in item:
+                name, value = item.split("=", 1)
+                cookies.append({"name": name.strip(), "value": value.strip()})
+        return self.load_cookies(cookies)
+
+    @property
+    def has_cookies(self) -> bool:
+        """会话中是否已有cookies"""
+        return len(self.session.cookies) > 0
+
+    def fetch_job_list(self, search_params: Dict) -> Dict:
+        """
+        直接请求职位列表接口
+
+        Args:
+            search_params: 搜索参数
+
+        Returns:
+            Dict: 接口原始JSON响应
+
+        Raises:
+            requests.RequestException: 网络错误或HTTP状态异常
+            ValueError: 响应不是合法JSON
+        """
+        api_url = self.url_builder.build_api_url(search_params)
+        response = self.session.get(api_url, timeout=self.config.get_timeout("api_request"))
+        response.raise_for_status()
+        return response.json()
+
+    def close(self) -> None:
+        """关闭HTTP会话"""
+        try:
+            self.session.close()
+        except Exception as e:
+            print(f"关闭HTTP会话时出错: {e}")
+
+    def __enter__(self):
+        """上下文管理器入口"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """上下文管理器出口"""
+        self.close()
@@ -0,0 +1,417 @@
+import time
+import random
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set
+from .checkpoint import BossCheckpointStore
+from .config import BossConfig
+from .dedupe import BossDedupeIndex
+from .scraper import BossScraper
+
+
+class AsyncBossScraper:
+    """Boss直聘异步爬虫模块
+
+    在 BossScraper 之上提供协程接口：延时使用 asyncio.sleep，DrissionPage 的阻塞调用
+    放到有界线程池执行，多个搜索可以在同一个事件循环中并发、取消和单独设置超时。
+    每个并发搜索独占一个标签页，标签页数量即最大并发数。线程中的调用无法中断，
+    搜索被取消或超时后，标签页要等其上的调用真正结束（并停止监听）后才归还。
+    """
+
+    def __init__(self, config: Optional[BossConfig] = None,
+                 max_concurrency: Optional[int] = None,
+                 scraper: Optional[BossScraper] = None):
+        """
+        初始化异步爬虫
+
+        Args:
+            config: 配置管理器实例
+            max_concurrency: 最大并发搜索数（标签页数与线程池大小），为空则使用配置
+            scraper: 复用的同步爬虫实例，为空则新建
+        """
+        self.scraper = scraper or BossScraper(config)
+        self.config = self.scraper.config
+        self.max_concurrency = max_concurrency or self.config.get_limit("workers")
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="boss-async"
+        )
+        self._tabs: Optional[asyncio.Queue] = None
+        self._extra_tabs: List = []
+        # 每个标签页最近一次在线程中执行的调用，以及正在归还的标签页
+        self._tab_calls: Dict[int, asyncio.Future] = {}
+        self._releasing: Set[asyncio.Task] = set()
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """在有界线程池中执行阻塞调用"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _run_on_tab(self, tab, func: Callable, *args, **kwargs) -> Any:
+        """
+        在线程池中执行标签页上的阻塞调用
+
+        协程被取消时线程中的调用仍会执行完，这里用 shield 保留其 future，
+        归还标签页时据此等待调用真正结束。
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+        self._tab_calls[id(tab)] = future
+        return await asyncio.shield(future)
+
+    async def _sleep(self, delay_type: str) -> None:
+        """非阻塞随机延时"""
+        await asyncio.sleep(random.uniform(*self.config.get_delay(delay_type)))
+
+    async def _pace(self) -> float:
+        """向共享的请求调度器申请许可（非阻塞等待）"""
+        wait = self.scraper.rate_scheduler.reserve(self.scraper.host, self.scraper.session_id)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    @staticmethod
+    async def _with_timeout(coro, timeout: Optional[float]) -> Dict:
+        """为协程加上超时，超时返回失败结果"""
+        try:
+            return await asyncio.wait_for(coro, timeout)
+        except asyncio.TimeoutError:
+            return {"success": False, "message": f"搜索超时（{timeout}秒）"}
+
+    async def initialize(self, **auth_params) -> bool:
+        """
+        初始化爬虫（启动浏览器、认证）并创建标签页池
+
+        Args:
+            **auth_params: 认证参数，同 BossScraper.initialize
+
+        Returns:
+            bool: 是否成功初始化
+        """
+        if not await self._run(self.scraper.initialize, **auth_params):
+            return False
+
+        self._tabs = asyncio.Queue()
+        self._tabs.put_nowait(self.scraper.page)
+
+        for _ in range(self.max_concurrency - 1):
+            try:
+                tab = await self._run(self.scraper.browser.browser.new_tab)
+            except Exception as e:
+                print(f"创建标签页失败: {e}")
+                break
+            self._extra_tabs.append(tab)
+            self._tabs.put_nowait(tab)
+
+        print(f"✅ 异步爬虫就绪: {self._tabs.qsize()} 个标签页")
+        return True
+
+    async def _acquire_tab(self):
+        """获取空闲标签页"""
+        if self._tabs is None:
+            raise RuntimeError("爬虫未初始化，请先调用 initialize() 方法")
+        return await self._tabs.get()
+
+    def _release_tab(self, tab) -> None:
+        """归还标签页（后台完成：等待标签页上的调用结束、停止监听后放回池中）"""
+        task = asyncio.ensure_future(self._recycle_tab(tab))
+        self._releasing.add(task)
+        task.add_done_callback(self._releasing.discard)
+
+    async def _recycle_tab(self, tab) -> None:
+        """等待标签页上仍在线程中执行的调用结束，停止数据包监听后放回池中"""
+        pending = self._tab_calls.pop(id(tab), None)
+        if pending is not None:
+            await asyncio.wait([pending])
+            if not pending.cancelled():
+                pending.exception()  # 已被取消的搜索不再关心结果，避免未读取异常的警告
+        try:
+            await self._run(tab.listen.stop)
+        except Exception:
+            pass
+        if self._tabs is not None:
+            self._tabs.put_nowait(tab)
+
+    async def search_jobs(self, search_params: Dict, fetch_mode: Optional[str] = None,
+                          timeout: Optional[float] = None, max_age: Optional[float] = None) -> Dict:
+        """
+        搜索职位（单页）
+
+        Args:
+            search_params: 搜索参数
+            fetch_mode: 抓取方式 "browser" 或 "api"，为空则使用配置
+            timeout: 超时时间（秒）
+            max_age: 可接受的缓存时长（秒），为空则使用缓存TTL，0表示强制刷新
+
+        Returns:
+            Dict: 搜索结果
+        """
+        return await self._with_timeout(self._search_jobs(search_params, fetch_mode, max_age), timeout)
+
+    async def _search_jobs(self, search_params: Dict, fetch_mode: Optional[str] = None,
+                           max_age: Optional[float] = None) -> Dict:
+        """单页搜索实现"""
+        if not self.scraper._check_initialized():
+            return {"success": False, "message": "爬虫未初始化"}
+
+        is_valid, error_msg = self.scraper.url_builder.validate_search_params(search_params)
+        if not is_valid:
+            return {"success": False, "message": f"参数验证失败: {error_msg}"}
+
+        cached = await self._run(self.scraper._get_cached_result, search_params, max_age)
+        if cached:
+            return cached
+
+        if (fetch_mode or self.config.fetch_mode) == "api":
+            result = await self._run(self.scraper._search_jobs_via_api, search_params)
+            if result["success"]:
+                await self._run(self.scraper._store_cached_result, search_params, result)
+                return result
+            print(f"接口直连失败，回退到浏览器: {result['message']}")
+
+        # 浏览器捕获的总是搜索页第1页的数据包，不写入按页码生成键的缓存
+        tab = await self._acquire_tab()
+        try:
+            return await self._search_jobs_via_browser(search_params, tab)
+        finally:
+            self._release_tab(tab)
+
+    async def _search_jobs_via_browser(self, search_params: Dict, tab) -> Dict:
+        """通过浏览器标签页搜索职位：收到匹配的数据包即返回，节奏由共享的请求调度器控制"""
+        if self.config.get_capture_option("mode") == "sleep":
+            return await self._search_jobs_via_browser_sleep(search_params, tab)
+
+        timings = {}
+        try:
+            timings["rate_wait"] = await self._pace()
+
+            await self._run_on_tab(tab, tab.listen.start, "joblist.json")
+
+            web_url = self.scraper.url_builder.build_web_url(search_params)
+            print(f"访问搜索页面: {web_url}")
+            capture_deadline = self.config.get_capture_option("deadline")
+            start = time.perf_counter()
+            deadline = start + capture_deadline
+            await self._run_on_tab(tab, tab.get, web_url, timeout=capture_deadline)
+            timings["navigate"] = time.perf_counter() - start
+
+            result = await self._run_on_tab(
+                tab, self.scraper._wait_for_job_list, tab, start, deadline, timings
+            )
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            result = {"success": False, "message": f"搜索失败: {str(e)}"}
+
+        result["timings"] = timings
+        return result
+
+    async def _search_jobs_via_browser_sleep(self, search_params: Dict, tab) -> Dict:
+        """旧版抓取方式：导航后固定等待 page_load，再等待数据包"""
+        try:
+            await self._run_on_tab(tab, tab.listen.start, "joblist.json")
+
+            web_url = self.scraper.url_builder.build_web_url(search_params)
+            print(f"访问搜索页面: {web_url}")
+            await self._pace()
+            await self._run_on_tab(tab, tab.get, web_url)
+            await self._sleep("page_load")
+
+            packets = await self._run_on_tab(tab, tab.listen.wait, timeout=self.config.get_timeout("packet_wait"))
+            if not packets:
+                return {"success": False, "message": "未监听到API响应数据"}
+
+            return await self._run(self.scraper._process_search_response, packets)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return {"success": False, "message": f"搜索失败: {str(e)}"}
+
+    async def batch_search(self, search_params: Dict, max_pages: Optional[int] = None,
+                           dedupe_index: Optional[BossDedupeIndex] = None,
+                           timeout: Optional[float] = None, max_age: Optional[float] = None,
+                           resume: bool = False, save: bool = True, delta: Optional[bool] = None) -> Dict:
+        """
+        批量搜索多页职位（与 BossScraper.batch_search 共用逐页处理：断点、增量抓取、按总数提前停止）
+
+        Args:
+            search_params: 搜索参数
+            max_pages: 最大页数
+            dedupe_index: 去重索引，为空则为本次批量搜索新建
+            timeout: 整体超时时间（秒）
+            max_age: 可接受的缓存时长（秒），为空则使用缓存TTL，0表示强制刷新
+            resume: 是否从上次相同参数的断点继续（跳过已完成的页），并为本次运行记录断点
+            save: 是否保存本次结果
+            delta: 是否增量抓取，为空则使用配置
+
+        Returns:
+            Dict: 搜索结果
+        """
+        return await self._with_timeout(
+            self._batch_search(search_params, max_pages, dedupe_index, max_age, resume, save, delta), timeout
+        )
+
+    async def _batch_search(self, search_params: Dict, max_pages: Optional[int],
+                            dedupe_index: Optional[BossDedupeIndex],
+                            max_age: Optional[float] = None, resume: bool = False,
+                            save: bool = True, delta: Optional[bool] = None) -> Dict:
+        """批量搜索实现：请求在事件循环中并发等待，断点、提取和保存（会写 SQLite 和输出目标）在线程池中执行"""
+        scraper = self.scraper
+        if max_pages is None:
+            max_pages = self.config.get_limit("max_pages")
+        if dedupe_index is None:
+            dedupe_index = BossDedupeIndex()
+        if delta is None:
+            delta = bool(self.config.get_delta_option("enabled"))
+
+        run_key, state = await self._run(scraper._open_checkpoint, search_params,
+                                         BossCheckpointStore.KIND_BATCH, resume)
+        run = await self._run(scraper._start_batch_run, run_key, state, dedupe_index, save, delta)
+        page_timings = []
+
+        for page in scraper._pending_pages(run, max_pages):
+            search_params_copy = search_params.copy()
+            search_params_copy["page"] = page
+
+            result = await self._search_jobs(search_params_copy, max_age=max_age)
+            if result.get("timings"):
+                page_timings.append({"page": page, **result["timings"]})
+            if not result["success"]:
+                run["error"] = result["message"]
+                print(f"第{page}页搜索失败: {run['error']}")
+                break
+
+            data = result["data"]
+            if not await self._run(scraper._process_batch_page, run, page, data.get("jobList", []),
+                                   data.get("hasMore", False), data.get("totalCount", 0)):
+                break
+
+        return await self._run(scraper._finish_batch_run, run, page_timings=page_timings)
+
+    async def search_jobs_with_scrolling(self, search_params: Dict,
+                                         max_scroll_times: Optional[int] = None,
+                                         dedupe_index: Optional[BossDedupeIndex] = None,
+                                         timeout: Optional[float] = None) -> Dict:
+        """
+        通过自动滚动页面获取更多职位数据（异步模式不支持手动滚动）
+
+        Args:
+            search_params: 搜索参数
+            max_scroll_times: 最大滚动次数
+            dedupe_index: 去重索引，为空则为本次会话新建
+            timeout: 整体超时时间（秒）
+
+        Returns:
+            Dict: 搜索结果
+        """
+        return await self._with_timeout(
+            self._search_jobs_with_scrolling(search_params, max_scroll_times, dedupe_index), timeout
+        )
+
+    async def _search_jobs_with_scrolling(self, search_params: Dict,
+                                          max_scroll_times: Optional[int],
+                                          dedupe_index: Optional[BossDedupeIndex]) -> Dict:
+        """滚动搜索实现"""
+        if not self.scraper._check_initialized():
+            return {"success": False, "message": "爬虫未初始化"}
+
+        if max_scroll_times is None:
+            max_scroll_times = self.config.get_limit("max_scroll_times")
+        if dedupe_index is None:
+            dedupe_index = BossDedupeIndex()
+
+        is_valid, error_msg = self.scraper.url_builder.validate_search_params(search_params)
+        if not is_valid:
+            return {"success": False, "message": f"参数验证失败: {error_msg}"}
+
+        processor = self.scraper.data_processor
+        all_jobs = []
+        collected_packets = []
+
+        tab = await self._acquire_tab()
+        try:
+            await self._run_on_tab(tab, tab.listen.start, "joblist.json")
+
+            web_url = self.scraper.url_builder.build_web_url(search_params)
+            print(f"访问搜索页面: {web_url}")
+            await self._pace()
+            await self._run_on_tab(tab, tab.get, web_url)
+            if self.config.get_capture_option("mode") == "sleep":
+                await self._sleep("page_load")
+
+            packets = await self._run_on_tab(tab, tab.listen.wait, timeout=self.config.get_timeout("packet_wait"))
+            if packets:
+                new_count = await self._run(
+                    processor.process_packets, packets, collected_packets, all_jobs, dedupe_index
+                )
+                print(f"初始数据: 获得 {new_count} 个职位")
+
+            job_list = await self._run_on_tab(tab, tab.ele, ".rec-job-list",
+                                              timeout=self.config.get_timeout("element_wait"))
+            if not job_list:
+                print("未找到职位列表元素 .rec-job-list")
+            else:
+                for i in range(max_scroll_times):
+                    print(f"第 {i+1} 次滚动...")
+                    await self._pace()
+                    await self._run_on_tab(tab, tab.scroll.to_bottom)
+
+                    packets = await self._run_on_tab(
+                        tab, tab.listen.wait, timeout=self.config.get_timeout("packet_wait_scroll")
+                    )
+                    if not packets:
+                        print("未监听到新数据包")
+                        continue
+
+                    new_count = await self._run(
+                        processor.process_packets, packets, collected_packets, all_jobs, dedupe_index
+                    )
+                    if new_count > 0:
+                        print(f"收集到 {new_count} 个新职位，总计: {len(all_jobs)}")
+                    else:
+                        print("未收集到新职位，可能已到底部")
+                        break
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return {"success": False, "message": f"滚动搜索失败: {str(e)}"}
+        finally:
+            self._release_tab(tab)
+
+        if all_jobs:
+            await self._run(processor.save_jobs_data, all_jobs)
+            print(f"✅ 滚动搜索完成！共获得 {len(all_jobs)} 个职位")
+
+        return {
+            "success": True,
+            "jobs": all_jobs,
+            "total_jobs": len(all_jobs),
+            "packets_processed": len(collected_packets),
+        }
+
+    async def close(self) -> None:
+        """关闭额外标签页、浏览器和线程池（先等待被取消的搜索在线程中的调用结束）"""
+        if self._releasing:
+            await asyncio.gather(*self._releasing, return_exceptions=True)
+        for tab in self._extra_tabs:
+            try:
+                await self._run(tab.close)
+            except Exception as e:
+                print(f"关闭标签页时出错: {e}")
+        self._extra_tabs = []
+        self._tabs = None
+
+        await self._run(self.scraper.close)
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        """异步上下文管理器入口"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """异步上下文管理器出口"""
+        await self.close()
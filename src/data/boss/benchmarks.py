@@ -0,0 +1,1386 @@
+"""
+Boss直聘爬虫性能基准
+
+不依赖浏览器和网络，使用构造数据测量各模块的热点路径。
+运行方式（项目根目录下）：
+
+    python -m src.data.boss.benchmarks
+"""
+
+import gc
+import os
+import sys
+import re
+import json
+import math
+import time
+import random
+import subprocess
+import tracemalloc
+import tempfile
+from types import SimpleNamespace
+from typing import Dict, List
+
+from .api_client import BossApiClient
+from .checkpoint import BossCheckpointStore
+from .code_tables import BossCodeRegistry
+from .columnar_export import BossColumnarExporter, read_columnar_jobs
+from .config import BossConfig
+from .data_processor import BossDataProcessor
+from .dedupe import BossDedupeIndex
+from .district_store import BossDistrictStore
+from .frontier import BossCrawlFrontier
+from .geo_index import BossGeoIndex, haversine_km
+from .job_record import JobRecord, job_to_json
+from .mongo_store import BossMongoStore
+from .partitioner import BossQueryPartitioner
+from .rate_limiter import BossRateScheduler
+from .salary import parse_salary
+from .stub_server import BossStubServer
+from .sqlite_store import BossSqliteStore
+from .summary import BossJobSummary
+from .url_builder import BossUrlBuilder
+
+
+_CITIES = ["上海", "北京", "深圳", "杭州", "广州", "成都"]
+_DEGREES = ["本科", "硕士", "大专", "学历不限"]
+_EXPERIENCES = ["1-3年", "3-5年", "5-10年", "经验不限"]
+_SCALES = ["0-20人", "20-99人", "100-499人", "500-999人", "1000-9999人", "10000人以上"]
+_INDUSTRIES = ["互联网", "计算机软件", "电子商务", "人工智能", "金融"]
+_SALARIES = ["10-15K", "15-25K·14薪", "20-40K", "150-200元/天", "8-12K·13薪"]
+_SKILLS = ["Python", "Django", "MySQL", "Redis", "Docker", "Linux", "Go", "Kafka"]
+
+
+def _make_raw_job(index: int) -> Dict:
+    """构造一条原始职位数据"""
+    return {
+        "encryptJobId": f"job{index:08d}",
+        "jobName": f"Python开发{index % 50}",
+        "salaryDesc": _SALARIES[index % len(_SALARIES)],
+        "jobLabels": [_EXPERIENCES[index % 4], _DEGREES[index % 4]],
+        "skills": _SKILLS[index % 5:index % 5 + 3],
+        "jobExperience": _EXPERIENCES[index % 4],
+        "jobDegree": _DEGREES[index % 4],
+        "cityName": _CITIES[index % len(_CITIES)],
+        "areaDistrict": "浦东新区",
+        "businessDistrict": "张江",
+        "brandName": f"公司{index % 500}",
+        "brandScaleName": _SCALES[index % len(_SCALES)],
+        "brandIndustry": _INDUSTRIES[index % len(_INDUSTRIES)],
+        "welfareList": ["五险一金", "带薪年假"],
+        "encryptBrandId": f"brand{index % 500:05d}",
+        "jobType": 0,
+        "jobValidStatus": 1,
+        "gps": {"longitude": 121.0 + (index % 1000) / 1000, "latitude": 31.0 + (index % 997) / 1000},
+    }
+
+
+def _make_jobs(total_jobs: int) -> List[Dict]:
+    """构造标准化职位列表"""
+    processor = BossDataProcessor(BossConfig())
+    return processor.extract_job_list([_make_raw_job(i) for i in range(total_jobs)])
+
+
+def _make_packet(page: int, page_size: int = 15) -> SimpleNamespace:
+    """构造一个模拟的 joblist.json 数据包"""
+    start = (page - 1) * page_size
+    body = {
+        "code": 0,
+        "zpData": {
+            "hasMore": True,
+            "jobList": [_make_raw_job(start + i) for i in range(page_size)],
+        },
+    }
+    return SimpleNamespace(
+        url=f"https://www.zhipin.com/wapi/zpgeek/search/joblist.json?page={page}",
+        response=SimpleNamespace(body=body),
+    )
+
+
+def _run_packets(processor: BossDataProcessor, packets: List, use_index: bool,
+                 checkpoints: List[int]) -> Dict[int, float]:
+    """依次处理数据包，记录到达各检查点时单包平均耗时（微秒）"""
+    all_jobs = []
+    collected_packets = []
+    dedupe_index = BossDedupeIndex() if use_index else None
+    timings = {}
+    window_start = time.perf_counter()
+    window_packets = 0
+
+    for packet in packets:
+        processor.process_packets(packet, collected_packets, all_jobs, dedupe_index)
+        window_packets += 1
+
+        if checkpoints and len(all_jobs) >= checkpoints[0]:
+            elapsed = time.perf_counter() - window_start
+            timings[checkpoints.pop(0)] = elapsed / window_packets * 1e6
+            window_start = time.perf_counter()
+            window_packets = 0
+
+    return timings
+
+
+def benchmark_dedupe_index(total_jobs: int = 12000, page_size: int = 15) -> Dict:
+    """
+    去重索引基准：单个数据包的处理耗时应与已收集职位数无关
+
+    Args:
+        total_jobs: 模拟收集的职位总数
+        page_size: 每个数据包的职位数
+
+    Returns:
+        Dict: {"indexed": {职位数: 微秒/包}, "legacy": {...}}
+    """
+    print(f"=== 去重索引基准 ({total_jobs} 个职位) ===")
+
+    processor = BossDataProcessor(BossConfig())
+    pages = total_jobs // page_size
+    packets = [_make_packet(page, page_size) for page in range(1, pages + 1)]
+    checkpoints = [n for n in (1000, 2500, 5000, 7500, 10000, total_jobs) if n <= total_jobs]
+
+    results = {
+        "indexed": _run_packets(processor, packets, True, list(checkpoints)),
+        "legacy": _run_packets(processor, packets, False, list(checkpoints)),
+    }
+
+    print(f"{'职位数':>8} | {'会话索引(μs/包)':>16} | {'每次重建(μs/包)':>16}")
+    for checkpoint in checkpoints:
+        print(f"{checkpoint:>8} | {results['indexed'].get(checkpoint, 0):>16.1f} | "
+              f"{results['legacy'].get(checkpoint, 0):>16.1f}")
+
+    return results
+
+
+def benchmark_api_fetch(pages: int = 50) -> Dict:
+    """
+    接口直连基准：对本地桩服务逐页请求 joblist.json 并提取职位
+
+    Args:
+        pages: 请求页数
+
+    Returns:
+        Dict: 每页平均耗时（毫秒）与提取的职位数
+    """
+    print(f"=== 接口直连基准 ({pages} 页) ===")
+
+    with BossStubServer() as stub:
+        config = BossConfig()
+        config.update_scraper_config(api_base_url=stub.api_url)
+        processor = BossDataProcessor(config)
+
+        with BossApiClient(config) as client:
+            client.load_cookies([{"name": "wt2", "value": "benchmark"}])
+            jobs = []
+            start = time.perf_counter()
+            for page in range(1, pages + 1):
+                data = client.fetch_job_list({"query": "Python", "city": "上海", "page": page})
+                jobs.extend(processor.extract_job_list(data["zpData"]["jobList"]))
+            elapsed = time.perf_counter() - start
+
+    per_page_ms = elapsed / pages * 1000
+    print(f"每页耗时: {per_page_ms:.2f} ms，共提取 {len(jobs)} 个职位")
+    print(f"对比: 浏览器模式仅 page_load 等待就有 {config.get_delay('page_load')} 秒")
+
+    return {"per_page_ms": per_page_ms, "jobs": len(jobs)}
+
+
+def benchmark_columnar_export(total_jobs: int = 50000, batch_size: int = 5000) -> Dict:
+    """
+    列式导出基准：对比 save_jobs_data 的缩进JSON与 Parquet/Arrow 的文件大小和加载耗时
+
+    Args:
+        total_jobs: 职位数
+        batch_size: 列式写入批大小
+
+    Returns:
+        Dict: {格式: {"size_mb", "write_s", "load_s"}}
+    """
+    print(f"=== 列式导出基准 ({total_jobs} 个职位) ===")
+
+    jobs = _make_jobs(total_jobs)
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_path = os.path.join(tmp_dir, "jobs.json")
+        start = time.perf_counter()
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"total_jobs": len(jobs), "jobs": jobs}, f, ensure_ascii=False, indent=4, default=job_to_json)
+        write_s = time.perf_counter() - start
+        start = time.perf_counter()
+        with open(json_path, "r", encoding="utf-8") as f:
+            json.load(f)
+        results["json"] = {"size_mb": os.path.getsize(json_path) / 1e6, "write_s": write_s,
+                           "load_s": time.perf_counter() - start}
+
+        for file_format in ("parquet", "arrow"):
+            path = os.path.join(tmp_dir, f"jobs.{file_format}")
+            start = time.perf_counter()
+            with BossColumnarExporter(path, batch_size=batch_size) as exporter:
+                exporter.write_jobs(jobs)
+            write_s = time.perf_counter() - start
+            start = time.perf_counter()
+            read_columnar_jobs(path)
+            results[file_format] = {"size_mb": os.path.getsize(path) / 1e6, "write_s": write_s,
+                                    "load_s": time.perf_counter() - start}
+
+    print(f"{'格式':>8} | {'大小(MB)':>9} | {'写入(s)':>8} | {'加载(s)':>8}")
+    for name, stats in results.items():
+        print(f"{name:>8} | {stats['size_mb']:>9.2f} | {stats['write_s']:>8.3f} | {stats['load_s']:>8.3f}")
+
+    return results
+
+
+def _extract_dict(job: Dict) -> Dict:
+    """旧版提取方式：每个职位一个35键字典"""
+    return {
+        name: job.get(raw_key, [] if default is None else default)
+        for name, raw_key, default in JobRecord.FIELDS
+    }
+
+
+def _measure_retained(pages: List[bytes], extract) -> float:
+    """解析接口响应并提取职位，丢弃原始响应后统计职位占用的内存（MB）"""
+    gc.collect()
+    tracemalloc.start()
+    jobs = []
+    for page in pages:
+        jobs.extend(extract(job) for job in json.loads(page)["zpData"]["jobList"])
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del jobs
+    return retained / 1e6
+
+
+def benchmark_job_record_memory(total_jobs: int = 100000, page_size: int = 15) -> Dict:
+    """
+    职位内存基准：对比字典与 JobRecord 在整个会话中常驻的内存
+
+    Args:
+        total_jobs: 职位数
+        page_size: 每页职位数（按页反序列化，与真实接口响应一致）
+
+    Returns:
+        Dict: {"dict_mb", "record_mb", "saving"}
+    """
+    print(f"=== 职位内存基准 ({total_jobs} 个职位) ===")
+
+    pages = [
+        json.dumps({"zpData": {"jobList": [_make_raw_job(i) for i in range(start, min(start + page_size, total_jobs))]}},
+                   ensure_ascii=False).encode("utf-8")
+        for start in range(0, total_jobs, page_size)
+    ]
+
+    dict_mb = _measure_retained(pages, _extract_dict)
+    record_mb = _measure_retained(pages, JobRecord.from_raw)
+    saving = 1 - record_mb / dict_mb
+
+    print(f"字典:      {dict_mb:.1f} MB")
+    print(f"JobRecord: {record_mb:.1f} MB（节省 {saving:.0%}）")
+
+    return {"dict_mb": dict_mb, "record_mb": record_mb, "saving": saving}
+
+
+def _legacy_summary(jobs: List[Dict]) -> Dict:
+    """旧版汇总：每个分布各遍历一次"""
+    summary = {}
+    for key, field in BossJobSummary.DISTRIBUTIONS:
+        stats = {}
+        for job in jobs:
+            value = job.get(field, "未知")
+            stats[value] = stats.get(value, 0) + 1
+        summary[key] = dict(sorted(stats.items(), key=lambda x: x[1], reverse=True))
+    return summary
+
+
+def benchmark_summary(total_jobs: int = 100000, saves: int = 200) -> Dict:
+    """
+    汇总基准：单次全量汇总耗时，以及列表持续增长、每次保存都汇总时全量重算与增量更新的总耗时
+
+    Args:
+        total_jobs: 职位数
+        saves: 模拟保存次数（每次追加 total_jobs/saves 个职位后汇总一次）
+
+    Returns:
+        Dict: 各项耗时（秒）
+    """
+    print(f"=== 汇总基准 ({total_jobs} 个职位) ===")
+
+    jobs = _make_jobs(total_jobs)
+    results = {}
+
+    start = time.perf_counter()
+    _legacy_summary(jobs)
+    results["legacy_full"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    BossJobSummary.from_jobs(jobs).to_dict()
+    results["single_pass_full"] = time.perf_counter() - start
+
+    step = max(1, total_jobs // saves)
+    start = time.perf_counter()
+    for end in range(step, total_jobs + 1, step):
+        _legacy_summary(jobs[:end])
+    results["legacy_per_save"] = time.perf_counter() - start
+
+    summary = BossJobSummary()
+    start = time.perf_counter()
+    for end in range(step, total_jobs + 1, step):
+        summary.update(jobs[:end])
+        summary.to_dict()
+    results["incremental_per_save"] = time.perf_counter() - start
+
+    print(f"全量汇总: 旧版4次遍历(4个分布) {results['legacy_full']:.3f}s | "
+          f"按列汇总(含薪资/技能/行业/公司) {results['single_pass_full']:.3f}s")
+    print(f"{saves} 次保存: 每次重算 {results['legacy_per_save']:.2f}s | "
+          f"增量更新 {results['incremental_per_save']:.2f}s")
+
+    return results
+
+
+def benchmark_filter_jobs(total_jobs: int = 100000) -> Dict:
+    """
+    过滤基准：同一批职位用多组条件反复过滤，对比逐条扫描与索引查询
+
+    建索引是一次性开销，只有查询次数足够多时才比逐条扫描快。10万职位下6组条件约为
+    逐条扫描 0.8s，建索引 1.9s + 索引查询 0.3s，即每次查询节省约 0.08s，约23次查询后
+    建索引才划算；少量查询时应直接扫描。
+
+    Args:
+        total_jobs: 职位数
+
+    Returns:
+        Dict: {"scan_s", "index_build_s", "index_query_s", "break_even_queries"}
+    """
+    print(f"=== 职位过滤基准 ({total_jobs} 个职位) ===")
+
+    jobs = _make_jobs(total_jobs)
+    processor = BossDataProcessor(BossConfig())
+    filter_sets = [
+        {"keywords": "开发1"},
+        {"keywords": ["python开发4", "3年"], "cities": ["上海", "北京"]},
+        {"cities": "深圳", "scales": ["100-499人", "1000-9999人"]},
+        {"degrees": "硕士", "salary_range": (15, None)},
+        {"skills": ["redis", "go"], "experience_range": (3, 5)},
+        {"keywords": "python", "cities": "杭州", "degrees": ["本科", "硕士"]},
+    ]
+
+    start = time.perf_counter()
+    scanned = [processor.filter_jobs(jobs, filters) for filters in filter_sets]
+    scan_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = processor.build_job_index(jobs)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    queried = [processor.filter_jobs(jobs, filters, index=index) for filters in filter_sets]
+    query_s = time.perf_counter() - start
+
+    assert scanned == queried, "索引查询结果与逐条扫描不一致"
+
+    # 每次查询节省的时间抵消建索引开销所需的查询次数（索引查询不比扫描快时为空）
+    saved_per_query = (scan_s - query_s) / len(filter_sets)
+    break_even = math.ceil(build_s / saved_per_query) if saved_per_query > 0 else None
+
+    print(f"{len(filter_sets)} 组条件: 逐条扫描 {scan_s:.3f}s | "
+          f"建索引 {build_s:.3f}s + 索引查询 {query_s:.3f}s")
+    print(f"盈亏平衡: 约 {break_even} 次查询后建索引更快" if break_even else "盈亏平衡: 索引查询不比逐条扫描快")
+    for filters, result in zip(filter_sets, queried):
+        print(f"  {filters} -> {len(result)}")
+
+    return {"scan_s": scan_s, "index_build_s": build_s, "index_query_s": query_s,
+            "break_even_queries": break_even}
+
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# 导入本包时不应被加载的重量级模块
+_HEAVY_MODULES = ("DrissionPage", "requests", "pyarrow", "zstandard", "sqlite3", "asyncio")
+
+
+def _import_time_once(module: str) -> Dict:
+    """在新进程中用 -X importtime 导入一次，返回累计耗时与该包导入的各模块耗时（微秒）"""
+    check = f"import {module}; import sys, json; print(json.dumps([m for m in {_HEAVY_MODULES!r} if m in sys.modules]))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", check],
+        cwd=_PROJECT_ROOT, capture_output=True, text=True, check=True,
+    )
+
+    # 输出按完成顺序排列，目标模块的子树是它之前、上一个顶层导入之后的各行
+    block = {}
+    modules = {}
+    cumulative = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, raw_name = line.split(":", 1)[1].split("|")
+        name = raw_name.strip()
+        block[name] = {"self": int(self_us), "cumulative": int(cumulative_us)}
+
+        if len(raw_name) - len(raw_name.lstrip()) == 1:  # 顶层导入
+            if name == module:
+                modules, cumulative = block, int(cumulative_us)
+                break
+            block = {}
+
+    return {
+        "cumulative_us": cumulative,
+        "modules": modules,
+        "heavy": json.loads(proc.stdout.strip().splitlines()[-1]),
+    }
+
+
+def benchmark_import_time(module: str = "src.data.boss", runs: int = 5,
+                          budget_ms: float = 50, top: int = 10) -> Dict:
+    """
+    导入耗时基准：用 python -X importtime 测量导入包的耗时，超出预算或加载了重量级依赖时报告回归
+
+    Args:
+        module: 要导入的模块
+        runs: 运行次数（取中位数）
+        budget_ms: 耗时预算（毫秒）
+        top: 列出自身耗时最多的模块数
+
+    Returns:
+        Dict: {"median_ms", "budget_ms", "heavy_modules", "slowest", "regression"}
+    """
+    print(f"=== 导入耗时基准 (import {module}) ===")
+
+    samples = [_import_time_once(module) for _ in range(runs)]
+    samples.sort(key=lambda sample: sample["cumulative_us"])
+    median = samples[len(samples) // 2]
+    median_ms = median["cumulative_us"] / 1000
+
+    slowest = sorted(median["modules"].items(), key=lambda item: item[1]["self"], reverse=True)[:top]
+    heavy = median["heavy"]
+    regression = median_ms > budget_ms or bool(heavy)
+
+    print(f"累计耗时(中位数): {median_ms:.1f} ms（预算 {budget_ms:.0f} ms）")
+    print(f"已加载的重量级模块: {heavy or '无'}")
+    print("自身耗时最多的模块:")
+    for name, stats in slowest:
+        print(f"  {stats['self'] / 1000:>7.2f} ms  {name}")
+    print("❌ 导入耗时回归" if regression else "✅ 导入耗时正常")
+
+    return {
+        "median_ms": median_ms,
+        "budget_ms": budget_ms,
+        "heavy_modules": heavy,
+        "slowest": [(name, stats["self"]) for name, stats in slowest],
+        "regression": regression,
+    }
+
+
+def benchmark_code_tables(builders: int = 200, cold_runs: int = 20) -> Dict:
+    """
+    代码表基准：旧版每个实例重新解析JSON，与进程共享注册中心（JSON/快照冷启动）对比
+
+    Args:
+        builders: 模拟创建的 BossConfig + BossUrlBuilder 数量
+        cold_runs: 冷启动加载次数
+
+    Returns:
+        Dict: 各项耗时（毫秒）
+    """
+    print(f"=== 代码表基准 ({builders} 个URL构建器) ===")
+
+    registry = BossCodeRegistry()
+    files = [registry.path(name) for name in (registry.CITY_FILE, registry.CONDITION_FILE)]
+    params = {"query": "Python", "city": "上海", "degree": "本科", "experience": "1-3年"}
+    results = {}
+
+    start = time.perf_counter()
+    for _ in range(builders):
+        for path in files:
+            with open(path, "r", encoding="utf-8") as f:
+                json.load(f)
+    results["legacy_per_instance_ms"] = (time.perf_counter() - start) / builders * 1000
+
+    BossUrlBuilder(BossConfig()).build_web_url(params)
+    start = time.perf_counter()
+    for _ in range(builders):
+        BossUrlBuilder(BossConfig()).build_web_url(params)
+    results["shared_per_instance_ms"] = (time.perf_counter() - start) / builders * 1000
+
+    for use_snapshot in (False, True):
+        BossCodeRegistry(use_snapshot=use_snapshot).conditions()
+        start = time.perf_counter()
+        for _ in range(cold_runs):
+            cold = BossCodeRegistry(use_snapshot=use_snapshot)
+            cold.cities()
+            cold.districts()
+            cold.conditions()
+        key = "cold_snapshot_ms" if use_snapshot else "cold_json_ms"
+        results[key] = (time.perf_counter() - start) / cold_runs * 1000
+
+    print(f"每个实例: 旧版重新解析JSON {results['legacy_per_instance_ms']:.3f} ms | "
+          f"共享代码表(含构建URL) {results['shared_per_instance_ms']:.3f} ms")
+    print(f"进程冷启动加载: JSON {results['cold_json_ms']:.2f} ms | 快照 {results['cold_snapshot_ms']:.2f} ms")
+
+    return results
+
+
+def benchmark_district_lookup(cities: int = 20, urls: int = 2000) -> Dict:
+    """
+    商圈代码基准：预热若干城市后构建大量带商圈筛选的URL，统计下载次数和单次构建耗时
+    （旧版每构建一个URL都要下载城市代码表和商圈树各一次）
+
+    Args:
+        cities: 预热的城市数
+        urls: 构建的URL数
+
+    Returns:
+        Dict: 下载次数与耗时
+    """
+    print(f"=== 商圈代码基准 ({cities} 个城市, {urls} 个URL) ===")
+
+    config = BossConfig()
+    city_names = [name for name in config.city_codes if name != "全国"][:cities]
+    fetches = []
+
+    def fake_fetch(city_code):
+        fetches.append(city_code)
+        return {f"区{i}": int(city_code) * 100 + i for i in range(50)}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "district_code_map.json")
+        store = BossDistrictStore(path, fetcher=fake_fetch)
+        config.district_store = store
+
+        start = time.perf_counter()
+        store.warm_up(city_names, config.city_codes)
+        store.warm_up(city_names, config.city_codes)  # 未过期，不会再次下载
+        warm_up_s = time.perf_counter() - start
+
+        builder = BossUrlBuilder(config)
+        start = time.perf_counter()
+        for i in range(urls):
+            builder.build_web_url({"query": "Python", "city": city_names[i % len(city_names)], "district": f"区{i % 50}"})
+        build_ms = (time.perf_counter() - start) / urls * 1000
+
+        start = time.perf_counter()
+        reloaded = BossDistrictStore(path, fetcher=fake_fetch)
+        assert all(reloaded.get(name, "区0") is not None for name in city_names)
+        reload_ms = (time.perf_counter() - start) * 1000
+
+    results = {
+        "fetches": len(fetches),
+        "legacy_fetches": urls * 2,
+        "warm_up_s": warm_up_s,
+        "build_ms": build_ms,
+        "reload_ms": reload_ms,
+    }
+    print(f"下载次数: 旧版 {results['legacy_fetches']} 次 | 商圈代码库 {results['fetches']} 次（预热 {warm_up_s:.3f}s）")
+    print(f"每个URL构建 {build_ms:.4f} ms，重新载入 {cities} 个城市 {reload_ms:.2f} ms")
+
+    return results
+
+
+class _FakeCapturePage:
+    """模拟浏览器标签页：导航后经过随机延迟 joblist.json 数据包到达监听队列"""
+
+    def __init__(self, latency: tuple):
+        self.latency = latency
+        self.listen = self
+        self._ready_at = 0.0
+        self._page = 0
+
+    def start(self, target) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def get(self, url: str, timeout=None) -> None:
+        self._page += 1
+        self._ready_at = time.perf_counter() + random.uniform(*self.latency)
+
+    def wait(self, timeout=None):
+        delay = self._ready_at - time.perf_counter()
+        if timeout is not None and delay > timeout:
+            time.sleep(timeout)
+            return False
+        if delay > 0:
+            time.sleep(delay)
+        return _make_packet(self._page)
+
+
+def benchmark_packet_capture(pages: int = 20, latency: tuple = (0.05, 0.3),
+                             page_load: tuple = (0.3, 0.8)) -> Dict:
+    """
+    数据包捕获基准：旧版导航后固定等待 page_load 再取数据包，与收到数据包即返回的事件模式对比
+    （时间按比例缩小：真实 page_load 为 3-8 秒）
+
+    Args:
+        pages: 抓取页数
+        latency: 导航后数据包到达的延迟范围（秒）
+        page_load: 旧版固定等待范围（秒）
+
+    Returns:
+        Dict: 各模式每页平均耗时及事件模式各阶段耗时（秒）
+    """
+    print(f"=== 数据包捕获基准 ({pages} 页) ===")
+
+    from .scraper import BossScraper  # 需要 DrissionPage，只在用到的基准中导入
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 关闭归档后原始响应会写入 last_search_response.json，结果目录指向临时目录，不覆盖录制的响应
+        config = BossConfig()
+        config.get_result_dir = lambda: tmp_dir
+        config.scraper_config["delays"]["page_load"] = page_load
+        config.scraper_config["raw_archive"]["enabled"] = False
+        scraper = BossScraper(config)
+        scraper.rate_scheduler = BossRateScheduler(target_qps=0)
+        params = {"query": "Python", "city": "上海"}
+
+        for mode in ("sleep", "event"):
+            config.scraper_config["capture"]["mode"] = mode
+            page = _FakeCapturePage(latency)
+            timings = []
+            start = time.perf_counter()
+            for _ in range(pages):
+                result = scraper._search_jobs_via_browser(params, tab=page)
+                assert result["success"], result["message"]
+                timings.append(result["timings"])
+            results[f"{mode}_per_page_s"] = (time.perf_counter() - start) / pages
+
+    for stage in ("navigate", "packet", "parsed"):
+        results[f"event_{stage}_s"] = sum(t[stage] for t in timings) / pages
+
+    print(f"每页耗时: 固定等待 {results['sleep_per_page_s']:.3f}s | 事件模式 {results['event_per_page_s']:.3f}s")
+    print(f"事件模式各阶段(从导航开始): 导航 {results['event_navigate_s']:.3f}s | "
+          f"收到数据包 {results['event_packet_s']:.3f}s | 解析完成 {results['event_parsed_s']:.3f}s")
+
+    return results
+
+
+def benchmark_rate_scheduler(duration: float = 5.0, server_limit: float = 20.0,
+                             request_delay: tuple = (0.2, 0.5)) -> Dict:
+    """
+    请求调度基准：模拟每秒超过 server_limit 次请求就返回 code 37 的服务端，
+    对比旧版每次请求后固定随机等待与自适应调度器的吞吐量和受限次数
+    （时间按比例缩小：真实 request 等待为 2-5 秒）
+
+    Args:
+        duration: 每种方式运行的秒数
+        server_limit: 服务端允许的每秒请求数
+        request_delay: 旧版固定等待范围（秒）
+
+    Returns:
+        Dict: 各方式的吞吐量（次/秒）和受限次数
+    """
+    print(f"=== 请求调度基准 (服务端上限 {server_limit:.0f} 次/秒) ===")
+
+    # 模拟服务端的响应只在内存中构造，不读写录制的 last_search_response.json
+    limited_response = {"code": 37, "message": "您的访问行为异常"}
+    ok_response = {"code": 0, "message": "Success", "zpData": {"hasMore": True, "jobList": []}}
+
+    def server(recent: List[float]) -> Dict:
+        now = time.monotonic()
+        recent[:] = [t for t in recent if now - t < 1.0]
+        recent.append(now)
+        return limited_response if len(recent) > server_limit else ok_response
+
+    def run(pace, report) -> Dict:
+        recent: List[float] = []
+        ok = limited = 0
+        end = time.monotonic() + duration
+        while time.monotonic() < end:
+            pace()
+            is_limited = server(recent).get("code") == 37
+            limited += is_limited
+            ok += not is_limited
+            report(is_limited)
+        return {"throughput": ok / duration, "limited": limited}
+
+    results = {
+        "fixed_delay": run(lambda: time.sleep(random.uniform(*request_delay)), lambda _: None),
+    }
+
+    for name, target in (("scheduler", server_limit * 0.8), ("scheduler_over_budget", server_limit * 2)):
+        scheduler = BossRateScheduler(target_qps=target, burst=1, cooldown=0.2, recovery=0.5)
+
+        def report(is_limited, scheduler=scheduler):
+            if is_limited:
+                scheduler.report_limited("bench")
+            else:
+                scheduler.report_success("bench")
+
+        results[name] = run(lambda scheduler=scheduler: scheduler.acquire("bench"), report)
+        results[name]["target_qps"] = target
+
+    print(f"{'方式':<22} | {'成功(次/秒)':>11} | {'受限次数':>8}")
+    for name, result in results.items():
+        print(f"{name:<22} | {result['throughput']:>11.1f} | {result['limited']:>8}")
+
+    return results
+
+
+def benchmark_checkpoint(pages: int = 500, page_size: int = 15) -> Dict:
+    """
+    断点基准：每页写入断点的开销，以及中断后恢复（载入职位和已见ID）的耗时
+
+    Args:
+        pages: 页数
+        page_size: 每页职位数
+
+    Returns:
+        Dict: 每页写入耗时（毫秒）与恢复耗时（毫秒）
+    """
+    print(f"=== 断点基准 ({pages} 页 x {page_size} 个职位) ===")
+
+    jobs = _make_jobs(pages * page_size)
+    params = {"query": "Python", "city": "上海"}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = BossCheckpointStore(os.path.join(tmp_dir, "checkpoints.sqlite3"))
+        run_key = store.make_run_key(params)
+        store.start_run(run_key, params)
+
+        start = time.perf_counter()
+        for page in range(1, pages + 1):
+            store.complete_unit(run_key, page, jobs[(page - 1) * page_size:page * page_size])
+        write_ms = (time.perf_counter() - start) / pages * 1000
+
+        start = time.perf_counter()
+        state = store.start_run(run_key, params, resume=True)
+        restored = store.load_jobs(run_key)
+        dedupe_index = BossDedupeIndex(store.seen_job_ids(run_key))
+        resume_ms = (time.perf_counter() - start) * 1000
+        store.close()
+
+    assert len(state["completed_units"]) == pages and len(restored) == len(jobs) == len(dedupe_index)
+    print(f"每页写入断点 {write_ms:.3f} ms | 恢复 {len(restored)} 个职位 {resume_ms:.1f} ms")
+
+    return {"write_ms": write_ms, "resume_ms": resume_ms}
+
+
+class _FakeSweepScraper:
+    """模拟批量搜索：每页固定延迟，按比例随机返回未完成"""
+
+    def __init__(self, page_latency: float, failure_rate: float, seed: int):
+        self.page_latency = page_latency
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.pages = 0
+
+    def batch_search(self, search_params: Dict, max_pages: int, resume: bool = False) -> Dict:
+        total_count = self.random.randint(0, 150)
+        pages = min(max_pages, max(1, -(-total_count // 15)))
+        time.sleep(self.page_latency * pages)
+        self.pages += pages
+        if self.random.random() < self.failure_rate:
+            return {"success": True, "completed": False, "message": "访问受限"}
+        return {"success": True, "completed": True, "total_count": total_count,
+                "total_jobs": total_count, "pages_fetched": pages}
+
+
+def benchmark_frontier(queries: int = 10, workers: int = 4, max_pages: int = 10,
+                       page_latency: float = 0.002, failure_rate: float = 0.1) -> Dict:
+    """
+    任务队列基准：城市 x 经验 x 关键词组合由多个爬虫共同消费，对比外部脚本串行循环
+
+    Args:
+        queries: 关键词数
+        workers: 爬虫（工作线程）数
+        max_pages: 每个组合最大页数
+        page_latency: 模拟每页耗时（秒）
+        failure_rate: 单元失败率（失败后重试）
+
+    Returns:
+        Dict: 串行与队列耗时、每个单元的队列开销（毫秒）与重试数
+    """
+    spec = {
+        "query": [f"关键词{i}" for i in range(queries)],
+        "city": _CITIES,
+        "experience": _EXPERIENCES,
+    }
+    combos = BossCrawlFrontier.expand_sweep(spec)
+    print(f"=== 任务队列基准 ({len(combos)} 个组合, {workers} 个爬虫) ===")
+
+    url_builder = BossUrlBuilder(BossConfig())
+
+    # 外部脚本：逐个组合调用，失败的组合不重试
+    scraper = _FakeSweepScraper(page_latency, failure_rate, seed=0)
+    start = time.perf_counter()
+    loop_failed = 0
+    for params in combos:
+        result = scraper.batch_search(url_builder.parse_search_params(**params), max_pages)
+        loop_failed += not result["completed"]
+    loop_elapsed = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        frontier = BossCrawlFrontier(os.path.join(tmp_dir, "frontier.sqlite3"),
+                                     max_attempts=5, backoff=0, url_builder=url_builder)
+        start = time.perf_counter()
+        added = frontier.add_sweep(spec, max_pages=max_pages)
+        # 重复提交同一组合不会重复入队
+        added += frontier.add_sweep({"query": spec["query"][0], "city": _CITIES, "experience": _EXPERIENCES[0]})
+        enqueue_ms = (time.perf_counter() - start) * 1000
+
+        scrapers = [_FakeSweepScraper(page_latency, failure_rate, seed=i + 1) for i in range(workers)]
+        stats = frontier.run(scrapers, max_pages)
+        queue_stats = frontier.get_stats()
+
+        # 队列本身的开销：取出并完成空单元
+        frontier.add_sweep({"query": [f"空{i}" for i in range(500)]})
+        start = time.perf_counter()
+        unit = frontier.claim()
+        while unit is not None:
+            frontier.complete(unit["unit_key"], {})
+            unit = frontier.claim()
+        overhead_ms = (time.perf_counter() - start) / 500 * 1000
+        frontier.close()
+
+    assert added == len(combos) and queue_stats["done"] + queue_stats["failed"] == len(combos)
+    print(f"串行循环: {loop_elapsed:.2f} 秒，{loop_failed} 个组合失败未重试")
+    print(f"任务队列: {stats['elapsed']:.2f} 秒，重试 {stats['retried']} 次，最终失败 {stats['failed']} 个 "
+          f"(入队 {enqueue_ms:.1f} ms，每个单元调度开销 {overhead_ms:.3f} ms)")
+
+    return {
+        "loop_seconds": loop_elapsed,
+        "frontier_seconds": stats["elapsed"],
+        "overhead_ms": overhead_ms,
+        "retried": stats["retried"],
+    }
+
+
+class _FakeFacetSearch:
+    """模拟搜索接口：按筛选条件过滤构造的职位，翻页最多 max_pages 页"""
+
+    def __init__(self, total_jobs: int, max_pages: int, page_size: int, seed: int = 0):
+        conditions = BossCodeRegistry().conditions()[1]
+        self.facets = {
+            facet: [name for name, code in conditions[facet].items() if code]
+            for facet in ("salary", "experience", "degree", "scale", "stage")
+        }
+        rng = random.Random(seed)
+        # 职位集中在少数取值上，使部分分区需要继续拆分
+        self.jobs = [
+            (_make_raw_job(i), {facet: rng.choice(values[:3] * 4 + values) for facet, values in self.facets.items()})
+            for i in range(total_jobs)
+        ]
+        self.max_pages = max_pages
+        self.page_size = page_size
+        self.requests = 0
+
+    def __call__(self, search_params: Dict, max_age=None) -> Dict:
+        self.requests += 1
+        matched = [
+            job for job, attrs in self.jobs
+            if all(attrs[facet] == search_params[facet] for facet in self.facets if search_params.get(facet))
+        ]
+        page = search_params.get("page", 1)
+        visible = matched[:self.max_pages * self.page_size]
+        job_list = visible[(page - 1) * self.page_size:page * self.page_size]
+        return {"success": True, "data": {
+            "jobList": job_list,
+            "totalCount": len(matched),
+            "hasMore": page * self.page_size < len(visible),
+        }}
+
+
+def benchmark_partitioner(total_jobs: int = 5000, max_pages: int = 10, page_size: int = 15) -> Dict:
+    """
+    查询拆分基准：总数远超翻页上限的查询，对比直接翻页与自动拆分的覆盖率和请求数
+
+    Args:
+        total_jobs: 查询匹配的职位总数
+        max_pages: 接口翻页上限
+        page_size: 每页职位数
+
+    Returns:
+        Dict: 两种方式的覆盖率和请求数
+    """
+    print(f"=== 查询拆分基准 ({total_jobs} 个职位, 翻页上限 {max_pages} 页) ===")
+
+    from .scraper import BossScraper
+
+    config = BossConfig()
+    config.update_scraper_config(checkpoint={"enabled": False, "path": None})
+    scraper = BossScraper(config)
+    scraper._check_initialized = lambda: True
+    scraper.data_processor.save_jobs_data = lambda jobs, *args, **kwargs: None  # 基准不写文件
+    fake_search = _FakeFacetSearch(total_jobs, max_pages, page_size)
+    scraper.search_jobs = fake_search
+    params = {"query": "Python", "city": "上海", "page_size": page_size}
+
+    result = scraper.batch_search(params, max_pages)
+    direct = {"coverage": result["total_jobs"] / total_jobs, "requests": fake_search.requests}
+
+    fake_search.requests = 0
+    partitioner = BossQueryPartitioner(
+        scraper, max_results=max_pages * page_size, facets=("salary", "experience", "degree", "scale", "stage")
+    )
+    start = time.perf_counter()
+    result = partitioner.search(params, max_pages)
+    elapsed = time.perf_counter() - start
+    partitioned = {"coverage": result["coverage"], "requests": fake_search.requests}
+    assert fake_search.requests == result["requests"]
+    assert len({job.job_id for job in result["jobs"]}) == result["total_jobs"]
+
+    print(f"直接翻页: 覆盖率 {direct['coverage']:.1%}，{direct['requests']} 次请求")
+    print(f"自动拆分: 覆盖率 {partitioned['coverage']:.1%}，{partitioned['requests']} 次请求 "
+          f"({len(result['partitions'])} 个分区，探测 {result['probes']} 次，"
+          f"每次请求 {result['total_jobs'] / partitioned['requests']:.1f} 个职位，耗时 {elapsed:.2f} 秒)")
+
+    return {"direct": direct, "partitioned": partitioned}
+
+
+def benchmark_geo_index(total_jobs: int = 100000, queries: int = 200, radius_km: float = 3.0) -> Dict:
+    """
+    坐标索引基准：上海范围内随机分布的职位，半径和矩形查询对比逐条计算距离
+
+    Args:
+        total_jobs: 职位数
+        queries: 查询次数
+        radius_km: 半径（公里）
+
+    Returns:
+        Dict: 建索引耗时（毫秒）与每次查询耗时（毫秒）
+    """
+    print(f"=== 坐标索引基准 ({total_jobs} 个职位, 半径 {radius_km} 公里) ===")
+
+    rng = random.Random(0)
+    jobs = []
+    for i in range(total_jobs):
+        raw = _make_raw_job(i)
+        raw["gps"] = {"longitude": rng.uniform(121.1, 121.9), "latitude": rng.uniform(30.9, 31.5)}
+        jobs.append(JobRecord.from_raw(raw))
+    points = [(rng.uniform(121.3, 121.7), rng.uniform(31.0, 31.4)) for _ in range(queries)]
+
+    # 按每页15个职位增量添加，模拟数据包陆续到达
+    start = time.perf_counter()
+    index = BossGeoIndex()
+    for offset in range(0, total_jobs, 15):
+        index.add_jobs(jobs[offset:offset + 15])
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    radius_results = [index.query_radius(lon, lat, radius_km) for lon, lat in points]
+    radius_ms = (time.perf_counter() - start) / queries * 1000
+
+    start = time.perf_counter()
+    bbox_results = [index.query_bbox(lon - 0.02, lat - 0.02, lon + 0.02, lat + 0.02) for lon, lat in points]
+    bbox_ms = (time.perf_counter() - start) / queries * 1000
+
+    scan_points = points[:10]
+    start = time.perf_counter()
+    scanned = [
+        [i for i, job in enumerate(jobs) if haversine_km(lon, lat, job.longitude, job.latitude) <= radius_km]
+        for lon, lat in scan_points
+    ]
+    scan_ms = (time.perf_counter() - start) / len(scan_points) * 1000
+
+    assert scanned == radius_results[:len(scan_points)]
+    assert all(
+        result == [i for i, job in enumerate(jobs)
+                   if lon - 0.02 <= job.longitude <= lon + 0.02 and lat - 0.02 <= job.latitude <= lat + 0.02]
+        for result, (lon, lat) in list(zip(bbox_results, points))[:3]
+    )
+
+    average = sum(len(result) for result in radius_results) / queries
+    print(f"增量建索引 {build_ms:.0f} ms | {index.get_stats()}")
+    print(f"半径查询 {radius_ms:.2f} ms（平均命中 {average:.0f} 个）| 矩形查询 {bbox_ms:.2f} ms | "
+          f"逐条计算 {scan_ms:.1f} ms")
+
+    return {"build_ms": build_ms, "radius_ms": radius_ms, "bbox_ms": bbox_ms, "scan_ms": scan_ms}
+
+
+_LEGACY_SALARY = re.compile(r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)\s*(K|k|元/天|元/时)")
+
+
+def benchmark_salary(total_jobs: int = 100000, salary_range: tuple = (15, 30)) -> Dict:
+    """
+    薪资基准：逐条正则解析 salary_desc 与使用职位记录中的薪资数值字段，比较范围过滤和分位数
+
+    Args:
+        total_jobs: 职位数
+        salary_range: 月薪过滤范围（千元）
+
+    Returns:
+        Dict: 两种方式的过滤和分位数耗时（毫秒）
+    """
+    print(f"=== 薪资基准 ({total_jobs} 个职位) ===")
+
+    rng = random.Random(0)
+    descs = _SALARIES + [f"{low}-{low + rng.randint(2, 20)}K" + rng.choice(["", "·13薪", "·14薪", "·16薪"])
+                         for low in range(3, 60)] + ["面议"]
+    jobs = []
+    for i in range(total_jobs):
+        raw = _make_raw_job(i)
+        raw["salaryDesc"] = rng.choice(descs)
+        jobs.append(JobRecord.from_raw(raw))
+    lower, upper = salary_range
+
+    def legacy_parse(desc: str):
+        match = _LEGACY_SALARY.search(desc)
+        if not match or match.group(3) not in ("K", "k"):
+            return None
+        return float(match.group(1)), float(match.group(2))
+
+    start = time.perf_counter()
+    legacy_jobs = [job for job in jobs
+                   if (parsed := legacy_parse(job.salary_desc)) and parsed[0] <= upper and parsed[1] >= lower]
+    legacy_filter_ms = (time.perf_counter() - start) * 1000
+
+    processor = BossDataProcessor()
+    start = time.perf_counter()
+    filtered = processor.filter_jobs(jobs, {"salary_range": salary_range})
+    filter_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    middles = sorted((parsed[0] + parsed[1]) / 2 for job in jobs if (parsed := legacy_parse(job.salary_desc)))
+    legacy_median = middles[-(-len(middles) // 2) - 1]
+    legacy_stats_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    stats = BossJobSummary.from_jobs(jobs).salary_stats()
+    stats_ms = (time.perf_counter() - start) * 1000
+
+    assert filtered == legacy_jobs and stats["median"] == legacy_median and stats["count"] == len(middles)
+    print(f"不同薪资描述 {parse_salary.cache_info().currsize} 种 | 月薪统计: {stats}")
+    print(f"范围过滤: 逐条解析 {legacy_filter_ms:.1f} ms | 数值字段 {filter_ms:.1f} ms")
+    print(f"月薪分位数: 逐条解析+排序 {legacy_stats_ms:.1f} ms | 汇总（含全部分布） {stats_ms:.1f} ms")
+    results = {
+        "legacy_filter_ms": legacy_filter_ms,
+        "filter_ms": filter_ms,
+        "legacy_stats_ms": legacy_stats_ms,
+        "stats_ms": stats_ms,
+    }
+
+    # 数值列导出后可直接做向量化过滤和分位数（需要 pyarrow）
+    try:
+        import pyarrow.compute as pc
+    except ImportError:
+        return results
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "jobs.arrow")
+        with BossColumnarExporter(path) as exporter:
+            exporter.write_jobs(jobs)
+        table = read_columnar_jobs(path)
+
+    start = time.perf_counter()
+    monthly = pc.equal(table["pay_type"].combine_chunks().dictionary_decode(), "月薪")
+    mask = pc.and_(monthly, pc.and_(pc.less_equal(table["salary_min"], upper),
+                                    pc.greater_equal(table["salary_max"], lower)))
+    count = pc.sum(mask).as_py()
+    middle = pc.divide(pc.add(table["salary_min"], table["salary_max"]), 2)
+    median = pc.quantile(pc.filter(middle, monthly), q=0.5, interpolation="higher")[0].as_py()
+    results["arrow_ms"] = (time.perf_counter() - start) * 1000
+
+    assert count == len(filtered) and median == legacy_median
+    print(f"列式数值列: 范围过滤+中位数 {results['arrow_ms']:.1f} ms")
+    return results
+
+
+class _FakeListing:
+    """模拟按更新时间倒序的职位列表：每次"隔天"有部分职位更新或新增，排到最前面"""
+
+    def __init__(self, total_jobs: int, page_size: int):
+        self.page_size = page_size
+        self.clock = 1_700_000_000_000
+        self.jobs = [self._touch(_make_raw_job(i)) for i in range(total_jobs)]
+        self.next_index = total_jobs
+        self.requests = 0
+
+    def _touch(self, job: Dict) -> Dict:
+        self.clock += 1000
+        job["lastModifyTime"] = self.clock
+        return job
+
+    def next_day(self, changed: int, added: int, rng: random.Random) -> None:
+        for job in rng.sample(self.jobs, changed):
+            self._touch(job)
+        for _ in range(added):
+            self.jobs.append(self._touch(_make_raw_job(self.next_index)))
+            self.next_index += 1
+        self.jobs.sort(key=lambda job: job["lastModifyTime"], reverse=True)
+
+    def __call__(self, search_params: Dict, max_age=None) -> Dict:
+        self.requests += 1
+        page = search_params["page"]
+        job_list = [dict(job) for job in self.jobs[(page - 1) * self.page_size:page * self.page_size]]
+        return {"success": True, "data": {
+            "jobList": job_list,
+            "totalCount": len(self.jobs),
+            "hasMore": page * self.page_size < len(self.jobs),
+        }}
+
+
+def benchmark_delta_crawl(total_jobs: int = 3000, page_size: int = 15,
+                          changed: int = 60, added: int = 30) -> Dict:
+    """
+    增量抓取基准：第二天重抓同一查询，对比全量与增量模式的请求数和写入职位数
+
+    Args:
+        total_jobs: 第一天的职位数
+        page_size: 每页职位数
+        changed: 第二天更新的职位数
+        added: 第二天新增的职位数
+
+    Returns:
+        Dict: 两种方式的请求数、写入职位数与耗时
+    """
+    print(f"=== 增量抓取基准 ({total_jobs} 个职位，次日更新 {changed} 个、新增 {added} 个) ===")
+
+    from .scraper import BossScraper
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = BossConfig()
+        config.update_scraper_config(
+            checkpoint={"enabled": False, "path": None},
+            delta={"enabled": False, "path": os.path.join(tmp_dir, "job_state.sqlite3"),
+                   "stop_after_unchanged_pages": 1},
+        )
+        scraper = BossScraper(config)
+        scraper._check_initialized = lambda: True
+        written = []
+        scraper.data_processor.save_jobs_data = lambda jobs, *args, **kwargs: written.append(len(jobs))
+        listing = _FakeListing(total_jobs, page_size)
+        scraper.search_jobs = listing
+        params = {"query": "Python", "city": "上海", "page_size": page_size}
+        max_pages = -(-(total_jobs + added) // page_size)
+
+        # 第一天：状态库为空，全部职位都是新增
+        scraper.batch_search(params, max_pages, delta=True)
+        listing.next_day(changed, added, random.Random(0))
+
+        results = {}
+        for mode, delta in (("full", False), ("delta", True)):
+            listing.requests = 0
+            written.clear()
+            start = time.perf_counter()
+            result = scraper.batch_search(params, max_pages, delta=delta)
+            results[mode] = {
+                "requests": listing.requests,
+                "written": sum(written),
+                "seconds": time.perf_counter() - start,
+            }
+        scraper.close()
+
+    assert result["delta"]["new"] == added and result["delta"]["changed"] == changed
+    for mode, stats in results.items():
+        print(f"{mode:>5}: {stats['requests']} 次请求，写入 {stats['written']} 个职位，耗时 {stats['seconds']:.2f} 秒")
+
+    return results
+
+
+def benchmark_sqlite_store(runs: int = 10, jobs_per_run: int = 10000, page_size: int = 15,
+                           overlap: float = 0.8) -> Dict:
+    """
+    SQLite存储基准：多次抓取（相邻两次有 overlap 比例的职位重复），对比每次保存一个JSON文件与
+    写入同一个SQLite库的写入吞吐、抓取线程阻塞时间和跨批次查询耗时
+
+    Args:
+        runs: 抓取次数
+        jobs_per_run: 每次抓取的职位数
+        page_size: 每页职位数（SQLite按页提交）
+        overlap: 相邻两次抓取重复的职位比例
+
+    Returns:
+        Dict: {方式: {"write_s", "blocked_s", "jobs_per_s", "query_s", "size_mb", "stored"}}
+    """
+    print(f"=== SQLite存储基准 ({runs} 次抓取 x {jobs_per_run} 个职位) ===")
+
+    step = int(jobs_per_run * (1 - overlap))
+    processor = BossDataProcessor(BossConfig())
+    all_runs = [
+        processor.extract_job_list([_make_raw_job(i) for i in range(run * step, run * step + jobs_per_run)])
+        for run in range(runs)
+    ]
+    total = runs * jobs_per_run
+    filters = {"cities": "上海", "salary_range": (15, 30)}
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = BossConfig()
+        config.get_result_dir = lambda: tmp_dir
+        processor = BossDataProcessor(config)
+
+        start = time.perf_counter()
+        paths = [processor.save_jobs_data(jobs, f"jobs_data_{run}.json", include_summary=False)
+                 for run, jobs in enumerate(all_runs)]
+        write_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        merged = {}
+        for path in paths:
+            for job in processor.iter_jobs_data(path):
+                merged[job["job_id"]] = job
+        matched = processor.filter_jobs(list(merged.values()), filters)
+        results["json"] = {
+            "write_s": write_s,
+            "blocked_s": write_s,
+            "jobs_per_s": total / write_s,
+            "query_s": time.perf_counter() - start,
+            "size_mb": sum(os.path.getsize(path) for path in paths) / 1e6,
+            "stored": len(merged),
+        }
+
+        db_path = os.path.join(tmp_dir, "jobs.sqlite3")
+        store = BossSqliteStore(db_path)
+        blocked_s = 0.0
+        start = time.perf_counter()
+        for jobs in all_runs:
+            for offset in range(0, len(jobs), page_size):
+                submit = time.perf_counter()
+                store.write_jobs(jobs[offset:offset + page_size])
+                blocked_s += time.perf_counter() - submit
+        store.flush()
+        write_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        queried = store.query(filters)
+        results["sqlite"] = {
+            "write_s": write_s,
+            "blocked_s": blocked_s,
+            "jobs_per_s": total / write_s,
+            "query_s": time.perf_counter() - start,
+            "size_mb": sum(os.path.getsize(db_path + suffix) for suffix in ("", "-wal")
+                           if os.path.exists(db_path + suffix)) / 1e6,
+            "stored": store.count(),
+        }
+        stats = store.get_stats()
+        store.close()
+
+    assert results["sqlite"]["stored"] == results["json"]["stored"]
+    assert len(queried) == len(matched)
+    print(f"{'方式':>8} | {'写入(s)':>8} | {'阻塞(s)':>8} | {'职位/秒':>9} | {'查询(s)':>8} | {'大小(MB)':>9} | {'职位数':>7}")
+    for name, stats_row in results.items():
+        print(f"{name:>8} | {stats_row['write_s']:>8.3f} | {stats_row['blocked_s']:>8.3f} | "
+              f"{stats_row['jobs_per_s']:>9.0f} | {stats_row['query_s']:>8.3f} | "
+              f"{stats_row['size_mb']:>9.2f} | {stats_row['stored']:>7}")
+    print(f"SQLite 共 {stats['transactions']} 个事务，跨批次查询命中 {len(queried)} 个职位")
+
+    return results
+
+
+def _mongo_collection(uri, name: str):
+    """基准用的集合：给出 uri 时连接真实的 mongod，否则使用 mongomock"""
+    if uri:
+        import pymongo
+        client = pymongo.MongoClient(uri)
+        client["boss_benchmark"].drop_collection(name)
+        return client["boss_benchmark"][name]
+    try:
+        import mongomock
+    except ImportError:
+        raise ImportError("MongoDB存储基准需要 mongod 地址或安装 mongomock: pip install mongomock")
+    return mongomock.MongoClient()["boss_benchmark"][name]
+
+
+def benchmark_mongo_store(total_jobs: int = None, page_size: int = 15, batch_size: int = 1000,
+                          uri: str = None) -> Dict:
+    """
+    MongoDB存储基准：对比逐个 update_one upsert 与缓冲后无序 bulk_write 的写入耗时和抓取线程阻塞时间
+
+    Args:
+        total_jobs: 职位数，为空时 mongod 为 20000、mongomock 为 1000
+        page_size: 每页职位数（按页提交）
+        batch_size: 每次 bulk_write 的职位数
+        uri: MongoDB连接地址，为空则使用 mongomock（每次写入都遍历集合，只验证结果，耗时没有参考意义）
+
+    Returns:
+        Dict: {方式: {"write_s", "blocked_s", "jobs_per_s", "stored"}}
+    """
+    if total_jobs is None:
+        total_jobs = 20000 if uri else 1000
+    print(f"=== MongoDB存储基准 ({total_jobs} 个职位，{'mongod' if uri else 'mongomock'}) ===")
+    if not uri:
+        print("⚠️ mongomock 只用于验证写入结果，吞吐量请传入 uri 连接真实的 mongod 测量")
+
+    jobs = _make_jobs(total_jobs)
+    pages = [jobs[offset:offset + page_size] for offset in range(0, total_jobs, page_size)]
+    results = {}
+
+    collection = _mongo_collection(uri, "jobs_single")
+    collection.create_index("job_id", unique=True)
+    start = time.perf_counter()
+    for page in pages:
+        for job in page:
+            document = job.to_dict()
+            collection.update_one({"job_id": document["job_id"]}, {"$set": document}, upsert=True)
+    write_s = time.perf_counter() - start
+    results["update_one"] = {"write_s": write_s, "blocked_s": write_s, "jobs_per_s": total_jobs / write_s,
+                             "stored": collection.count_documents({})}
+
+    collection = _mongo_collection(uri, "jobs_bulk")
+    store = BossMongoStore(collection, batch_size=batch_size)
+    blocked_s = 0.0
+    start = time.perf_counter()
+    for page in pages:
+        submit = time.perf_counter()
+        store.write_jobs(page)
+        blocked_s += time.perf_counter() - submit
+    store.flush()
+    write_s = time.perf_counter() - start
+    results["bulk_write"] = {"write_s": write_s, "blocked_s": blocked_s, "jobs_per_s": total_jobs / write_s,
+                             "stored": collection.count_documents({})}
+    stats = store.get_stats()
+    store.close()
+
+    assert results["bulk_write"]["stored"] == results["update_one"]["stored"]
+    print(f"{'方式':>10} | {'写入(s)':>8} | {'阻塞(s)':>8} | {'职位/秒':>9} | {'职位数':>7}")
+    for name, row in results.items():
+        print(f"{name:>10} | {row['write_s']:>8.3f} | {row['blocked_s']:>8.3f} | "
+              f"{row['jobs_per_s']:>9.0f} | {row['stored']:>7}")
+    print(f"bulk_write 共 {stats['batches']} 批，背压等待 {stats['blocked_seconds']:.3f} 秒")
+
+    return results
+
+
+if __name__ == "__main__":
+    print("Boss直聘爬虫性能基准")
+    print("请选择要运行的基准：")
+    print("1. 去重索引")
+    print("2. 接口直连")
+    print("3. 列式导出")
+    print("4. 职位内存")
+    print("5. 职位汇总")
+    print("6. 职位过滤")
+    print("7. 导入耗时")
+    print("8. 代码表")
+    print("9. 商圈代码")
+    print("10. 数据包捕获")
+    print("11. 请求调度")
+    print("12. 抓取断点")
+    print("13. 任务队列")
+    print("14. 查询拆分")
+    print("15. 坐标索引")
+    print("16. 薪资解析")
+    print("17. 增量抓取")
+    print("18. SQLite存储")
+    print("19. MongoDB存储")
+
+    choice = input("请输入选项 (1-19): ").strip()
+
+    benchmarks = {
+        "1": benchmark_dedupe_index,
+        "2": benchmark_api_fetch,
+        "3": benchmark_columnar_export,
+        "4": benchmark_job_record_memory,
+        "5": benchmark_summary,
+        "6": benchmark_filter_jobs,
+        "7": benchmark_import_time,
+        "8": benchmark_code_tables,
+        "9": benchmark_district_lookup,
+        "10": benchmark_packet_capture,
+        "11": benchmark_rate_scheduler,
+        "12": benchmark_checkpoint,
+        "13": benchmark_frontier,
+        "14": benchmark_partitioner,
+        "15": benchmark_geo_index,
+        "16": benchmark_salary,
+        "17": benchmark_delta_crawl,
+        "18": benchmark_sqlite_store,
+        "19": benchmark_mongo_store,
+    }
+
+    if choice in benchmarks:
+        benchmarks[choice]()
+    else:
+        print("无效选项")
@@ -15,9 +15,26 @@ sys.path.insert(0, project_root)
 
 # 导入新的模块化组件
 from .config import BossConfig
+from .job_record import JobRecord
 from .scraper import BossScraper
 
 
+def _jobs_to_dicts(result: Dict) -> Dict:
+    """
+    把结果中的 JobRecord 转为字典：兼容层的返回值保持可直接 json.dumps、可修改的字典列表
+
+    Args:
+        result: 搜索结果
+
+    Returns:
+        dict: 同一个结果（jobs 已转换）
+    """
+    jobs = result.get("jobs")
+    if jobs:
+        result["jobs"] = [job.to_dict() if isinstance(job, JobRecord) else job for job in jobs]
+    return result
+
+
 class BossJobScraper:
     """Boss直聘职位爬虫 - 兼容旧接口的入口类"""
     
@@ -62,7 +79,8 @@ class BossJobScraper:
         return self.scraper.search_jobs(search_params)
     
     def search_jobs_with_scrolling(
-        self, search_params: Dict, manual_scroll: bool = False, max_scroll_times: int = 10
+        self, search_params: Dict, manual_scroll: bool = False, max_scroll_times: int = 10,
+        resume: bool = False
     ) -> Dict:
         """
         通过滚动页面持续监听获取更多职位数据
@@ -71,34 +89,85 @@ class BossJobScraper:
             search_params: 搜索参数
             manual_scroll: 是否手动滚动
             max_scroll_times: 最大滚动次数
+            resume: 是否从上次相同参数的断点继续
 
         Returns:
-            dict: 所有搜索结果
+            dict: 所有搜索结果（jobs 为字典列表）
         """
         if not self._initialized:
             if not self.initialize():
                 return {"success": False, "message": "爬虫初始化失败"}
         
-        return self.scraper.search_jobs_with_scrolling(
-            search_params, manual_scroll, max_scroll_times
-        )
+        return _jobs_to_dicts(self.scraper.search_jobs_with_scrolling(
+            search_params, manual_scroll, max_scroll_times, resume=resume
+        ))
     
-    def batch_search(self, search_params: Dict, max_pages: int = 5) -> Dict:
+    def batch_search(self, search_params: Dict, max_pages: int = 5, resume: bool = False,
+                     delta: Optional[bool] = None) -> Dict:
         """
         批量搜索多页职位
 
         Args:
             search_params: 搜索参数
             max_pages: 最大页数
+            resume: 是否从上次相同参数的断点继续（跳过已完成的页）
+            delta: 是否只输出相对上次新增或变化的职位，为空则使用配置
 
         Returns:
-            dict: 搜索结果
+            dict: 搜索结果（jobs 为字典列表）
+        """
+        if not self._initialized:
+            if not self.initialize():
+                return {"success": False, "message": "爬虫初始化失败"}
+        
+        return _jobs_to_dicts(self.scraper.batch_search(search_params, max_pages, resume=resume, delta=delta))
+    
+    def partitioned_search(self, search_params: Dict, max_pages: int = 5, resume: bool = False) -> Dict:
+        """
+        拆分查询搜索：总数超过翻页上限时按薪资、经验、学历等条件自动拆分后抓取并去重
+
+        Args:
+            search_params: 搜索参数
+            max_pages: 每个分区最大页数
+            resume: 各分区是否从断点继续
+
+        Returns:
+            dict: 搜索结果（jobs 为字典列表，含覆盖率 coverage 和分区明细 partitions）
         """
         if not self._initialized:
             if not self.initialize():
                 return {"success": False, "message": "爬虫初始化失败"}
         
-        return self.scraper.batch_search(search_params, max_pages)
+        return _jobs_to_dicts(self.scraper.partitioned_search(search_params, max_pages, resume=resume))
+    
+    def run_sweep(self, spec: Dict, max_pages: int = 5, priority: int = 0, refresh: bool = False) -> Dict:
+        """
+        展开多关键词/城市/条件组合并逐个批量搜索（任务队列持久化，中断后再次调用会继续）
+
+        Args:
+            spec: 组合规格，取值为列表的参数会做笛卡尔积，如
+                {"query": ["Python", "Java"], "city": ["上海", "北京"], "experience": "1-3年"}
+            max_pages: 每个组合最大页数
+            priority: 本次组合的优先级
+            refresh: 已完成的相同组合是否重新抓取（如每晚重跑）
+
+        Returns:
+            dict: 执行结果
+        """
+        if not self._initialized:
+            if not self.initialize():
+                return {"success": False, "message": "爬虫初始化失败"}
+        
+        from .frontier import BossCrawlFrontier
+        
+        frontier = BossCrawlFrontier.from_config(self.config, self.scraper.url_builder)
+        try:
+            added = frontier.add_sweep(spec, priority=priority, max_pages=max_pages, refresh=refresh)
+            print(f"任务队列新增 {added} 个组合")
+            stats = frontier.run([self], max_pages)
+            return {"success": True, "added": added, **stats, "frontier": frontier.get_stats()}
+        finally:
+            frontier.close()
     
     def extract_job_data(self, job_list: List[Dict]) -> List[Dict]:
         """
@@ -110,7 +179,7 @@ class BossJobScraper:
         Returns:
             list: 格式化的职位数据
         """
-        return self.scraper.data_processor.extract_job_list(job_list)
+        return [job.to_dict() for job in self.scraper.data_processor.extract_job_list(job_list)]
     
     def save_current_cookies(self, file_path: str) -> bool:
         """
@@ -135,6 +204,30 @@ class BossJobScraper:
         self._initialized = False
 
 
+def build_search_params(params: Dict) -> Dict:
+    """
+    从接口请求参数中提取搜索参数
+
+    Args:
+        params: 接口请求参数
+
+    Returns:
+        dict: 搜索参数
+    """
+    return {
+        "query": params.get("query", ""),
+        "city": params.get("city", ""),
+        "district": params.get("district", ""),
+        "experience": params.get("experience", ""),
+        "degree": params.get("degree", ""),
+        "salary": params.get("salary", ""),
+        "scale": params.get("scale", ""),
+        "stage": params.get("stage", ""),
+        "job_type": params.get("job_type", ""),
+        "page_size": params.get("page_size", 15),
+    }
+
+
 # API 接口函数，供 Node.js 后台调用
 def search_boss_jobs(params: Dict, **auth_params) -> Dict:
     """
@@ -145,7 +238,7 @@ def search_boss_jobs(params: Dict, **auth_params) -> Dict:
         **auth_params: 认证参数（cookies、cookie_string、cookie_file、token）
 
     Returns:
-        dict: 搜索结果
+        dict: 搜索结果，可直接 json.dumps（jobs 为字典列表）
     """
     scraper = None
     try:
@@ -156,23 +249,16 @@ def search_boss_jobs(params: Dict, **auth_params) -> Dict:
             return {"success": False, "jobs": [], "total_jobs": 0, "error": "初始化失败"}
 
         # 提取参数
-        search_params = {
-            "query": params.get("query", ""),
-            "city": params.get("city", ""),
-            "district": params.get("district", ""),
-            "experience": params.get("experience", ""),
-            "degree": params.get("degree", ""),
-            "salary": params.get("salary", ""),
-            "scale": params.get("scale", ""),
-            "stage": params.get("stage", ""),
-            "job_type": params.get("job_type", ""),
-            "page_size": params.get("page_size", 15),
-        }
+        search_params = build_search_params(params)
 
         max_pages = params.get("max_pages", 3)
 
-        # 批量搜索
-        result = scraper.batch_search(search_params, max_pages)
+        # 批量搜索（partition 为真时总数超过翻页上限的查询自动拆分）
+        if params.get("partition"):
+            result = scraper.partitioned_search(search_params, max_pages, resume=params.get("resume", False))
+        else:
+            result = scraper.batch_search(search_params, max_pages, resume=params.get("resume", False),
+                                          delta=params.get("delta"))
 
         return result
 
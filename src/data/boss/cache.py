@@ -0,0 +1,174 @@
+import json
+import time
+import zlib
+import sqlite3
+import threading
+from urllib.parse import urlsplit, parse_qsl, urlencode
+from typing import Any, Dict, Optional
+
+
+class BossResponseCache:
+    """Boss直聘搜索响应缓存
+
+    以规范化后的 joblist.json 接口URL为键，把 zpData 压缩后存入SQLite，
+    支持TTL过期、按总大小的LRU淘汰以及命中/未命中计数。
+    """
+
+    def __init__(self, db_path: str, ttl: float = 3600, max_size_bytes: int = 200 * 1024 * 1024):
+        """
+        初始化响应缓存
+
+        Args:
+            db_path: SQLite数据库文件路径
+            ttl: 默认有效期（秒）
+            max_size_bytes: 缓存总大小上限（字节），超出后按最近访问时间淘汰
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_size_bytes = max_size_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                payload BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(api_url: str) -> str:
+        """
+        规范化接口URL作为缓存键（参数排序，忽略协议与主机大小写差异）
+
+        Args:
+            api_url: build_api_url 生成的URL
+
+        Returns:
+            str: 缓存键
+        """
+        parts = urlsplit(api_url)
+        query = sorted(parse_qsl(parts.query, keep_blank_values=False))
+        return f"{parts.netloc.lower()}{parts.path}?{urlencode(query)}"
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """
+        读取缓存
+
+        Args:
+            key: 缓存键
+            max_age: 本次可接受的最大缓存时长（秒），为空则使用TTL，0表示强制刷新
+
+        Returns:
+            缓存数据，未命中或已过期返回None
+        """
+        max_age = self.ttl if max_age is None else max_age
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] > max_age:
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(zlib.decompress(row[0]).decode("utf-8"))
+
+    def set(self, key: str, data: Any) -> None:
+        """
+        写入缓存
+
+        Args:
+            key: 缓存键
+            data: 要缓存的数据（需可JSON序列化）
+        """
+        payload = zlib.compress(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, payload, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, payload, len(payload), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """删除过期条目，并按最近访问时间淘汰直到总大小不超过上限"""
+        self._conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl,))
+
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall():
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.evictions += 1
+            total -= size
+            if total <= self.max_size_bytes:
+                break
+
+    def invalidate(self, key: str) -> None:
+        """
+        删除指定缓存
+
+        Args:
+            key: 缓存键
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def get_stats(self) -> Dict:
+        """
+        获取缓存统计
+
+        Returns:
+            Dict: 条目数、总大小及命中/未命中/淘汰计数
+        """
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "size_bytes": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        try:
+            self._conn.close()
+        except Exception as e:
+            print(f"关闭缓存数据库时出错: {e}")
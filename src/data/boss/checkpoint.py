@@ -0,0 +1,296 @@
+import json
+import time
+import zlib
+import hashlib
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional
+from .job_record import JobRecord, job_to_json
+
+
+class BossCheckpointStore:
+    """Boss直聘抓取断点库
+
+    把一次批量搜索或滚动搜索视为一个运行（按搜索参数和类型生成 run_key），
+    以页（批量搜索）或数据包序号（滚动搜索）为单位记录已完成的工作、该单位提取的职位
+    和已见职位ID，滚动搜索另外记录已滚动次数和已处理数据包数。每个单位在一个事务中
+    写入，进程崩溃后 resume=True 的运行会跳过已完成单位，从中断处继续；已完成的运行
+    不再续接，resume=True 时同样重新开始。
+    """
+
+    KIND_BATCH = "batch"
+    KIND_SCROLL = "scroll"
+
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+
+    def __init__(self, db_path: str):
+        """
+        初始化断点库
+
+        Args:
+            db_path: SQLite数据库文件路径
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_key TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                params TEXT NOT NULL,
+                status TEXT NOT NULL,
+                total_count INTEGER NOT NULL DEFAULT 0,
+                scroll_count INTEGER NOT NULL DEFAULT 0,
+                packet_count INTEGER NOT NULL DEFAULT 0,
+                message TEXT NOT NULL DEFAULT '',
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS units (
+                run_key TEXT NOT NULL,
+                unit INTEGER NOT NULL,
+                job_count INTEGER NOT NULL,
+                has_more INTEGER NOT NULL,
+                jobs BLOB NOT NULL,
+                completed_at REAL NOT NULL,
+                PRIMARY KEY (run_key, unit)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS seen_jobs (
+                run_key TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                PRIMARY KEY (run_key, job_id)
+            ) WITHOUT ROWID;
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def make_run_key(search_params: Dict, kind: str = KIND_BATCH) -> str:
+        """
+        根据搜索参数（不含页码）和运行类型生成运行键
+
+        Args:
+            search_params: 搜索参数
+            kind: "batch" 或 "scroll"
+
+        Returns:
+            str: 运行键
+        """
+        params = {k: v for k, v in search_params.items() if k != "page" and v not in (None, "")}
+        digest = hashlib.sha1(
+            json.dumps(params, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+        return f"{kind}:{digest}"
+
+    def start_run(self, run_key: str, search_params: Dict, kind: str = KIND_BATCH,
+                  resume: bool = False) -> Dict:
+        """
+        开始（或继续）一个运行
+
+        Args:
+            run_key: 运行键
+            search_params: 搜索参数
+            kind: 运行类型
+            resume: 是否保留未完成（执行中或失败）运行的进度；为False或旧运行已完成时清空旧断点
+
+        Returns:
+            Dict: 运行状态（status、completed_units、total_count、scroll_count、packet_count）
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT status FROM runs WHERE run_key = ?", (run_key,)).fetchone()
+            # 已完成的运行续接时不会再访问网络，只会返回上次的职位，因此重新开始
+            if not resume or (row is not None and row[0] == self.STATUS_DONE):
+                self._delete(run_key)
+            self._conn.execute(
+                "INSERT OR IGNORE INTO runs (run_key, kind, params, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (run_key, kind, json.dumps(search_params, ensure_ascii=False, default=str),
+                 self.STATUS_RUNNING, now, now),
+            )
+            self._conn.execute(
+                "UPDATE runs SET status = ?, message = '', updated_at = ? WHERE run_key = ?",
+                (self.STATUS_RUNNING, now, run_key),
+            )
+            self._conn.commit()
+        return self.get_run(run_key)
+
+    def get_run(self, run_key: str) -> Optional[Dict]:
+        """
+        获取运行状态
+
+        Args:
+            run_key: 运行键
+
+        Returns:
+            Dict or None: 运行状态，不存在返回None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT kind, status, total_count, scroll_count, packet_count, message "
+                "FROM runs WHERE run_key = ?", (run_key,)
+            ).fetchone()
+            if row is None:
+                return None
+            units = self._conn.execute(
+                "SELECT unit, has_more, job_count FROM units WHERE run_key = ? ORDER BY unit", (run_key,)
+            ).fetchall()
+
+        return {
+            "run_key": run_key,
+            "kind": row[0],
+            "status": row[1],
+            "total_count": row[2],
+            "scroll_count": row[3],
+            "packet_count": row[4],
+            "message": row[5],
+            "completed_units": [unit for unit, _, _ in units],
+            "has_more": bool(units[-1][1]) if units else True,
+            "job_count": sum(count for _, _, count in units),
+        }
+
+    def complete_unit(self, run_key: str, unit: int, jobs: List, has_more: bool = True,
+                      total_count: Optional[int] = None, scroll_count: Optional[int] = None,
+                      packet_count: Optional[int] = None) -> None:
+        """
+        在一个事务中记录已完成的单位、它的职位和已见职位ID
+
+        Args:
+            run_key: 运行键
+            unit: 页码（批量搜索）或数据包序号（滚动搜索）
+            jobs: 该单位新增的职位
+            has_more: 之后是否还有数据
+            total_count: 职位总数（首页返回）
+            scroll_count: 已滚动次数
+            packet_count: 已处理数据包数
+        """
+        payload = zlib.compress(json.dumps(jobs, ensure_ascii=False, default=job_to_json).encode("utf-8"))
+        job_ids = [(run_key, job.get("job_id")) for job in jobs if job.get("job_id")]
+        now = time.time()
+
+        updates = ["updated_at = ?"]
+        values: List = [now]
+        for column, value in (("total_count", total_count), ("scroll_count", scroll_count),
+                              ("packet_count", packet_count)):
+            if value is not None:
+                updates.append(f"{column} = ?")
+                values.append(value)
+
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO units (run_key, unit, job_count, has_more, jobs, completed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (run_key, unit, len(jobs), int(has_more), payload, now),
+                )
+                self._conn.executemany("INSERT OR IGNORE INTO seen_jobs (run_key, job_id) VALUES (?, ?)", job_ids)
+                self._conn.execute(f"UPDATE runs SET {', '.join(updates)} WHERE run_key = ?", (*values, run_key))
+
+    def update_progress(self, run_key: str, scroll_count: int, packet_count: int) -> None:
+        """
+        记录滚动进度（没有新职位的滚动也要记录，恢复时据此快进）
+
+        Args:
+            run_key: 运行键
+            scroll_count: 已滚动次数
+            packet_count: 已处理数据包数
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE runs SET scroll_count = ?, packet_count = ?, updated_at = ? WHERE run_key = ?",
+                (scroll_count, packet_count, time.time(), run_key),
+            )
+            self._conn.commit()
+
+    def finish_run(self, run_key: str, status: str = STATUS_DONE, message: str = "") -> None:
+        """
+        标记运行结束
+
+        Args:
+            run_key: 运行键
+            status: "done"（全部完成）或 "failed"（中断，可恢复）
+            message: 失败原因
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE runs SET status = ?, message = ?, updated_at = ? WHERE run_key = ?",
+                (status, message, time.time(), run_key),
+            )
+            self._conn.commit()
+
+    def load_jobs(self, run_key: str) -> List[JobRecord]:
+        """
+        按单位顺序载入已完成单位的职位
+
+        Args:
+            run_key: 运行键
+
+        Returns:
+            List[JobRecord]: 职位记录
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT jobs FROM units WHERE run_key = ? ORDER BY unit", (run_key,)
+            ).fetchall()
+
+        jobs = []
+        for (payload,) in rows:
+            jobs.extend(JobRecord(**job) for job in json.loads(zlib.decompress(payload).decode("utf-8")))
+        return jobs
+
+    def seen_job_ids(self, run_key: str) -> List[str]:
+        """
+        获取运行中已见的职位ID
+
+        Args:
+            run_key: 运行键
+
+        Returns:
+            List[str]: 职位ID
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT job_id FROM seen_jobs WHERE run_key = ?", (run_key,)).fetchall()
+        return [job_id for (job_id,) in rows]
+
+    def _delete(self, run_key: str) -> None:
+        """删除运行的全部断点（调用方持有锁）"""
+        self._conn.execute("DELETE FROM units WHERE run_key = ?", (run_key,))
+        self._conn.execute("DELETE FROM seen_jobs WHERE run_key = ?", (run_key,))
+        self._conn.execute("DELETE FROM runs WHERE run_key = ?", (run_key,))
+
+    def reset(self, run_keys: Optional[Iterable[str]] = None) -> None:
+        """
+        删除断点
+
+        Args:
+            run_keys: 要删除的运行键，为空则全部删除
+        """
+        with self._lock:
+            if run_keys is None:
+                self._conn.executescript("DELETE FROM units; DELETE FROM seen_jobs; DELETE FROM runs;")
+            else:
+                for run_key in run_keys:
+                    self._delete(run_key)
+            self._conn.commit()
+
+    def get_stats(self) -> Dict:
+        """
+        获取断点库统计
+
+        Returns:
+            Dict: 各状态的运行数、已完成单位数、已见职位数
+        """
+        with self._lock:
+            runs = dict(self._conn.execute("SELECT status, COUNT(*) FROM runs GROUP BY status").fetchall())
+            units = self._conn.execute("SELECT COUNT(*) FROM units").fetchone()[0]
+            seen = self._conn.execute("SELECT COUNT(*) FROM seen_jobs").fetchone()[0]
+        return {"runs": runs, "units": units, "seen_jobs": seen}
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        try:
+            self._conn.close()
+        except Exception as e:
+            print(f"关闭断点数据库时出错: {e}")
@@ -75,4 +75,5 @@ def getBusinessDistrictCodes(cityName):
     return result
 
 
-getBusinessDistrictCodes("上海")
+if __name__ == "__main__":
+    getBusinessDistrictCodes("上海")
@@ -0,0 +1,344 @@
+import os
+import json
+import pickle
+import difflib
+import threading
+from bisect import bisect_left
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# 城市、区县名称常见后缀，模糊匹配时去掉后再比较
+_NAME_SUFFIXES = ("特别行政区", "自治州", "地区", "市", "区", "县", "省")
+
+
+def _strip_suffix(name: str) -> str:
+    """去掉行政区划后缀"""
+    for suffix in _NAME_SUFFIXES:
+        if name.endswith(suffix) and len(name) > len(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+class CodeTable(Mapping):
+    """不可变的名称 -> 代码映射
+
+    除按名称查代码外，还提供代码 -> 名称的反查（用于解码接口响应），以及
+    前缀匹配和模糊匹配（如 "上海市" -> "上海"）。
+    """
+
+    def __init__(self, mapping: Dict[str, Any]):
+        """
+        初始化代码表
+
+        Args:
+            mapping: 名称到代码的映射
+        """
+        self._codes = MappingProxyType(dict(mapping))
+
+        reverse = {}
+        for name, code in self._codes.items():
+            reverse.setdefault(str(code), name)
+        self._names = MappingProxyType(reverse)
+        self._sorted = tuple(sorted(self._codes))
+
+    def __getitem__(self, name: str) -> Any:
+        return self._codes[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._codes)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __repr__(self) -> str:
+        return f"CodeTable({len(self)} 项)"
+
+    def name_of(self, code: Any) -> Optional[str]:
+        """
+        根据代码反查名称
+
+        Args:
+            code: 代码（整数或字符串）
+
+        Returns:
+            str or None: 名称
+        """
+        return self._names.get(str(code))
+
+    def prefix(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        前缀匹配
+
+        Args:
+            prefix: 名称前缀
+            limit: 最多返回条数
+
+        Returns:
+            List[str]: 按字典序排列的名称
+        """
+        names = self._sorted
+        start = bisect_left(names, prefix)
+        result = []
+        for name in names[start:]:
+            if not name.startswith(prefix) or len(result) >= limit:
+                break
+            result.append(name)
+        return result
+
+    def find(self, name: str, limit: int = 5, cutoff: float = 0.6) -> List[str]:
+        """
+        模糊查找名称：精确匹配、去后缀匹配、前缀匹配、包含匹配，最后按相似度
+
+        Args:
+            name: 要查找的名称
+            limit: 最多返回条数
+            cutoff: 相似度阈值（0-1）
+
+        Returns:
+            List[str]: 候选名称，越靠前越匹配
+        """
+        if not name:
+            return []
+        if name in self._codes:
+            return [name]
+
+        candidates: List[str] = []
+
+        def add(names):
+            for item in names:
+                if item not in candidates:
+                    candidates.append(item)
+
+        stripped = _strip_suffix(name)
+        if stripped in self._codes:
+            add([stripped])
+        add(self.prefix(stripped, limit))
+        if len(candidates) < limit:
+            add(item for item in self._sorted if stripped in item)
+        if len(candidates) < limit:
+            add(difflib.get_close_matches(stripped, self._sorted, n=limit, cutoff=cutoff))
+        return candidates[:limit]
+
+    def resolve(self, name: str) -> Optional[Any]:
+        """
+        按名称取代码，找不到精确匹配时使用最佳模糊匹配
+
+        Args:
+            name: 名称
+
+        Returns:
+            代码，没有候选时返回None
+        """
+        code = self._codes.get(name)
+        if code is not None:
+            return code
+        candidates = self.find(name, limit=1)
+        return self._codes[candidates[0]] if candidates else None
+
+    @classmethod
+    def _from_state(cls, codes: Dict, names: Dict, sorted_names: Tuple[str, ...]) -> "CodeTable":
+        """从快照恢复，不重新构建反查表和排序"""
+        table = cls.__new__(cls)
+        table._codes = MappingProxyType(codes)
+        table._names = MappingProxyType(names)
+        table._sorted = sorted_names
+        return table
+
+    def __reduce__(self):
+        return (CodeTable._from_state, (dict(self._codes), dict(self._names), self._sorted))
+
+
+class BossCodeRegistry:
+    """Boss直聘代码表注册中心
+
+    城市、商圈、筛选条件代码表在进程内只加载一次，所有 BossConfig、BossUrlBuilder、
+    QueryCreater 实例共享同一份不可变的 CodeTable。JSON 解析并构建索引后的结果会
+    保存为 pickle 快照（__pycache__ 目录下），源文件修改时间或大小变化时自动重建。
+    """
+
+    def __init__(self, data_dir: Optional[str] = None, snapshot_dir: Optional[str] = None,
+                 use_snapshot: bool = True):
+        """
+        初始化注册中心
+
+        Args:
+            data_dir: 代码表JSON所在目录，为空则为本模块所在目录
+            snapshot_dir: 快照目录，为空则为 data_dir/__pycache__
+            use_snapshot: 是否读写快照
+        """
+        self.data_dir = data_dir or os.path.dirname(os.path.abspath(__file__))
+        self.snapshot_dir = snapshot_dir or os.path.join(self.data_dir, "__pycache__")
+        self.use_snapshot = use_snapshot
+
+        self._tables: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    # 加载与快照
+
+    def path(self, filename: str) -> str:
+        """代码表文件路径"""
+        return os.path.join(self.data_dir, filename)
+
+    def _snapshot_path(self, filename: str) -> str:
+        """快照文件路径"""
+        return os.path.join(self.snapshot_dir, f"code_tables.{filename}.pickle")
+
+    @staticmethod
+    def _signature(source: str) -> Tuple[int, int]:
+        """源文件签名：(修改时间纳秒, 大小)"""
+        stat = os.stat(source)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_snapshot(self, filename: str, signature: Tuple[int, int]) -> Optional[Any]:
+        """读取与源文件签名一致的快照"""
+        try:
+            with open(self._snapshot_path(filename), "rb") as f:
+                snapshot = pickle.load(f)
+            if snapshot.get("signature") == signature:
+                return snapshot["data"]
+        except (OSError, pickle.PickleError, EOFError, AttributeError, KeyError, TypeError):
+            pass
+        return None
+
+    def _write_snapshot(self, filename: str, signature: Tuple[int, int], data: Any) -> None:
+        """写入快照（失败不影响使用）"""
+        path = self._snapshot_path(filename)
+        try:
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump({"signature": signature, "data": data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"写入代码表快照失败: {e}")
+
+    def _load(self, filename: str, build: Callable[[Any], Any], default: Any) -> Any:
+        """
+        加载代码表：优先快照，否则解析JSON并构建
+
+        Args:
+            filename: JSON文件名
+            build: 把解析后的JSON转为代码表的函数
+            default: 文件不存在时的值
+        """
+        data = self._tables.get(filename)
+        if data is not None:
+            return data
+
+        with self._lock:
+            if filename in self._tables:
+                return self._tables[filename]
+
+            source = self.path(filename)
+            if not os.path.exists(source):
+                return default
+
+            signature = self._signature(source)
+            data = self._read_snapshot(filename, signature) if self.use_snapshot else None
+            if data is None:
+                with open(source, "r", encoding="utf-8") as f:
+                    data = build(json.load(f))
+                if self.use_snapshot:
+                    self._write_snapshot(filename, signature, data)
+
+            self._tables[filename] = data
+            return data
+
+    def invalidate(self, filename: Optional[str] = None) -> None:
+        """
+        丢弃已加载的代码表，下次访问时重新加载（源文件被更新后调用）
+
+        Args:
+            filename: 代码表文件名，为空则全部丢弃
+        """
+        with self._lock:
+            if filename:
+                self._tables.pop(filename, None)
+            else:
+                self._tables.clear()
+
+    # 代码表
+
+    CITY_FILE = "city_code_map.json"
+    DISTRICT_FILE = "business_code_map.json"
+    CONDITION_FILE = "conditions.json"
+
+    def cities(self) -> Optional[CodeTable]:
+        """
+        城市代码表
+
+        Returns:
+            CodeTable or None: 城市名称 -> 城市代码，文件不存在返回None
+        """
+        return self._load(self.CITY_FILE, CodeTable, None)
+
+    def districts(self) -> CodeTable:
+        """
+        商圈代码表（区县及商圈名称 -> 代码）
+
+        Returns:
+            CodeTable: 商圈代码表，文件不存在返回空表
+        """
+        return self._load(self.DISTRICT_FILE, CodeTable, CodeTable({}))
+
+    @staticmethod
+    def _build_conditions(data: Dict) -> Tuple[Dict, Dict[str, CodeTable]]:
+        """conditions.json -> (原始条件, {分类: CodeTable})"""
+        conditions = data["zpData"]
+        tables = {}
+        for list_name, items in conditions.items():
+            category = list_name.replace("List", "")  # 去掉List后缀作为分类名
+            tables[category] = CodeTable({item["name"]: item["code"] for item in items})
+        return conditions, tables
+
+    def conditions(self) -> Tuple[Dict, Dict[str, CodeTable]]:
+        """
+        筛选条件代码表
+
+        Returns:
+            tuple: (原始条件数据, {分类: CodeTable})
+        """
+        result = self._load(self.CONDITION_FILE, self._build_conditions, None)
+        if result is None:
+            raise FileNotFoundError(self.path(self.CONDITION_FILE))
+        return result
+
+    def decode(self, category: str, code: Any) -> Optional[str]:
+        """
+        代码反查名称
+
+        Args:
+            category: "city"、"district" 或筛选条件分类（experience、degree、salary、scale……）
+            code: 代码
+
+        Returns:
+            str or None: 名称
+        """
+        if category == "city":
+            table = self.cities()
+        elif category == "district":
+            table = self.districts()
+        else:
+            table = self.conditions()[1].get(category)
+        return table.name_of(code) if table else None
+
+
+_registry: Optional[BossCodeRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_code_registry() -> BossCodeRegistry:
+    """
+    获取进程内共享的代码表注册中心
+
+    Returns:
+        BossCodeRegistry: 注册中心
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = BossCodeRegistry()
+    return _registry
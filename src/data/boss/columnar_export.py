@@ -0,0 +1,220 @@
+import os
+from typing import Dict, List, Optional
+
+
+def _import_pyarrow():
+    """按需导入pyarrow（可选依赖）"""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+        return pyarrow
+    except ImportError:
+        raise ImportError("Parquet/Arrow导出需要安装 pyarrow: pip install pyarrow")
+
+
+def detect_columnar_format(file_path: str) -> Optional[str]:
+    """
+    根据扩展名判断列式格式
+
+    Args:
+        file_path: 文件路径
+
+    Returns:
+        str or None: "parquet"、"arrow" 或 None
+    """
+    if file_path.endswith(".parquet"):
+        return "parquet"
+    if file_path.endswith((".arrow", ".arrows")):
+        return "arrow"
+    return None
+
+
+class BossColumnarExporter:
+    """Boss直聘职位列式导出模块
+
+    将标准化职位按批写入 Parquet 或 Arrow IPC（流格式）。城市、学历、经验、
+    规模等低基数字段使用字典编码，skills、job_labels、welfare_list 为原生
+    列表列。实现 write_jobs/flush/close，可作为 BossDataProcessor 的输出目标。
+    """
+
+    # 低基数字段：字典编码
+    DICTIONARY_COLUMNS = (
+        "city_name", "area_district", "business_district",
+        "job_degree", "job_experience",
+        "brand_stage_name", "brand_industry", "brand_scale_name",
+        "boss_title", "job_status_desc", "icon_word", "pay_type",
+    )
+    LIST_COLUMNS = ("job_labels", "skills", "welfare_list")
+    INT_COLUMNS = ("job_type", "job_valid_status", "expect_id", "last_modify_time", "prolong", "salary_months")
+    FLOAT_COLUMNS = ("longitude", "latitude", "salary_min", "salary_max")
+
+    def __init__(self, file_path: str, file_format: Optional[str] = None,
+                 batch_size: int = 5000, compression: str = "zstd"):
+        """
+        初始化列式导出器
+
+        Args:
+            file_path: 输出文件路径
+            file_format: "parquet" 或 "arrow"，为空则按扩展名判断
+            batch_size: 每批写入的职位数（Parquet行组大小）
+            compression: Parquet压缩算法
+        """
+        self.pa = _import_pyarrow()
+        self.file_path = file_path
+        self.file_format = file_format or detect_columnar_format(file_path) or "parquet"
+        self.batch_size = batch_size
+        self.compression = compression
+
+        self.jobs_written = 0
+        self._buffer: List[Dict] = []
+        self._schema = None
+        self._writer = None
+
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+
+    def _column_type(self, name: str, sample):
+        """推断列类型"""
+        pa = self.pa
+        if name in self.DICTIONARY_COLUMNS:
+            return pa.dictionary(pa.int32(), pa.string())
+        if name in self.LIST_COLUMNS or isinstance(sample, list):
+            return pa.list_(pa.string())
+        if isinstance(sample, bool):
+            return pa.bool_()
+        if name in self.INT_COLUMNS or isinstance(sample, int):
+            return pa.int64()
+        if name in self.FLOAT_COLUMNS or isinstance(sample, float):
+            return pa.float64()
+        return pa.string()
+
+    def _build_schema(self, jobs: List[Dict]):
+        """按首批数据的字段顺序构建schema"""
+        fields = []
+        for name, sample in jobs[0].items():
+            if isinstance(sample, dict):
+                continue
+            fields.append(self.pa.field(name, self._column_type(name, sample)))
+        return self.pa.schema(fields)
+
+    @staticmethod
+    def _normalize_value(value, type_name: str):
+        """把空字符串等缺省值转为null，并按列类型转换"""
+        if value is None or value == "":
+            return None
+        if type_name == "int64":
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return None
+        if type_name == "bool":
+            return bool(value)
+        if type_name == "double":
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return None
+        if type_name.startswith("list"):
+            return [str(item) for item in value] if isinstance(value, list) else None
+        return str(value)
+
+    def _to_batch(self, jobs: List[Dict]):
+        """把一批职位转为RecordBatch"""
+        pa = self.pa
+        arrays = []
+        for field in self._schema:
+            type_name = str(field.type)
+            values = [self._normalize_value(job.get(field.name), type_name) for job in jobs]
+
+            if pa.types.is_dictionary(field.type):
+                arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+            else:
+                arrays.append(pa.array(values, type=field.type))
+
+        return pa.record_batch(arrays, schema=self._schema)
+
+    def _open_writer(self) -> None:
+        """创建底层写入器"""
+        if self.file_format == "arrow":
+            self._writer = self.pa.ipc.new_stream(self.file_path, self._schema)
+        else:
+            self._writer = self.pa.parquet.ParquetWriter(
+                self.file_path, self._schema, compression=self.compression
+            )
+
+    def write_jobs(self, jobs: List[Dict]) -> None:
+        """
+        缓冲职位，满一批后写入
+
+        Args:
+            jobs: 职位数据列表
+        """
+        self._buffer.extend(jobs)
+        while len(self._buffer) >= self.batch_size:
+            batch, self._buffer = self._buffer[:self.batch_size], self._buffer[self.batch_size:]
+            self._write_batch(batch)
+
+    def write_job(self, job: Dict) -> None:
+        """
+        写入单条职位
+
+        Args:
+            job: 职位数据
+        """
+        self.write_jobs([job])
+
+    def _write_batch(self, jobs: List[Dict]) -> None:
+        """写入一批职位"""
+        if not jobs:
+            return
+
+        if self._schema is None:
+            self._schema = self._build_schema(jobs)
+            self._open_writer()
+
+        batch = self._to_batch(jobs)
+        if self.file_format == "arrow":
+            self._writer.write_batch(batch)
+        else:
+            self._writer.write_table(self.pa.Table.from_batches([batch]))
+        self.jobs_written += len(jobs)
+
+    def flush(self) -> None:
+        """写入缓冲中不足一批的职位"""
+        self._write_batch(self._buffer)
+        self._buffer = []
+
+    def close(self) -> None:
+        """写入剩余职位并关闭文件"""
+        self.flush()
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        """上下文管理器入口"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """上下文管理器出口"""
+        self.close()
+
+
+def read_columnar_jobs(file_path: str, file_format: Optional[str] = None):
+    """
+    读取列式职位文件为 pyarrow.Table
+
+    Args:
+        file_path: 文件路径
+        file_format: "parquet" 或 "arrow"，为空则按扩展名判断
+
+    Returns:
+        pyarrow.Table: 职位表
+    """
+    pa = _import_pyarrow()
+    file_format = file_format or detect_columnar_format(file_path) or "parquet"
+
+    if file_format == "arrow":
+        with pa.ipc.open_stream(file_path) as reader:
+            return reader.read_all()
+    return pa.parquet.read_table(file_path)
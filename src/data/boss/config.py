@@ -1,20 +1,31 @@
 import os
 import json
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+from .code_tables import CodeTable, get_code_registry
 
 
 class BossConfig:
     """Boss直聘配置管理模块"""
     
     def __init__(self):
-        """初始化配置管理器"""
+        """初始化配置管理器（不读取任何文件）"""
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.city_codes = {}
+        self._city_codes: Optional[CodeTable] = None
+        self._district_store = None
         self.browser_config = self._get_default_browser_config()
         self.scraper_config = self._get_default_scraper_config()
-        
-        # 加载城市代码
-        self.load_city_codes()
+    
+    @property
+    def city_codes(self) -> CodeTable:
+        """城市代码表（第一次访问时加载，进程内所有实例共享同一份不可变代码表）"""
+        if self._city_codes is None:
+            self.load_city_codes()
+        return self._city_codes
+    
+    @city_codes.setter
+    def city_codes(self, city_codes: Dict) -> None:
+        """为当前实例单独指定城市代码（不影响其他实例）"""
+        self._city_codes = city_codes if isinstance(city_codes, CodeTable) else CodeTable(city_codes)
     
     def _get_default_browser_config(self) -> Dict:
         """获取默认浏览器配置"""
@@ -55,6 +66,9 @@ class BossConfig:
             "base_url": "https://www.zhipin.com/web/geek/jobs",
             "web_base_url": "https://www.zhipin.com",
             "api_base_url": "https://www.zhipin.com/wapi/zpgeek/search/joblist.json",
+            # 抓取方式: "browser" 渲染页面并监听数据包, "api" 直接请求接口（失败时回退到浏览器）
+            "fetch_mode": "browser",
+            # 请求节奏由 rate_limit 调度器控制；page_load 仅用于 capture.mode="sleep"，其余项保留以兼容旧配置文件
             "delays": {
                 "page_load": (3, 8),
                 "scroll": (2, 4),
@@ -66,44 +80,123 @@ class BossConfig:
                 "element_wait": 3,
                 "packet_wait": 10,
                 "packet_wait_scroll": 5,
-                "packet_wait_after_scroll": 3
+                "packet_wait_after_scroll": 3,
+                "api_request": 10
             },
             "limits": {
                 "max_scroll_times": 10,
                 "max_pages": 5,
-                "page_size": 15
+                "page_size": 15,
+                "api_pool_size": 4,
+                "workers": 3,
+                "max_rps": 1
+            },
+            "cache": {
+                "enabled": False,
+                "path": None,  # 为空则使用 result/response_cache.sqlite3
+                "ttl": 3600,
+                "max_size_mb": 200
+            },
+            "output": {
+                "stream": False,  # 是否边抓取边写入
+                "format": "jsonl",  # 流式输出格式: "jsonl"、"parquet" 或 "arrow"
+                "batch_size": 5000,  # Parquet/Arrow 每批写入的职位数
+                "compression": None,  # None、"gzip" 或 "zstd"
+                "fsync": "batch",  # "always"、"batch" 或 "never"
+                "fsync_every": 100,
+                "fsync_interval": 5
+            },
+            "storage": {
+                # 职位存储后端：None 只写JSON文件，"sqlite"/"mongo" 同时按 job_id 合并写入数据库
+                "backend": None,
+                "path": None,  # SQLite数据库路径，为空则使用 result/jobs.sqlite3
+                "batch_size": 1000,  # 每个事务（bulk_write）最多写入的职位数
+                "queue_size": 10000,  # SQLite写入队列长度（批），满时抓取线程等待
+                "uri": "mongodb://localhost:27017",
+                "database": "boss",
+                "collection": "jobs",
+                "flush_interval": 1.0,  # MongoDB缓冲区中职位最长等待秒数
+                "max_buffer": 10000  # MongoDB缓冲区上限（职位），满时抓取线程等待
+            },
+            "raw_archive": {
+                "enabled": True,  # 原始响应写入后台归档，替代每页覆盖 last_search_response.json
+                "sample_rate": 1.0,
+                "segment_max_mb": 64,
+                "max_total_mb": 512,
+                "max_age_days": 7
+            },
+            "capture": {
+                # "event" 收到并解析 joblist.json 即返回，"sleep" 旧版先固定等待 page_load 再等数据包
+                "mode": "event",
+                "deadline": 15  # 单页抓取（导航+等待数据包）最长耗时（秒）
+            },
+            "rate_limit": {
+                # 进程内所有爬虫共享的请求调度（首次创建爬虫时读取）
+                "target_qps": None,  # 每个主机的礼貌预算（次/秒），为空则使用 limits.max_rps
+                "session_qps": 0.5,  # 每个登录会话的上限
+                "burst": 1,
+                "backoff": 0.5,  # 访问受限（code 37）时速率乘数
+                "min_qps": 0.05,
+                "recovery": 0.05,  # 每次成功后速率增量
+                "cooldown": 30,  # 首次受限后暂停秒数，连续受限时加倍
+                "jitter": 0.3  # 等待时额外增加 0~jitter 个请求间隔的随机抖动
+            },
+            "checkpoint": {
+                # 批量/滚动搜索逐页记录断点；关闭时只有 resume=True 的运行会记录和恢复断点
+                "enabled": False,
+                "path": None  # 为空则使用 result/checkpoints.sqlite3
+            },
+            "delta": {
+                # 增量抓取：按 lastModifyTime/jobValidStatus 只输出新增和变化的职位
+                "enabled": False,
+                "path": None,  # 为空则使用 result/job_state.sqlite3
+                "stop_after_unchanged_pages": 1  # 连续多少页全部未变化后停止翻页，0表示不提前停止
+            },
+            "frontier": {
+                # 多关键词/城市/条件组合的任务队列
+                "path": None,  # 为空则使用 result/frontier.sqlite3
+                "max_attempts": 3,  # 每个单元最多尝试次数
+                "backoff": 60  # 首次重试前等待秒数，之后每次加倍
+            },
+            "partition": {
+                # 结果总数超过翻页上限的查询按筛选条件自动拆分
+                "max_results": None,  # 单个查询翻页能取到的职位数，为空则为 max_pages x page_size
+                "facets": ["salary", "experience", "degree", "scale", "stage", "district"],  # 拆分顺序
+                "max_partitions": 500  # 最多拆出的分区数（超过后剩余分区不再拆分）
+            },
+            "districts": {
+                "path": None,  # 为空则使用代码表目录下的 district_code_map.json
+                "ttl": 7 * 86400  # 城市商圈代码有效期（秒），过期后在预热时重新下载
             }
         }
     
-    def load_city_codes(self) -> Dict:
+    def load_city_codes(self) -> CodeTable:
         """
-        加载城市代码映射
+        加载城市代码映射（从进程共享的代码表注册中心获取）
         
         Returns:
-            Dict: 城市代码映射
+            CodeTable: 城市代码表
         """
+        registry = get_code_registry()
+        
         try:
-            city_file = os.path.join(self.script_dir, "city_code_map.json")
+            city_codes = registry.cities()
             
-            if os.path.exists(city_file):
-                with open(city_file, "r", encoding="utf-8") as f:
-                    self.city_codes = json.load(f)
-                print(f"✅ 加载城市代码: {len(self.city_codes)} 个城市")
-            else:
+            if city_codes is None:
                 print("城市代码文件不存在，正在生成...")
                 try:
-                    import codeCreator
-                    self.city_codes = codeCreator.getCityCodes()
-                    self.save_city_codes()
+                    from . import codeCreator
+                    self.save_city_codes(codeCreator.getCityCodes())
+                    city_codes = registry.cities()
                 except ImportError:
                     print("❌ 无法导入codeCreator模块")
-                    self.city_codes = {}
-                
+            
         except Exception as e:
             print(f"❌ 加载城市代码失败: {e}")
-            self.city_codes = {}
-            
-        return self.city_codes
+            city_codes = None
+        
+        self._city_codes = city_codes if city_codes is not None else CodeTable({})
+        return self._city_codes
     
     def save_city_codes(self, city_codes: Optional[Dict] = None) -> bool:
         """
@@ -116,11 +209,13 @@ class BossConfig:
             bool: 是否保存成功
         """
         try:
-            codes_to_save = city_codes or self.city_codes
-            city_file = os.path.join(self.script_dir, "city_code_map.json")
+            codes_to_save = dict(city_codes or self.city_codes)
+            registry = get_code_registry()
+            city_file = registry.path(registry.CITY_FILE)
             
             with open(city_file, "w", encoding="utf-8") as f:
                 json.dump(codes_to_save, f, ensure_ascii=False, indent=4)
+            registry.invalidate(registry.CITY_FILE)
             
             print(f"✅ 城市代码已保存: {city_file}")
             return True
@@ -141,9 +236,52 @@ class BossConfig:
         """
         return self.city_codes.get(city_name)
     
+    def get_city_name(self, city_code) -> Optional[str]:
+        """
+        根据城市代码反查城市名称（解码接口响应）
+        
+        Args:
+            city_code: 城市代码
+            
+        Returns:
+            str or None: 城市名称
+        """
+        return self.city_codes.name_of(city_code)
+    
+    def find_city(self, city_name: str, limit: int = 5) -> List[str]:
+        """
+        模糊/前缀查找城市名称，如 "上海市" -> ["上海"]
+        
+        Args:
+            city_name: 城市名称或前缀
+            limit: 最多返回条数
+            
+        Returns:
+            List[str]: 候选城市名称
+        """
+        return self.city_codes.find(city_name, limit)
+    
+    @property
+    def district_store(self):
+        """商圈代码库（按城市保存，同一文件路径在进程内共享）"""
+        if self._district_store is not None:
+            return self._district_store
+        
+        from .district_store import get_district_store
+        
+        registry = get_code_registry()
+        path = self.get_district_option("path") or registry.path("district_code_map.json")
+        ttl = self.get_district_option("ttl") or 7 * 86400
+        return get_district_store(path, ttl, legacy_path=registry.path(registry.DISTRICT_FILE))
+    
+    @district_store.setter
+    def district_store(self, store) -> None:
+        """为当前实例单独指定商圈代码库（不影响其他实例）"""
+        self._district_store = store
+    
     def get_business_district_code(self, city_name: str, district_name: str) -> Optional[str]:
         """
-        获取商圈代码
+        获取商圈代码（只查本地商圈代码库，不访问网络；未预热的城市返回None）
         
         Args:
             city_name: 城市名称
@@ -153,13 +291,24 @@ class BossConfig:
             str or None: 商圈代码
         """
         try:
-            import codeCreator
-            business_codes = codeCreator.getBusinessDistrictCodes(city_name)
-            return business_codes.get(district_name)
+            return self.district_store.get(city_name, district_name)
         except Exception as e:
             print(f"获取商圈代码失败: {e}")
             return None
     
+    def warm_up_districts(self, cities: List[str], force: bool = False) -> Dict[str, bool]:
+        """
+        批量预热商圈代码：下载缺失或过期城市的商圈数据并一次写入文件
+        
+        Args:
+            cities: 城市名称列表
+            force: 是否忽略有效期强制重新下载
+            
+        Returns:
+            Dict[str, bool]: 城市 -> 商圈代码是否可用
+        """
+        return self.district_store.warm_up(cities, self.city_codes, force=force)
+    
     def update_browser_config(self, **kwargs) -> None:
         """
         更新浏览器配置
@@ -220,7 +369,8 @@ class BossConfig:
                 self.update_scraper_config(**config['scraper'])
             
             if 'city_codes' in config:
-                self.city_codes.update(config['city_codes'])
+                # 共享代码表不可变，合并后作为当前实例的代码表
+                self.city_codes = {**self.city_codes, **config['city_codes']}
             
             print(f"✅ 配置已从文件加载: {config_file}")
             return True
@@ -243,7 +393,7 @@ class BossConfig:
             config = {
                 "browser": self.browser_config,
                 "scraper": self.scraper_config,
-                "city_codes": self.city_codes
+                "city_codes": dict(self.city_codes)
             }
             
             with open(config_file, 'w', encoding='utf-8') as f:
@@ -291,6 +441,11 @@ class BossConfig:
         """获取API基础URL"""
         return self.scraper_config["api_base_url"]
     
+    @property
+    def fetch_mode(self) -> str:
+        """获取抓取方式"""
+        return self.scraper_config.get("fetch_mode", "browser")
+    
     def get_delay(self, delay_type: str) -> tuple:
         """
         获取延时配置
@@ -315,6 +470,127 @@ class BossConfig:
         """
         return self.scraper_config["timeouts"].get(timeout_type, 10)
     
+    def get_cache_option(self, option: str):
+        """
+        获取响应缓存配置
+        
+        Args:
+            option: 配置项名称（enabled、path、ttl、max_size_mb）
+            
+        Returns:
+            配置值，不存在返回None
+        """
+        return self.scraper_config.get("cache", {}).get(option)
+    
+    def get_output_option(self, option: str):
+        """
+        获取输出配置
+        
+        Args:
+            option: 配置项名称（stream、format、batch_size、compression、fsync、fsync_every、fsync_interval）
+            
+        Returns:
+            配置值，不存在返回None
+        """
+        return self.scraper_config.get("output", {}).get(option)
+    
+    def get_storage_option(self, option: str):
+        """
+        获取职位存储配置
+        
+        Args:
+            option: 配置项名称（backend、path、batch_size、queue_size、uri、database、collection、
+                flush_interval、max_buffer）
+            
+        Returns:
+            配置值，不存在返回None
+        """
+        return self.scraper_config.get("storage", {}).get(option)
+    
+    def get_raw_archive_option(self, option: str):
+        """
+        获取原始响应归档配置
+        
+        Args:
+            option: 配置项名称（enabled、sample_rate、segment_max_mb、max_total_mb、max_age_days）
+            
+        Returns:
+            配置值，不存在返回None
+        """
+        return self.scraper_config.get("raw_archive", {}).get(option)
+    
+    def get_capture_option(self, option: str):
+        """
+        获取数据包捕获配置
+        
+        Args:
+            option: 配置项名称（mode、deadline）
+            
+        Returns:
+            配置值，不存在返回None
+        """
+        return self.scraper_config.get("capture", {}).get(option)
+    
+    def get_checkpoint_option(self, option: str):
+        """
+        获取抓取断点配置
+        
+        Args:
+            option: 配置项名称（enabled、path）
+            
+        Returns:
+            配置值，不存在返回None
+        """
+        return self.scraper_config.get("checkpoint", {}).get(option)
+    
+    def get_delta_option(self, option: str):
+        """
+        获取增量抓取配置
+        
+        Args:
+            option: 配置项名称（enabled、path、stop_after_unchanged_pages）
+            
+        Returns:
+            配置值，不存在返回None
+        """
+        return self.scraper_config.get("delta", {}).get(option)
+    
+    def get_frontier_option(self, option: str):
+        """
+        获取任务队列配置
+        
+        Args:
+            option: 配置项名称（path、max_attempts、backoff）
+            
+        Returns:
+            配置值，不存在返回None
+        """
+        return self.scraper_config.get("frontier", {}).get(option)
+    
+    def get_partition_option(self, option: str):
+        """
+        获取查询拆分配置
+        
+        Args:
+            option: 配置项名称（max_results、facets、max_partitions）
+            
+        Returns:
+            配置值，不存在返回None
+        """
+        return self.scraper_config.get("partition", {}).get(option)
+    
+    def get_district_option(self, option: str):
+        """
+        获取商圈代码库配置
+        
+        Args:
+            option: 配置项名称（path、ttl）
+            
+        Returns:
+            配置值，不存在返回None
+        """
+        return self.scraper_config.get("districts", {}).get(option)
+    
     def get_limit(self, limit_type: str) -> int:
         """
         获取限制配置
@@ -1,8 +1,18 @@
 import json
 import time
 import os
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from .config import BossConfig
+from .dedupe import BossDedupeIndex
+from .jsonl_writer import BossJsonlWriter, iter_jsonl_jobs
+from .raw_archive import BossRawArchive
+from .columnar_export import BossColumnarExporter, detect_columnar_format
+from .sqlite_store import BossSqliteStore
+from .mongo_store import BossMongoStore
+from .job_record import JobRecord, job_to_json
+from .salary import SalaryInfo, parse_salary
+from .summary import BossJobSummary
+from .job_index import BossJobFilter, BossJobIndex
 
 
 class BossDataProcessor:
@@ -16,8 +26,181 @@ class BossDataProcessor:
             config: 配置管理器实例
         """
         self.config = config or BossConfig()
+        
+        # 职位输出目标：实现 write_jobs(jobs)、flush()、close() 的对象
+        self.sinks: List = []
+        self._stream_writer: Optional[BossJsonlWriter] = None
+        self._storage = None
+        self._raw_archive: Optional[BossRawArchive] = None
     
-    def process_packets(self, packets, collected_packets: List, all_jobs: List) -> int:
+    def add_sink(self, sink) -> None:
+        """
+        添加职位输出目标，新职位产生时立即写入
+        
+        Args:
+            sink: 实现 write_jobs(jobs)、flush()、close() 的对象
+        """
+        self.sinks.append(sink)
+    
+    def remove_sink(self, sink) -> None:
+        """
+        移除职位输出目标（不会关闭它）
+        
+        Args:
+            sink: 输出目标
+        """
+        if sink in self.sinks:
+            self.sinks.remove(sink)
+    
+    def open_stream(self, file_path: Optional[str] = None, compression: Optional[str] = None,
+                    fsync: Optional[str] = None, file_format: Optional[str] = None):
+        """
+        打开流式输出，之后每个新职位都会立即写入（JSONL逐行追加，Parquet/Arrow按批写入）
+        
+        Args:
+            file_path: 输出文件路径，为空则在结果目录自动生成
+            compression: JSONL压缩格式 None、"gzip" 或 "zstd"，为空则使用配置
+            fsync: JSONL的fsync策略，为空则使用配置
+            file_format: "jsonl"、"parquet" 或 "arrow"，为空则按扩展名或配置判断
+            
+        Returns:
+            BossJsonlWriter 或 BossColumnarExporter: 流式写入器
+        """
+        self.close_stream()
+        
+        file_format = (
+            file_format
+            or (file_path and detect_columnar_format(file_path))
+            or self.config.get_output_option("format")
+            or "jsonl"
+        )
+        compression = compression or self.config.get_output_option("compression")
+        if not file_path:
+            if file_format == "jsonl":
+                suffix = ".jsonl" + {"gzip": ".gz", "zstd": ".zst"}.get(compression, "")
+            else:
+                suffix = f".{file_format}"
+            file_path = os.path.join(
+                self.config.get_result_dir(), f"jobs_stream_{int(time.time())}{suffix}"
+            )
+        
+        if file_format in ("parquet", "arrow"):
+            self._stream_writer = BossColumnarExporter(
+                file_path,
+                file_format=file_format,
+                batch_size=self.config.get_output_option("batch_size") or 5000,
+            )
+        else:
+            self._stream_writer = BossJsonlWriter(
+                file_path,
+                compression=compression,
+                fsync=fsync or self.config.get_output_option("fsync") or "batch",
+                fsync_every=self.config.get_output_option("fsync_every") or 100,
+                fsync_interval=self.config.get_output_option("fsync_interval") or 5,
+            )
+        self.add_sink(self._stream_writer)
+        print(f"✅ 职位流式输出: {file_path}")
+        return self._stream_writer
+    
+    def close_stream(self) -> None:
+        """关闭流式输出"""
+        if self._stream_writer:
+            self.remove_sink(self._stream_writer)
+            self._stream_writer.close()
+            self._stream_writer = None
+    
+    def open_storage(self, backend: Optional[str] = None, path: Optional[str] = None,
+                     collection=None):
+        """
+        打开职位存储后端，之后每个新职位都会交给后台线程写入
+        
+        Args:
+            backend: 存储后端 "sqlite" 或 "mongo"，为空则使用配置
+            path: SQLite数据库路径，为空则使用配置或 result/jobs.sqlite3
+            collection: MongoDB集合对象（如 mongomock 的集合），为空则按配置连接
+            
+        Returns:
+            BossSqliteStore 或 BossMongoStore: 职位存储
+        """
+        self.close_storage()
+        
+        backend = backend or self.config.get_storage_option("backend") or "sqlite"
+        batch_size = self.config.get_storage_option("batch_size") or 1000
+        if backend == "sqlite":
+            path = path or self.config.get_storage_option("path") or os.path.join(
+                self.config.get_result_dir(), "jobs.sqlite3"
+            )
+            self._storage = BossSqliteStore(
+                path,
+                batch_size=batch_size,
+                queue_size=self.config.get_storage_option("queue_size") or 10000,
+            )
+            target = path
+        elif backend == "mongo":
+            self._storage = BossMongoStore(
+                collection,
+                uri=self.config.get_storage_option("uri") or "mongodb://localhost:27017",
+                database=self.config.get_storage_option("database") or "boss",
+                collection_name=self.config.get_storage_option("collection") or "jobs",
+                batch_size=batch_size,
+                flush_interval=self.config.get_storage_option("flush_interval") or 1.0,
+                max_buffer=self.config.get_storage_option("max_buffer") or 10000,
+            )
+            target = self._storage.collection.full_name
+        else:
+            raise ValueError(f"不支持的存储后端: {backend}")
+        
+        self.add_sink(self._storage)
+        print(f"✅ 职位存储: {target}")
+        return self._storage
+    
+    def close_storage(self) -> None:
+        """写完并关闭职位存储"""
+        if self._storage:
+            self.remove_sink(self._storage)
+            self._storage.close()
+            self._storage = None
+    
+    @property
+    def storage(self):
+        """当前的职位存储（配置了存储后端时首次访问打开，否则为None）"""
+        if self._storage is None and self.config.get_storage_option("backend"):
+            self.open_storage()
+        return self._storage
+    
+    def _emit_jobs(self, jobs: List[Dict]) -> None:
+        """将新职位写入所有输出目标"""
+        if not jobs:
+            return
+        
+        if self._stream_writer is None and self.config.get_output_option("stream"):
+            self.open_stream()
+        if self._storage is None and self.config.get_storage_option("backend"):
+            self.open_storage()
+        
+        for sink in self.sinks:
+            try:
+                sink.write_jobs(jobs)
+            except Exception as e:
+                print(f"❌ 写入输出目标失败: {e}")
+    
+    def close(self) -> None:
+        """落盘并关闭所有输出目标"""
+        for sink in list(self.sinks):
+            try:
+                sink.close()
+            except Exception as e:
+                print(f"关闭输出目标时出错: {e}")
+        self.sinks = []
+        self._stream_writer = None
+        self._storage = None
+        
+        if self._raw_archive:
+            self._raw_archive.close()
+            self._raw_archive = None
+    
+    def process_packets(self, packets, collected_packets: List, all_jobs: List,
+                        dedupe_index: Optional[BossDedupeIndex] = None) -> int:
         """
         处理监听到的数据包
         
@@ -25,6 +208,7 @@ class BossDataProcessor:
             packets: 数据包或数据包列表
             collected_packets: 已处理数据包列表
             all_jobs: 所有职位列表
+            dedupe_index: 去重索引，由调用方在整个会话中持有；为空则根据all_jobs临时构建
             
         Returns:
             int: 新增职位数量
@@ -32,11 +216,18 @@ class BossDataProcessor:
         if not packets:
             return 0
         
+        # 未传入索引时兼容旧调用方式：按已有数据临时构建
+        if dedupe_index is None:
+            dedupe_index = BossDedupeIndex.from_jobs(all_jobs)
+            for collected in collected_packets:
+                dedupe_index.add_packet(collected)
+        
         packet_list = packets if isinstance(packets, list) else [packets]
         new_jobs_count = 0
         
         for packet in packet_list:
-            if packet in collected_packets:
+            fingerprint = dedupe_index.fingerprint_packet(packet)
+            if dedupe_index.contains_packet(packet, fingerprint):
                 continue
             
             try:
@@ -48,19 +239,19 @@ class BossDataProcessor:
                     job_list = zp_data.get("jobList", [])
                     
                     # 提取并去重职位数据
-                    existing_ids = {job.get("job_id") for job in all_jobs}
                     new_jobs = []
                     
                     for job in job_list:
                         job_id = job.get("encryptJobId", "")
-                        if job_id and job_id not in existing_ids:
+                        if dedupe_index.add_job(job_id):
                             job_info = self.extract_single_job(job)
                             new_jobs.append(job_info)
-                            existing_ids.add(job_id)
                     
                     all_jobs.extend(new_jobs)
+                    self._emit_jobs(new_jobs)
                     new_jobs_count += len(new_jobs)
                     collected_packets.append(packet)
+                    dedupe_index.add_packet(packet, fingerprint)
                     
             except Exception as e:
                 print(f"处理数据包失败: {e}")
@@ -68,7 +259,7 @@ class BossDataProcessor:
         
         return new_jobs_count
     
-    def extract_single_job(self, job: Dict) -> Dict:
+    def extract_single_job(self, job: Dict) -> JobRecord:
         """
         提取单个职位信息
         
@@ -76,75 +267,50 @@ class BossDataProcessor:
             job: 原始职位数据
             
         Returns:
-            Dict: 标准化的职位信息
-        """
-        return {
-            # 基础信息
-            "job_name": job.get("jobName", ""),
-            "salary_desc": job.get("salaryDesc", ""),
-            "job_degree": job.get("jobDegree", ""),
-            "job_experience": job.get("jobExperience", ""),
-            
-            # 地理信息
-            "city_name": job.get("cityName", ""),
-            "area_district": job.get("areaDistrict", ""),
-            "business_district": job.get("businessDistrict", ""),
-            
-            # 职位详情
-            "job_type": job.get("jobType", ""),
-            "job_labels": job.get("jobLabels", []),
-            "skills": job.get("skills", []),
-            "welfare_list": job.get("welfareList", []),
-            
-            # ID信息
-            "job_id": job.get("encryptJobId", ""),
-            "lid": job.get("lid", ""),
-            "security_id": job.get("securityId", ""),
-            "expect_id": job.get("expectId", ""),
-            
-            # 公司信息
-            "brand_name": job.get("brandName", ""),
-            "brand_logo": job.get("brandLogo", ""),
-            "brand_stage_name": job.get("brandStageName", ""),
-            "brand_industry": job.get("brandIndustry", ""),
-            "brand_scale_name": job.get("brandScaleName", ""),
-            "company_id": job.get("encryptBrandId", ""),
-            
-            # HR信息
-            "boss_name": job.get("bossName", ""),
-            "boss_title": job.get("bossTitle", ""),
-            "boss_avatar": job.get("bossAvatar", ""),
-            "boss_id": job.get("encryptBossId", ""),
+            JobRecord: 标准化的职位信息（可按字典访问，to_dict() 转为字典）
+        """
+        return JobRecord.from_raw(job)
+    
+    def normalize_salary(self, salary_desc: str) -> Dict:
+        """
+        标准化薪资描述（结果按描述缓存，extract_single_job 已为每个职位填好这些字段）
+        
+        Args:
+            salary_desc: 薪资描述，如 "15-25K·14薪"、"150-200元/天"
             
-            # 状态信息
-            "job_valid_status": job.get("jobValidStatus", ""),
-            "job_status_desc": job.get("jobStatusDesc", ""),
-            "contact_chat_im": job.get("contactChatIm", ""),
-            "last_modify_time": job.get("lastModifyTime", ""),
-            "prolong": job.get("prolong", ""),
-            "icon_word": job.get("iconWord", ""),
-        }
+        Returns:
+            Dict: salary_min、salary_max（月薪，千元）、salary_months、pay_type，面议等均为None
+        """
+        info = parse_salary(salary_desc or "")
+        if info is None:
+            return dict.fromkeys(SalaryInfo._fields)
+        return info._asdict()
     
-    def extract_job_list(self, job_list: List[Dict]) -> List[Dict]:
+    def extract_job_list(self, job_list: List[Dict],
+                         dedupe_index: Optional[BossDedupeIndex] = None) -> List[JobRecord]:
         """
         批量提取职位数据
         
         Args:
             job_list: 原始职位列表
+            dedupe_index: 去重索引，传入时跳过已见过的职位
             
         Returns:
-            List[Dict]: 标准化的职位数据列表
+            List[JobRecord]: 标准化的职位数据列表
         """
         jobs = []
         
         for job in job_list:
             try:
+                if dedupe_index is not None and not dedupe_index.add_job(job.get("encryptJobId", "")):
+                    continue
                 job_info = self.extract_single_job(job)
                 jobs.append(job_info)
             except Exception as e:
                 print(f"提取职位信息失败: {e}")
                 continue
         
+        self._emit_jobs(jobs)
         return jobs
     
     def validate_job_data(self, job: Dict) -> tuple[bool, str]:
@@ -197,79 +363,66 @@ class BossDataProcessor:
         
         return unique_jobs
     
-    def filter_jobs(self, jobs: List[Dict], filters: Dict) -> List[Dict]:
+    def build_job_index(self, jobs: List[Dict]) -> BossJobIndex:
         """
-        根据条件过滤职位
+        为职位列表建立索引，之后多次过滤无需逐个扫描职位
         
         Args:
             jobs: 职位列表
-            filters: 过滤条件
             
         Returns:
-            List[Dict]: 过滤后的职位列表
+            BossJobIndex: 职位索引
         """
-        filtered_jobs = []
-        
-        for job in jobs:
-            if self._job_matches_filters(job, filters):
-                filtered_jobs.append(job)
-        
-        return filtered_jobs
+        return BossJobIndex(jobs)
     
-    def _job_matches_filters(self, job: Dict, filters: Dict) -> bool:
+    def filter_jobs(self, jobs: List[Dict], filters, 
+                    index: Optional[BossJobIndex] = None) -> List[Dict]:
         """
-        检查职位是否匹配过滤条件
+        根据条件过滤职位
         
         Args:
-            job: 职位数据
-            filters: 过滤条件
+            jobs: 职位列表
+            filters: 过滤条件字典或已编译的 BossJobFilter
+            index: jobs 的索引（build_job_index 返回值），传入时按索引查询
             
         Returns:
-            bool: 是否匹配
+            List[Dict]: 过滤后的职位列表
         """
-        # 关键词过滤
-        if "keywords" in filters:
-            keywords = filters["keywords"]
-            if isinstance(keywords, str):
-                keywords = [keywords]
-            
-            job_text = f"{job.get('job_name', '')} {' '.join(job.get('job_labels', []))}"
-            if not any(keyword.lower() in job_text.lower() for keyword in keywords):
-                return False
-        
-        # 城市过滤
-        if "cities" in filters:
-            cities = filters["cities"]
-            if isinstance(cities, str):
-                cities = [cities]
-            
-            if job.get("city_name") not in cities:
-                return False
-        
-        # 公司规模过滤
-        if "scales" in filters:
-            scales = filters["scales"]
-            if isinstance(scales, str):
-                scales = [scales]
-            
-            if job.get("brand_scale_name") not in scales:
-                return False
+        plan = filters if isinstance(filters, BossJobFilter) else BossJobFilter(filters)
+        
+        if index is not None:
+            return index.filter(plan)
         
-        return True
+        return [job for job in jobs if plan.matches(job)]
     
     def save_jobs_data(self, jobs: List[Dict], filename: Optional[str] = None, 
-                      include_summary: bool = True) -> str:
+                      include_summary: bool = True,
+                      summary: Optional[BossJobSummary] = None) -> str:
         """
         保存职位数据到文件
         
+        流式输出已开启且未指定文件名时，职位已在产生时写入，这里只做落盘
+        （开启了存储后端时同样等待其写完）；
+        文件名以 .jsonl（可带 .gz/.zst）结尾时按行写入，以 .parquet/.arrow 结尾时
+        写入列式文件，两者都不包含汇总信息。
+        
         Args:
             jobs: 职位数据列表
             filename: 文件名，为空则自动生成
             include_summary: 是否包含汇总信息
+            summary: 调用方维护的增量汇总，只统计上次保存后新增的职位
             
         Returns:
             str: 保存的文件路径
         """
+        if self._storage:
+            self._storage.flush()
+        
+        if not filename and self._stream_writer:
+            self._stream_writer.flush()
+            print(f"✅ 职位数据已流式保存: {self._stream_writer.file_path}")
+            return self._stream_writer.file_path
+        
         result_dir = self.config.get_result_dir()
         
         if not filename:
@@ -278,6 +431,22 @@ class BossDataProcessor:
         
         file_path = os.path.join(result_dir, filename)
         
+        if ".jsonl" in filename or detect_columnar_format(filename):
+            try:
+                if ".jsonl" in filename:
+                    writer = BossJsonlWriter(file_path, fsync="never")
+                else:
+                    writer = BossColumnarExporter(
+                        file_path, batch_size=self.config.get_output_option("batch_size") or 5000
+                    )
+                with writer:
+                    writer.write_jobs(jobs)
+                print(f"✅ 职位数据已保存: {file_path}")
+                return file_path
+            except Exception as e:
+                print(f"❌ 保存职位数据失败: {e}")
+                raise
+        
         # 准备保存的数据
         save_data = {
             "total_jobs": len(jobs),
@@ -287,11 +456,11 @@ class BossDataProcessor:
         
         # 添加汇总信息
         if include_summary:
-            save_data["summary"] = self.generate_jobs_summary(jobs)
+            save_data["summary"] = self.generate_jobs_summary(jobs, summary)
         
         try:
             with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=4)
+                json.dump(save_data, f, ensure_ascii=False, indent=4, default=job_to_json)
             
             print(f"✅ 职位数据已保存: {file_path}")
             return file_path
@@ -324,60 +493,83 @@ class BossDataProcessor:
             print(f"❌ 保存响应数据失败: {e}")
             raise
     
-    def generate_jobs_summary(self, jobs: List[Dict]) -> Dict:
+    @property
+    def raw_archive(self) -> BossRawArchive:
+        """原始响应归档（首次访问时创建）"""
+        if self._raw_archive is None:
+            self._raw_archive = BossRawArchive(
+                os.path.join(self.config.get_result_dir(), "raw_archive"),
+                sample_rate=self.config.get_raw_archive_option("sample_rate"),
+                segment_max_bytes=int(self.config.get_raw_archive_option("segment_max_mb") * 1024 * 1024),
+                max_total_bytes=int(self.config.get_raw_archive_option("max_total_mb") * 1024 * 1024),
+                max_age_days=self.config.get_raw_archive_option("max_age_days"),
+            )
+        return self._raw_archive
+    
+    def archive_raw_response(self, response_data: Any, url: str = "") -> None:
         """
-        生成职位数据汇总信息
+        归档原始响应：开启归档时交给后台线程写入，否则沿用 save_raw_response
+        
+        Args:
+            response_data: 响应数据
+            url: 请求URL
+        """
+        if self.config.get_raw_archive_option("enabled"):
+            self.raw_archive.archive(response_data, url)
+        else:
+            self.save_raw_response(response_data)
+    
+    def generate_jobs_summary(self, jobs: List[Dict],
+                              summary: Optional[BossJobSummary] = None) -> Dict:
+        """
+        生成职位数据汇总信息（按列分组计数）
         
         Args:
             jobs: 职位数据列表
+            summary: 增量汇总，传入时只统计其尚未见过的尾部职位
             
         Returns:
-            Dict: 汇总信息
+            Dict: 汇总信息（城市/规模/学历/经验分布、薪资区间、热门技能/行业/公司）
         """
-        if not jobs:
-            return {}
-        
-        # 统计城市分布
-        city_stats = {}
-        for job in jobs:
-            city = job.get("city_name", "未知")
-            city_stats[city] = city_stats.get(city, 0) + 1
-        
-        # 统计公司规模分布
-        scale_stats = {}
-        for job in jobs:
-            scale = job.get("brand_scale_name", "未知")
-            scale_stats[scale] = scale_stats.get(scale, 0) + 1
-        
-        # 统计学历要求分布
-        degree_stats = {}
-        for job in jobs:
-            degree = job.get("job_degree", "未知")
-            degree_stats[degree] = degree_stats.get(degree, 0) + 1
+        if summary is None:
+            summary = BossJobSummary.from_jobs(jobs)
+        else:
+            summary.update(jobs)
+        return summary.to_dict()
+    
+    def iter_jobs_data(self, file_path: str) -> Iterator[Dict]:
+        """
+        逐条读取职位数据文件；JSONL文件（含 .gz/.zst）按行惰性读取
         
-        # 统计经验要求分布
-        experience_stats = {}
-        for job in jobs:
-            experience = job.get("job_experience", "未知")
-            experience_stats[experience] = experience_stats.get(experience, 0) + 1
-        
-        return {
-            "city_distribution": dict(sorted(city_stats.items(), key=lambda x: x[1], reverse=True)),
-            "scale_distribution": dict(sorted(scale_stats.items(), key=lambda x: x[1], reverse=True)),
-            "degree_distribution": dict(sorted(degree_stats.items(), key=lambda x: x[1], reverse=True)),
-            "experience_distribution": dict(sorted(experience_stats.items(), key=lambda x: x[1], reverse=True)),
-        }
+        Args:
+            file_path: 文件路径
+            
+        Yields:
+            Dict: 职位数据
+        """
+        if ".jsonl" in os.path.basename(file_path):
+            yield from iter_jsonl_jobs(file_path)
+        else:
+            yield from self.load_jobs_data(file_path)
     
     def load_jobs_data(self, file_path: str) -> List[Dict]:
         """
-        从文件加载职位数据
+        从文件一次性加载全部职位数据（为兼容旧调用方保持返回列表，JSONL文件也会全部读入内存；
+        只需逐条处理时使用 iter_jobs_data）
         
         Args:
-            file_path: 文件路径
+            file_path: 文件路径（JSON或JSONL）
             
         Returns:
             List[Dict]: 职位数据列表
         """
+        if ".jsonl" in os.path.basename(file_path):
+            try:
+                return list(iter_jsonl_jobs(file_path))
+            except Exception as e:
+                print(f"❌ 加载职位数据失败: {e}")
+                return []
+        
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
@@ -0,0 +1,155 @@
+import json
+import hashlib
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class BossDedupeIndex:
+    """Boss直聘增量去重索引
+
+    在一次爬取会话中持续持有，按插入顺序记录已见职位ID（encryptJobId）
+    和已处理数据包指纹，成员判断均为 O(1)。
+    """
+
+    def __init__(self, job_ids: Optional[List[str]] = None):
+        """
+        初始化去重索引
+
+        Args:
+            job_ids: 预先载入的职位ID列表
+        """
+        # dict 保留插入顺序，值无意义
+        self._job_ids: Dict[str, None] = {}
+        self._packet_fingerprints: Dict[str, None] = {}
+
+        for job_id in job_ids or []:
+            self.add_job(job_id)
+
+    @classmethod
+    def from_jobs(cls, jobs: List[Dict]) -> "BossDedupeIndex":
+        """
+        根据已标准化的职位列表构建索引
+
+        Args:
+            jobs: 职位数据列表（包含 job_id 字段）
+
+        Returns:
+            BossDedupeIndex: 去重索引
+        """
+        return cls([job.get("job_id") for job in jobs])
+
+    def add_job(self, job_id: str) -> bool:
+        """
+        添加职位ID
+
+        Args:
+            job_id: 职位ID（encryptJobId）
+
+        Returns:
+            bool: 是否为新职位（空ID或已存在返回False）
+        """
+        if not job_id or job_id in self._job_ids:
+            return False
+        self._job_ids[job_id] = None
+        return True
+
+    def contains_job(self, job_id: str) -> bool:
+        """
+        检查职位ID是否已存在
+
+        Args:
+            job_id: 职位ID
+
+        Returns:
+            bool: 是否已存在
+        """
+        return job_id in self._job_ids
+
+    @staticmethod
+    def fingerprint_packet(packet: Any) -> str:
+        """
+        计算数据包指纹（请求URL + 响应体哈希）
+
+        Args:
+            packet: DrissionPage数据包对象
+
+        Returns:
+            str: 指纹字符串
+        """
+        url = getattr(packet, "url", "") or ""
+
+        try:
+            body = packet.response.body
+        except Exception:
+            body = None
+
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        elif not isinstance(body, bytes):
+            body = json.dumps(body, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+
+        body_hash = hashlib.sha1(body).hexdigest()
+        return f"{url}#{body_hash}"
+
+    def add_packet(self, packet: Any, fingerprint: Optional[str] = None) -> bool:
+        """
+        记录数据包
+
+        Args:
+            packet: DrissionPage数据包对象
+            fingerprint: 已计算好的指纹，为空则现场计算
+
+        Returns:
+            bool: 是否为新数据包
+        """
+        fingerprint = fingerprint or self.fingerprint_packet(packet)
+        if fingerprint in self._packet_fingerprints:
+            return False
+        self._packet_fingerprints[fingerprint] = None
+        return True
+
+    def contains_packet(self, packet: Any, fingerprint: Optional[str] = None) -> bool:
+        """
+        检查数据包是否已处理
+
+        Args:
+            packet: DrissionPage数据包对象
+            fingerprint: 已计算好的指纹，为空则现场计算
+
+        Returns:
+            bool: 是否已处理
+        """
+        fingerprint = fingerprint or self.fingerprint_packet(packet)
+        return fingerprint in self._packet_fingerprints
+
+    @property
+    def job_count(self) -> int:
+        """已记录职位数"""
+        return len(self._job_ids)
+
+    @property
+    def packet_count(self) -> int:
+        """已记录数据包数"""
+        return len(self._packet_fingerprints)
+
+    def job_ids(self) -> List[str]:
+        """
+        获取按插入顺序排列的职位ID
+
+        Returns:
+            List[str]: 职位ID列表
+        """
+        return list(self._job_ids)
+
+    def clear(self) -> None:
+        """清空索引"""
+        self._job_ids.clear()
+        self._packet_fingerprints.clear()
+
+    def __contains__(self, job_id: str) -> bool:
+        return self.contains_job(job_id)
+
+    def __len__(self) -> int:
+        return self.job_count
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._job_ids)
@@ -0,0 +1,286 @@
+import os
+import json
+import time
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from .code_tables import CodeTable
+
+
+DISTRICT_API_URL = "https://www.zhipin.com/wapi/zpgeek/businessDistrict.json"
+
+
+def fetch_business_districts(city_code, timeout: float = 10) -> Tuple[Dict[str, int], List[str]]:
+    """
+    下载一个城市的区县/商圈代码（只请求商圈接口，不重新下载城市代码表）
+
+    Args:
+        city_code: 城市代码
+        timeout: 请求超时（秒）
+
+    Returns:
+        tuple: (区县及商圈名称 -> 代码, 区县名称列表)
+    """
+    import requests
+    from .codeCreator import traverse_hierarchical_data
+
+    response = requests.get(DISTRICT_API_URL, params={"cityCode": city_code}, timeout=timeout)
+    response.raise_for_status()
+    data = response.json()
+    if data.get("code") != 0:
+        raise ValueError(f"商圈接口返回错误: {data.get('message')}")
+
+    city = data["zpData"]["businessDistrict"]
+    result = {}
+    traverse_hierarchical_data([city], result, 5)
+    areas = [item["name"] for item in city.get("subLevelModelList") or [] if "name" in item]
+    return result, areas
+
+
+class BossDistrictStore:
+    """Boss直聘商圈代码库
+
+    按城市保存区县/商圈代码，多个城市共存于同一个JSON文件并带有抓取时间。
+    查询只读内存和本地文件，绝不访问网络，构建URL时不会产生额外请求；
+    需要的城市通过 warm_up 批量预热，过期（超过TTL）的城市在预热时重新下载。
+    """
+
+    def __init__(self, path: str, ttl: float = 7 * 86400,
+                 fetcher: Optional[Callable[[object], Union[Dict[str, int], Tuple]]] = None,
+                 legacy_path: Optional[str] = None):
+        """
+        初始化商圈代码库
+
+        Args:
+            path: 持久化文件路径
+            ttl: 城市商圈数据有效期（秒）
+            fetcher: 下载函数 city_code -> {名称: 代码} 或 ({名称: 代码}, 区县名称列表)，为空则请求商圈接口
+            legacy_path: 旧版单城市 business_code_map.json，库文件不存在时用于迁移
+        """
+        self.path = path
+        self.ttl = ttl
+        self.fetcher = fetcher or fetch_business_districts
+        self.legacy_path = legacy_path
+
+        self._lock = threading.RLock()
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._tables: Dict[str, CodeTable] = {}
+
+    def _load(self) -> Dict[str, Dict]:
+        """载入持久化文件（只在第一次访问时读取）"""
+        if self._entries is not None:
+            return self._entries
+
+        with self._lock:
+            if self._entries is not None:
+                return self._entries
+
+            entries = {}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        entries = json.load(f).get("cities", {})
+                except (OSError, ValueError) as e:
+                    print(f"❌ 读取商圈代码库失败: {e}")
+            elif self.legacy_path and os.path.exists(self.legacy_path):
+                entries = self._migrate_legacy()
+
+            self._entries = entries
+            return entries
+
+    def _migrate_legacy(self) -> Dict[str, Dict]:
+        """把旧版 business_code_map.json（顶层为城市本身）转为按城市保存的条目"""
+        try:
+            with open(self.legacy_path, "r", encoding="utf-8") as f:
+                districts = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not districts:
+            return {}
+
+        # 旧文件的第一项是城市节点本身
+        city_name, city_code = next(iter(districts.items()))
+        return {
+            city_name: {
+                "city_code": city_code,
+                "fetched_at": os.path.getmtime(self.legacy_path),
+                "districts": districts,
+            }
+        }
+
+    def _save(self) -> None:
+        """原子写入持久化文件"""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"cities": self._entries}, f, ensure_ascii=False, indent=4)
+        os.replace(tmp_path, self.path)
+
+    def table(self, city_name: str) -> Optional[CodeTable]:
+        """
+        获取城市的商圈代码表（不访问网络）
+
+        Args:
+            city_name: 城市名称
+
+        Returns:
+            CodeTable or None: 未预热的城市返回None
+        """
+        table = self._tables.get(city_name)
+        if table is not None:
+            return table
+
+        entry = self._load().get(city_name)
+        if entry is None:
+            return None
+
+        with self._lock:
+            table = self._tables.get(city_name)
+            if table is None:
+                table = CodeTable(entry["districts"])
+                self._tables[city_name] = table
+        return table
+
+    def get(self, city_name: str, district_name: str) -> Optional[int]:
+        """
+        查询商圈代码（不访问网络；已过期的数据照常返回）
+
+        Args:
+            city_name: 城市名称
+            district_name: 区县或商圈名称
+
+        Returns:
+            int or None: 商圈代码
+        """
+        table = self.table(city_name)
+        return table.get(district_name) if table is not None else None
+
+    def areas(self, city_name: str) -> List[str]:
+        """
+        城市的区县名称（不含商圈，用于按区县拆分查询；不访问网络）
+
+        Args:
+            city_name: 城市名称
+
+        Returns:
+            List[str]: 区县名称；旧数据没有层级信息时返回除城市本身外的全部名称
+        """
+        entry = self._load().get(city_name)
+        if entry is None:
+            return []
+        if entry.get("areas"):
+            return list(entry["areas"])
+        return [name for name in entry["districts"] if name != city_name]
+
+    def is_fresh(self, city_name: str) -> bool:
+        """
+        城市商圈数据是否存在且未过期
+
+        Args:
+            city_name: 城市名称
+
+        Returns:
+            bool: 是否新鲜
+        """
+        entry = self._load().get(city_name)
+        return entry is not None and time.time() - entry.get("fetched_at", 0) < self.ttl
+
+    def cities(self) -> List[str]:
+        """已保存的城市"""
+        return list(self._load())
+
+    def warm_up(self, cities: Iterable[str], city_codes: Dict[str, object],
+                force: bool = False) -> Dict[str, bool]:
+        """
+        批量预热：下载缺失或已过期城市的商圈代码，全部完成后一次写入文件
+
+        Args:
+            cities: 城市名称列表
+            city_codes: 城市名称 -> 城市代码
+            force: 是否忽略TTL强制重新下载
+
+        Returns:
+            Dict[str, bool]: 城市 -> 是否可用（已有新鲜数据或下载成功）
+        """
+        self._load()
+        status = {}
+        updated = False
+
+        for city_name in dict.fromkeys(cities):
+            if not force and self.is_fresh(city_name):
+                status[city_name] = True
+                continue
+
+            city_code = city_codes.get(city_name)
+            if city_code is None:
+                print(f"未找到城市: {city_name}")
+                status[city_name] = False
+                continue
+
+            try:
+                result = self.fetcher(city_code)
+            except Exception as e:
+                print(f"❌ 下载 {city_name} 商圈代码失败: {e}")
+                # 下载失败时保留旧数据
+                status[city_name] = city_name in self._entries
+                continue
+
+            districts, areas = result if isinstance(result, tuple) else (result, None)
+            with self._lock:
+                self._entries[city_name] = {
+                    "city_code": city_code,
+                    "fetched_at": time.time(),
+                    "districts": districts,
+                }
+                if areas:
+                    self._entries[city_name]["areas"] = areas
+                self._tables.pop(city_name, None)
+            status[city_name] = True
+            updated = True
+            print(f"✅ {city_name} 商圈代码: {len(districts)} 个")
+
+        if updated:
+            with self._lock:
+                self._save()
+
+        return status
+
+    def get_stats(self) -> Dict:
+        """
+        获取代码库统计
+
+        Returns:
+            Dict: 城市数、过期城市、文件路径
+        """
+        entries = self._load()
+        return {
+            "cities": len(entries),
+            "stale": [city for city in entries if not self.is_fresh(city)],
+            "path": self.path,
+        }
+
+
+_stores: Dict[str, BossDistrictStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_district_store(path: str, ttl: float = 7 * 86400,
+                       legacy_path: Optional[str] = None) -> BossDistrictStore:
+    """
+    获取进程内共享的商圈代码库（同一路径只创建一个）
+
+    Args:
+        path: 持久化文件路径
+        ttl: 有效期（秒）
+        legacy_path: 旧版 business_code_map.json 路径
+
+    Returns:
+        BossDistrictStore: 商圈代码库
+    """
+    path = os.path.abspath(path)
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = BossDistrictStore(path, ttl, legacy_path=legacy_path)
+            _stores[path] = store
+        store.ttl = ttl
+        return store
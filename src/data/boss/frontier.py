@@ -0,0 +1,438 @@
+import json
+import time
+import hashlib
+import sqlite3
+import itertools
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class BossCrawlFrontier:
+    """Boss直聘抓取任务队列
+
+    把多关键词、多城市、多条件的组合展开为工作单元（一组搜索参数 + 最大页数），
+    按参数去重后持久化到SQLite，按优先级分发给一个或多个爬虫。单元失败后按指数退避
+    重试，超过次数标记为失败；进程重启后未完成的单元会重新排队，每个单元内部的
+    翻页进度由爬虫的断点（resume=True）负责。新加入或重新排队（refresh）的单元第一次
+    执行前清除该单元之前留下的断点，从第1页重新抓取；重试和中断恢复的执行才续接断点。
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+
+    def __init__(self, db_path: str, max_attempts: int = 3, backoff: float = 60,
+                 url_builder=None):
+        """
+        初始化任务队列
+
+        Args:
+            db_path: SQLite数据库文件路径
+            max_attempts: 每个单元最多尝试次数
+            backoff: 首次重试前的等待秒数，之后每次加倍
+            url_builder: 用于标准化搜索参数的 BossUrlBuilder，为空则第一次使用时创建
+        """
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self._url_builder = url_builder
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS units (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                unit_key TEXT NOT NULL UNIQUE,
+                params TEXT NOT NULL,
+                priority INTEGER NOT NULL DEFAULT 0,
+                max_pages INTEGER,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL DEFAULT 0,
+                message TEXT NOT NULL DEFAULT '',
+                total_count INTEGER NOT NULL DEFAULT 0,
+                jobs INTEGER NOT NULL DEFAULT 0,
+                pages INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_units_ready ON units(status, priority DESC, seq);
+        """)
+        self._conn.commit()
+
+    @classmethod
+    def from_config(cls, config, url_builder=None) -> "BossCrawlFrontier":
+        """
+        根据配置创建任务队列
+
+        Args:
+            config: BossConfig 实例
+            url_builder: BossUrlBuilder 实例
+
+        Returns:
+            BossCrawlFrontier: 任务队列
+        """
+        import os
+
+        db_path = config.get_frontier_option("path") or os.path.join(
+            config.get_result_dir(), "frontier.sqlite3"
+        )
+        return cls(
+            db_path,
+            max_attempts=config.get_frontier_option("max_attempts"),
+            backoff=config.get_frontier_option("backoff"),
+            url_builder=url_builder,
+        )
+
+    @property
+    def url_builder(self):
+        """搜索参数标准化使用的URL构建器"""
+        if self._url_builder is None:
+            from .url_builder import BossUrlBuilder
+            self._url_builder = BossUrlBuilder()
+        return self._url_builder
+
+    @staticmethod
+    def make_unit_key(search_params: Dict) -> str:
+        """
+        工作单元键：标准化搜索参数（不含页码）的哈希
+
+        Args:
+            search_params: 搜索参数
+
+        Returns:
+            str: 单元键
+        """
+        params = {k: v for k, v in search_params.items() if k != "page"}
+        return hashlib.sha1(
+            json.dumps(params, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    @staticmethod
+    def expand_sweep(spec: Dict[str, Any]) -> List[Dict]:
+        """
+        把组合规格展开为参数组合（笛卡尔积）
+
+        Args:
+            spec: 参数名 -> 取值或取值列表，如 {"query": ["Python", "Java"], "city": ["上海", "北京"]}
+
+        Returns:
+            List[Dict]: 参数组合，按规格中键和取值的顺序排列
+        """
+        keys = list(spec)
+        values = [v if isinstance(v, (list, tuple)) else [v] for v in spec.values()]
+        return [dict(zip(keys, combo)) for combo in itertools.product(*values)]
+
+    def add_unit(self, search_params: Dict, priority: int = 0, max_pages: Optional[int] = None,
+                 refresh: bool = False) -> bool:
+        """
+        添加一个工作单元（参数已存在时不重复添加）
+
+        Args:
+            search_params: 搜索参数（会经 parse_search_params 标准化）
+            priority: 优先级，越大越先执行
+            max_pages: 该单元最多抓取页数，为空则使用爬虫配置
+            refresh: 已完成或已失败的相同单元是否重新排队（如每晚重跑）
+
+        Returns:
+            bool: 是否新加入队列（包括重新排队）
+        """
+        return self.add_units([search_params], priority, max_pages, refresh) == 1
+
+    def add_sweep(self, spec: Dict[str, Any], priority: int = 0, max_pages: Optional[int] = None,
+                  refresh: bool = False) -> int:
+        """
+        展开组合规格并加入队列
+
+        Args:
+            spec: 组合规格，见 expand_sweep
+            priority: 优先级
+            max_pages: 每个单元最多抓取页数
+            refresh: 已完成或已失败的相同单元是否重新排队
+
+        Returns:
+            int: 新加入队列的单元数
+        """
+        return self.add_units(self.expand_sweep(spec), priority, max_pages, refresh)
+
+    def add_units(self, params_list: Iterable[Dict], priority: int = 0, max_pages: Optional[int] = None,
+                  refresh: bool = False) -> int:
+        """
+        批量添加工作单元（一个事务）
+
+        Args:
+            params_list: 搜索参数列表
+            priority: 优先级
+            max_pages: 每个单元最多抓取页数
+            refresh: 已完成或已失败的相同单元是否重新排队
+
+        Returns:
+            int: 新加入队列的单元数
+        """
+        now = time.time()
+        rows = {}
+        for params in params_list:
+            normalized = self.url_builder.parse_search_params(**params)
+            normalized.pop("page", None)
+            rows.setdefault(self.make_unit_key(normalized), normalized)
+
+        added = 0
+        with self._lock:
+            with self._conn:
+                for unit_key, params in rows.items():
+                    cursor = self._conn.execute(
+                        "INSERT OR IGNORE INTO units (unit_key, params, priority, max_pages, status, updated_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (unit_key, json.dumps(params, ensure_ascii=False), priority, max_pages,
+                         self.STATUS_PENDING, now),
+                    )
+                    if not cursor.rowcount and refresh:
+                        cursor = self._conn.execute(
+                            "UPDATE units SET status = ?, attempts = 0, next_attempt_at = 0, message = '', "
+                            "priority = ?, max_pages = ?, updated_at = ? "
+                            "WHERE unit_key = ? AND status IN (?, ?)",
+                            (self.STATUS_PENDING, priority, max_pages, now, unit_key,
+                             self.STATUS_DONE, self.STATUS_FAILED),
+                        )
+                    added += cursor.rowcount
+        return added
+
+    def claim(self) -> Optional[Dict]:
+        """
+        取出优先级最高的可执行单元并标记为执行中
+
+        Returns:
+            Dict or None: 单元（unit_key、params、max_pages、attempts），没有可执行单元返回None
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT unit_key, params, max_pages, attempts FROM units "
+                "WHERE status = ? AND next_attempt_at <= ? ORDER BY priority DESC, seq LIMIT 1",
+                (self.STATUS_PENDING, now),
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._conn.execute(
+                "UPDATE units SET status = ?, attempts = attempts + 1, updated_at = ? WHERE unit_key = ?",
+                (self.STATUS_RUNNING, now, row[0]),
+            )
+            self._conn.commit()
+
+        return {"unit_key": row[0], "params": json.loads(row[1]), "max_pages": row[2], "attempts": row[3] + 1}
+
+    def complete(self, unit_key: str, result: Dict) -> None:
+        """
+        标记单元完成
+
+        Args:
+            unit_key: 单元键
+            result: batch_search 的结果
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE units SET status = ?, message = '', total_count = ?, jobs = ?, pages = ?, updated_at = ? "
+                "WHERE unit_key = ?",
+                (self.STATUS_DONE, result.get("total_count", 0), result.get("total_jobs", 0),
+                 result.get("pages_fetched", 0), time.time(), unit_key),
+            )
+            self._conn.commit()
+
+    def fail(self, unit_key: str, message: str) -> bool:
+        """
+        标记单元失败：未超过最多尝试次数时按指数退避重新排队
+
+        Args:
+            unit_key: 单元键
+            message: 失败原因
+
+        Returns:
+            bool: 是否会重试
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT attempts FROM units WHERE unit_key = ?", (unit_key,)).fetchone()
+            attempts = row[0] if row else self.max_attempts
+            retry = attempts < self.max_attempts
+
+            if retry:
+                self._conn.execute(
+                    "UPDATE units SET status = ?, next_attempt_at = ?, message = ?, updated_at = ? "
+                    "WHERE unit_key = ?",
+                    (self.STATUS_PENDING, now + self.backoff * 2 ** (attempts - 1), message, now, unit_key),
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE units SET status = ?, message = ?, updated_at = ? WHERE unit_key = ?",
+                    (self.STATUS_FAILED, message, now, unit_key),
+                )
+            self._conn.commit()
+        return retry
+
+    def recover(self) -> int:
+        """
+        把上次进程中断时仍在执行的单元放回队列
+
+        Returns:
+            int: 重新排队的单元数
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE units SET status = ?, updated_at = ? WHERE status = ?",
+                (self.STATUS_PENDING, time.time(), self.STATUS_RUNNING),
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def next_ready_in(self) -> Optional[float]:
+        """
+        距离下一个等待重试的单元可执行还有多少秒
+
+        Returns:
+            float or None: 秒数，没有待执行单元返回None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(next_attempt_at) FROM units WHERE status = ?", (self.STATUS_PENDING,)
+            ).fetchone()
+        if row[0] is None:
+            return None
+        return max(0.0, row[0] - time.time())
+
+    @staticmethod
+    def _reset_checkpoint(scraper, search_params: Dict) -> None:
+        """清除单元在爬虫断点库中的旧断点（爬虫没有断点库时跳过）"""
+        from .checkpoint import BossCheckpointStore
+
+        store = getattr(getattr(scraper, "scraper", scraper), "checkpoint_store", None)
+        if store is not None:
+            store.reset([BossCheckpointStore.make_run_key(search_params, BossCheckpointStore.KIND_BATCH)])
+
+    def run(self, scrapers: List, max_pages: Optional[int] = None,
+            on_result: Optional[Callable[[Dict, Dict], None]] = None) -> Dict:
+        """
+        用一个或多个已初始化的爬虫执行队列，直到没有待执行的单元
+
+        Args:
+            scrapers: BossScraper 或 BossJobScraper 实例列表，每个实例一个工作线程
+            max_pages: 单元未指定最大页数时使用的值
+            on_result: 每个单元成功后的回调 (单元, batch_search结果)
+
+        Returns:
+            Dict: 本次执行的完成、重试、失败单元数及耗时
+        """
+        recovered = self.recover()
+        if recovered:
+            print(f"重新排队上次中断的 {recovered} 个单元")
+
+        stats = {"completed": 0, "retried": 0, "failed": 0, "jobs": 0}
+        stats_lock = threading.Lock()
+        running = [0]
+        start_time = time.time()
+
+        def worker(scraper) -> None:
+            while True:
+                unit = self.claim()
+                if unit is None:
+                    with stats_lock:
+                        busy = running[0]
+                    wait = self.next_ready_in()
+                    if wait is None and not busy:
+                        return
+                    # 其他线程的单元可能失败后重新排队，稍后再看
+                    time.sleep(min(wait if wait is not None else 0.1, 1.0))
+                    continue
+
+                with stats_lock:
+                    running[0] += 1
+                try:
+                    # 第1次执行（新加入或 refresh 重新排队）从头抓取，不续接上一轮留下的断点
+                    if unit["attempts"] == 1:
+                        self._reset_checkpoint(scraper, unit["params"])
+                    result = scraper.batch_search(
+                        unit["params"], unit["max_pages"] or max_pages, resume=True
+                    )
+                except Exception as e:
+                    result = {"success": False, "message": f"搜索失败: {str(e)}"}
+
+                if result.get("success") and result.get("completed", True):
+                    self.complete(unit["unit_key"], result)
+                    key = "completed"
+                    if on_result:
+                        on_result(unit, result)
+                else:
+                    message = result.get("message") or result.get("error") or "本单元未完成"
+                    key = "retried" if self.fail(unit["unit_key"], message) else "failed"
+                    print(f"单元 {unit['params']} 第{unit['attempts']}次执行失败: {message}")
+
+                with stats_lock:
+                    running[0] -= 1
+                    stats[key] += 1
+                    if key == "completed":
+                        stats["jobs"] += result.get("total_jobs", 0)
+
+        threads = [threading.Thread(target=worker, args=(scraper,), daemon=True) for scraper in scrapers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats["elapsed"] = time.time() - start_time
+        print(f"✅ 任务队列执行完毕: 完成 {stats['completed']}，重试 {stats['retried']}，"
+              f"失败 {stats['failed']}，共 {stats['jobs']} 个职位")
+        return stats
+
+    def get_stats(self) -> Dict:
+        """
+        获取队列统计
+
+        Returns:
+            Dict: 各状态单元数及已抓取职位数
+        """
+        with self._lock:
+            counts = dict(self._conn.execute("SELECT status, COUNT(*) FROM units GROUP BY status").fetchall())
+            jobs = self._conn.execute("SELECT COALESCE(SUM(jobs), 0) FROM units").fetchone()[0]
+        return {
+            "pending": counts.get(self.STATUS_PENDING, 0),
+            "running": counts.get(self.STATUS_RUNNING, 0),
+            "done": counts.get(self.STATUS_DONE, 0),
+            "failed": counts.get(self.STATUS_FAILED, 0),
+            "jobs": jobs,
+        }
+
+    def list_units(self, status: Optional[str] = None) -> List[Dict]:
+        """
+        列出单元
+
+        Args:
+            status: 只列出该状态的单元，为空则全部
+
+        Returns:
+            List[Dict]: 单元信息（按执行顺序）
+        """
+        query = ("SELECT unit_key, params, priority, status, attempts, message, total_count, jobs, pages "
+                 "FROM units")
+        args: tuple = ()
+        if status:
+            query += " WHERE status = ?"
+            args = (status,)
+        query += " ORDER BY priority DESC, seq"
+
+        with self._lock:
+            rows = self._conn.execute(query, args).fetchall()
+        return [
+            {
+                "unit_key": row[0], "params": json.loads(row[1]), "priority": row[2], "status": row[3],
+                "attempts": row[4], "message": row[5], "total_count": row[6], "jobs": row[7], "pages": row[8],
+            }
+            for row in rows
+        ]
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        try:
+            self._conn.close()
+        except Exception as e:
+            print(f"关闭任务队列数据库时出错: {e}")
@@ -0,0 +1,237 @@
+import math
+from array import array
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def haversine_km(longitude1: float, latitude1: float, longitude2: float, latitude2: float) -> float:
+    """
+    两点间球面距离
+
+    Args:
+        longitude1: 第一点经度
+        latitude1: 第一点纬度
+        longitude2: 第二点经度
+        latitude2: 第二点纬度
+
+    Returns:
+        float: 距离（公里）
+    """
+    phi1 = math.radians(latitude1)
+    phi2 = math.radians(latitude2)
+    a = (math.sin((phi2 - phi1) / 2) ** 2
+         + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(longitude2 - longitude1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def job_coordinates(job: Dict) -> Optional[Tuple[float, float]]:
+    """
+    职位坐标
+
+    Args:
+        job: 标准化职位
+
+    Returns:
+        tuple or None: (经度, 纬度)，没有坐标返回None
+    """
+    longitude = job.get("longitude")
+    latitude = job.get("latitude")
+    if longitude is None or latitude is None:
+        return None
+    return longitude, latitude
+
+
+class BossGeoIndex:
+    """Boss直聘职位坐标索引
+
+    按经纬度把职位放入固定大小的网格（默认0.01度，约1公里），半径查询和矩形查询
+    只访问与查询范围相交的网格：完全落在范围内的网格整体命中，边缘网格再逐个判断。
+    职位列表只追加，数据包到达时可调用 add_jobs 增量建索引；没有坐标的职位占用下标
+    但不进入网格，与 BossJobIndex 的下标一致。
+    """
+
+    def __init__(self, jobs: Optional[Iterable[Dict]] = None, cell_size: float = 0.01):
+        """
+        初始化索引
+
+        Args:
+            jobs: 职位列表，索引保存其引用，下标与列表一致
+            cell_size: 网格边长（度）
+        """
+        self.cell_size = cell_size
+        self.jobs: List[Dict] = []
+        self._longitudes = array("d")
+        self._latitudes = array("d")
+        self._cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        self.located = 0
+
+        if jobs:
+            self.add_jobs(jobs)
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def _cell(self, longitude: float, latitude: float) -> Tuple[int, int]:
+        """坐标所在网格"""
+        return math.floor(longitude / self.cell_size), math.floor(latitude / self.cell_size)
+
+    def add_jobs(self, jobs: Iterable[Dict]) -> None:
+        """
+        追加职位并更新索引
+
+        Args:
+            jobs: 新职位
+        """
+        cells = self._cells
+        for position, job in enumerate(jobs, len(self.jobs)):
+            self.jobs.append(job)
+            coordinates = job_coordinates(job)
+            if coordinates is None:
+                self._longitudes.append(math.nan)
+                self._latitudes.append(math.nan)
+                continue
+
+            longitude, latitude = coordinates
+            self._longitudes.append(longitude)
+            self._latitudes.append(latitude)
+            cells[self._cell(longitude, latitude)].append(position)
+            self.located += 1
+
+    def _candidate_cells(self, min_longitude: float, min_latitude: float,
+                         max_longitude: float, max_latitude: float) -> Iterable[Tuple[Tuple[int, int], bool]]:
+        """
+        与矩形相交的非空网格
+
+        Returns:
+            (网格, 是否完全在矩形内)
+        """
+        min_x, min_y = self._cell(min_longitude, min_latitude)
+        max_x, max_y = self._cell(max_longitude, max_latitude)
+        cell_size = self.cell_size
+
+        def inside(x: int, y: int) -> bool:
+            return (x * cell_size >= min_longitude and (x + 1) * cell_size <= max_longitude
+                    and y * cell_size >= min_latitude and (y + 1) * cell_size <= max_latitude)
+
+        # 范围内的网格比非空网格还多时（大范围查询）直接遍历非空网格
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(self._cells):
+            for cell in self._cells:
+                x, y = cell
+                if min_x <= x <= max_x and min_y <= y <= max_y:
+                    yield cell, inside(x, y)
+            return
+
+        cells = self._cells
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                if (x, y) in cells:
+                    yield (x, y), inside(x, y)
+
+    def query_bbox(self, min_longitude: float, min_latitude: float,
+                   max_longitude: float, max_latitude: float) -> List[int]:
+        """
+        矩形范围内的职位下标
+
+        Args:
+            min_longitude: 最小经度
+            min_latitude: 最小纬度
+            max_longitude: 最大经度
+            max_latitude: 最大纬度
+
+        Returns:
+            List[int]: 升序的职位下标
+        """
+        longitudes = self._longitudes
+        latitudes = self._latitudes
+        result = []
+        for cell, inside in self._candidate_cells(min_longitude, min_latitude, max_longitude, max_latitude):
+            positions = self._cells[cell]
+            if inside:
+                result.extend(positions)
+            else:
+                result.extend(
+                    i for i in positions
+                    if min_longitude <= longitudes[i] <= max_longitude and min_latitude <= latitudes[i] <= max_latitude
+                )
+        result.sort()
+        return result
+
+    def _radius_distances(self, longitude: float, latitude: float, radius_km: float) -> List[Tuple[float, int]]:
+        """半径范围内的 (距离, 下标)"""
+        delta_latitude = radius_km / KM_PER_DEGREE
+        delta_longitude = radius_km / (KM_PER_DEGREE * max(math.cos(math.radians(latitude)), 1e-6))
+        longitudes = self._longitudes
+        latitudes = self._latitudes
+
+        result = []
+        for cell, _ in self._candidate_cells(longitude - delta_longitude, latitude - delta_latitude,
+                                             longitude + delta_longitude, latitude + delta_latitude):
+            for i in self._cells[cell]:
+                distance = haversine_km(longitude, latitude, longitudes[i], latitudes[i])
+                if distance <= radius_km:
+                    result.append((distance, i))
+        return result
+
+    def query_radius(self, longitude: float, latitude: float, radius_km: float) -> List[int]:
+        """
+        距离某点 radius_km 公里以内的职位下标
+
+        Args:
+            longitude: 经度
+            latitude: 纬度
+            radius_km: 半径（公里）
+
+        Returns:
+            List[int]: 升序的职位下标
+        """
+        return sorted(i for _, i in self._radius_distances(longitude, latitude, radius_km))
+
+    def within_radius(self, longitude: float, latitude: float, radius_km: float) -> List[Tuple[Dict, float]]:
+        """
+        距离某点 radius_km 公里以内的职位，由近到远
+
+        Args:
+            longitude: 经度
+            latitude: 纬度
+            radius_km: 半径（公里）
+
+        Returns:
+            List[tuple]: (职位, 距离公里)
+        """
+        jobs = self.jobs
+        return [(jobs[i], distance) for distance, i in sorted(self._radius_distances(longitude, latitude, radius_km))]
+
+    def within_bbox(self, min_longitude: float, min_latitude: float,
+                    max_longitude: float, max_latitude: float) -> List[Dict]:
+        """
+        矩形范围内的职位（保持原顺序）
+
+        Args:
+            min_longitude: 最小经度
+            min_latitude: 最小纬度
+            max_longitude: 最大经度
+            max_latitude: 最大纬度
+
+        Returns:
+            List[Dict]: 职位
+        """
+        jobs = self.jobs
+        return [jobs[i] for i in self.query_bbox(min_longitude, min_latitude, max_longitude, max_latitude)]
+
+    def get_stats(self) -> Dict:
+        """
+        获取索引统计
+
+        Returns:
+            Dict: 职位数、有坐标的职位数、非空网格数、单个网格最多职位数
+        """
+        return {
+            "jobs": len(self.jobs),
+            "located": self.located,
+            "cells": len(self._cells),
+            "max_cell_jobs": max((len(positions) for positions in self._cells.values()), default=0),
+        }
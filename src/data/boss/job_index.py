@@ -0,0 +1,425 @@
+import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from .geo_index import BossGeoIndex, haversine_km, job_coordinates
+from .salary import PAY_MONTHLY, job_salary, parse_salary
+
+
+INFINITY = float("inf")
+
+_EXPERIENCE_RANGE = re.compile(r"(\d+)\s*-\s*(\d+)\s*年")
+_EXPERIENCE_BELOW = re.compile(r"(\d+)\s*年以内")
+_EXPERIENCE_ABOVE = re.compile(r"(\d+)\s*年以上")
+
+# 每个字节中被置位的比特位置，用于把位图转换为下标
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256))
+
+
+@lru_cache(maxsize=256)
+def parse_experience_range(experience: str) -> Optional[Tuple[float, float]]:
+    """
+    解析经验要求为年限区间
+
+    Args:
+        experience: 经验要求，如 "1-3年"、"1年以内"、"10年以上"、"经验不限"、"应届生"
+
+    Returns:
+        tuple or None: (最少年限, 最多年限)，无法解析返回None
+    """
+    experience = experience or ""
+    match = _EXPERIENCE_RANGE.search(experience)
+    if match:
+        return float(match.group(1)), float(match.group(2))
+    match = _EXPERIENCE_BELOW.search(experience)
+    if match:
+        return 0.0, float(match.group(1))
+    match = _EXPERIENCE_ABOVE.search(experience)
+    if match:
+        return float(match.group(1)), INFINITY
+    if "不限" in experience:
+        return 0.0, INFINITY
+    if "应届" in experience or "在校" in experience:
+        return 0.0, 0.0
+    return None
+
+
+def _as_list(value) -> List:
+    """字符串统一为单元素列表"""
+    if value is None:
+        return []
+    if isinstance(value, (str, bytes)):
+        return [value]
+    return list(value)
+
+
+def _as_range(value) -> Tuple[float, float]:
+    """(下限, 上限) 或单个下限，None 表示不限"""
+    if isinstance(value, (int, float)):
+        return float(value), INFINITY
+    lower, upper = value
+    return (
+        -INFINITY if lower is None else float(lower),
+        INFINITY if upper is None else float(upper),
+    )
+
+
+def _overlaps(parsed: Optional[Tuple], lower: float, upper: float) -> bool:
+    """解析出的区间是否与查询区间相交"""
+    return parsed is not None and parsed[0] <= upper and parsed[1] >= lower
+
+
+def _job_text(job: Dict) -> str:
+    """关键词匹配文本：职位名 + 职位标签（小写）"""
+    return f"{job.get('job_name', '')} {' '.join(job.get('job_labels', []) or [])}".lower()
+
+
+def _ngrams(text: str) -> Iterable[str]:
+    """文本中的单字和二元组（中文没有分词边界，按字符切分）"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def _keyword_grams(keyword: str) -> List[str]:
+    """关键词需要同时命中的n-gram"""
+    if len(keyword) == 1:
+        return [keyword]
+    return [keyword[i:i + 2] for i in range(len(keyword) - 1)]
+
+
+class _Postings:
+    """值 -> 职位下标列表，按需生成并缓存位图（Python整数）"""
+
+    def __init__(self):
+        self.positions: Dict = defaultdict(list)
+        self._bitmaps: Dict = {}
+
+    def add(self, value, position: int) -> None:
+        self.positions[value].append(position)
+
+    def invalidate(self) -> None:
+        self._bitmaps.clear()
+
+    def bitmap(self, value) -> int:
+        bitmap = self._bitmaps.get(value)
+        if bitmap is None:
+            bitmap = _to_bitmap(self.positions.get(value, ()))
+            self._bitmaps[value] = bitmap
+        return bitmap
+
+    def values(self):
+        return self.positions.keys()
+
+
+def _to_bitmap(positions: Sequence[int]) -> int:
+    """下标列表转为位图"""
+    if not positions:
+        return 0
+    buffer = bytearray(max(positions) // 8 + 1)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def _to_indices(bitmap: int) -> List[int]:
+    """位图转为升序下标列表（只遍历非零字节）"""
+    indices = []
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for byte_index, byte in enumerate(data):
+        if byte:
+            base = byte_index << 3
+            indices.extend(base + bit for bit in _BYTE_BITS[byte])
+    return indices
+
+
+class BossJobIndex:
+    """Boss直聘职位索引
+
+    为一组职位建立倒排索引，反复用不同条件过滤时无需逐个扫描职位：
+        - 城市、规模、学历、经验：按取值的位图索引
+        - 关键词：职位名+标签文本的单字/二元组倒排索引，候选集再做一次子串校验，
+          结果与逐条 `keyword in job_text` 完全一致
+        - 技能：小写技能词的倒排索引
+        - 薪资、经验年限：按不同取值解析一次，范围查询合并相交取值的位图
+        - 坐标：经纬度网格索引（BossGeoIndex），半径和矩形查询只检查相交的网格
+    职位列表只追加时可调用 add_jobs 增量建索引。
+    """
+
+    # 过滤条件 -> 等值位图索引字段
+    EQUALITY_FILTERS = {
+        "cities": "city_name",
+        "scales": "brand_scale_name",
+        "degrees": "job_degree",
+        "experiences": "job_experience",
+    }
+
+    def __init__(self, jobs: Optional[List[Dict]] = None):
+        """
+        初始化索引
+
+        Args:
+            jobs: 职位列表，索引保存其引用，下标与列表一致
+        """
+        self.jobs: List[Dict] = []
+        self._texts: List[str] = []
+        self._fields = {field: _Postings() for field in self.EQUALITY_FILTERS.values()}
+        self._salary = _Postings()
+        self._grams = _Postings()
+        self._skills = _Postings()
+        self.geo = BossGeoIndex()
+        self._all = 0
+
+        if jobs:
+            self.add_jobs(jobs)
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def add_jobs(self, jobs: Iterable[Dict]) -> None:
+        """
+        追加职位并更新索引
+
+        Args:
+            jobs: 新职位
+        """
+        start = len(self.jobs)
+        for position, job in enumerate(jobs, start):
+            self.jobs.append(job)
+
+            for field, postings in self._fields.items():
+                postings.add(job.get(field), position)
+            self._salary.add(job.get("salary_desc") or "", position)
+
+            text = _job_text(job)
+            self._texts.append(text)
+            for gram in _ngrams(text):
+                self._grams.add(gram, position)
+
+            for skill in {str(skill).lower() for skill in job.get("skills") or ()}:
+                self._skills.add(skill, position)
+
+        self.geo.add_jobs(self.jobs[start:])
+
+        for postings in (*self._fields.values(), self._salary, self._grams, self._skills):
+            postings.invalidate()
+        self._all = (1 << len(self.jobs)) - 1
+
+    def _equality(self, field: str, values: List) -> int:
+        """等值条件（任一取值）"""
+        postings = self._fields[field]
+        bitmap = 0
+        for value in values:
+            bitmap |= postings.bitmap(value)
+        return bitmap
+
+    def _keywords(self, keywords: List[str], candidates: int) -> int:
+        """关键词条件（任一关键词），先用n-gram位图缩小候选集，再做子串校验"""
+        result = 0
+        for keyword in keywords:
+            if not keyword:
+                return candidates
+
+            bitmap = candidates
+            for gram in _keyword_grams(keyword):
+                bitmap &= self._grams.bitmap(gram)
+                if not bitmap:
+                    break
+            bitmap &= ~result
+
+            if bitmap:
+                texts = self._texts
+                matched = [i for i in _to_indices(bitmap) if keyword in texts[i]]
+                result |= _to_bitmap(matched)
+        return result
+
+    def _skills_any(self, skills: List[str]) -> int:
+        """技能条件（任一技能，不区分大小写）"""
+        bitmap = 0
+        for skill in skills:
+            bitmap |= self._skills.bitmap(skill)
+        return bitmap
+
+    def _salary_range(self, lower: float, upper: float) -> int:
+        """月薪范围（千元），与职位薪资区间相交即命中，面议/日薪等不命中"""
+        bitmap = 0
+        for desc in self._salary.values():
+            info = parse_salary(desc)
+            if info and info.pay_type == PAY_MONTHLY and _overlaps(info, lower, upper):
+                bitmap |= self._salary.bitmap(desc)
+        return bitmap
+
+    def _experience_range(self, lower: float, upper: float) -> int:
+        """经验年限范围，与职位要求区间相交即命中"""
+        postings = self._fields["job_experience"]
+        bitmap = 0
+        for experience in postings.values():
+            if _overlaps(parse_experience_range(experience), lower, upper):
+                bitmap |= postings.bitmap(experience)
+        return bitmap
+
+    def query(self, filters) -> List[int]:
+        """
+        查询匹配的职位下标
+
+        Args:
+            filters: 过滤条件字典或 BossJobFilter
+
+        Returns:
+            List[int]: 升序的职位下标
+        """
+        plan = filters if isinstance(filters, BossJobFilter) else BossJobFilter(filters)
+        return _to_indices(plan.execute(self))
+
+    def filter(self, filters) -> List[Dict]:
+        """
+        查询匹配的职位
+
+        Args:
+            filters: 过滤条件字典或 BossJobFilter
+
+        Returns:
+            List[Dict]: 匹配的职位（保持原顺序）
+        """
+        jobs = self.jobs
+        return [jobs[i] for i in self.query(filters)]
+
+
+class BossJobFilter:
+    """编译后的过滤条件
+
+    条件在编译时统一规范化（字符串转列表、关键词小写、范围转数值），之后可以
+    在 BossJobIndex 上按位图执行，也可以作为单个职位的判定函数使用。
+
+    支持的条件（均可选，多个条件之间为“且”，同一条件的多个取值为“或”）：
+        keywords:         职位名或标签包含任一关键词（不区分大小写）
+        cities:           城市
+        scales:           公司规模
+        degrees:          学历要求
+        experiences:      经验要求（原始取值，如 "1-3年"）
+        skills:           包含任一技能（不区分大小写）
+        salary_range:     月薪范围（千元），(下限, 上限)，None 表示不限；也可只给下限
+        experience_range: 经验年限范围，(下限, 上限)
+        near:             距离某点一定范围内，(经度, 纬度, 半径公里)，没有坐标的职位不命中
+        bbox:             经纬度矩形内，(最小经度, 最小纬度, 最大经度, 最大纬度)
+    """
+
+    def __init__(self, filters: Optional[Dict] = None):
+        """
+        编译过滤条件
+
+        Args:
+            filters: 过滤条件
+        """
+        filters = filters or {}
+        unknown = set(filters) - {
+            "keywords", "skills", "salary_range", "experience_range", "near", "bbox",
+            *BossJobIndex.EQUALITY_FILTERS,
+        }
+        if unknown:
+            print(f"忽略不支持的过滤条件: {', '.join(sorted(unknown))}")
+
+        self.keywords = (
+            [keyword.lower() for keyword in _as_list(filters["keywords"])]
+            if "keywords" in filters else None
+        )
+        self.equality = {
+            BossJobIndex.EQUALITY_FILTERS[name]: _as_list(values)
+            for name, values in filters.items() if name in BossJobIndex.EQUALITY_FILTERS
+        }
+        self.equality_sets = {field: set(values) for field, values in self.equality.items()}
+        self.skills = (
+            [str(skill).lower() for skill in _as_list(filters["skills"])]
+            if "skills" in filters else None
+        )
+        self.salary_range = _as_range(filters["salary_range"]) if "salary_range" in filters else None
+        self.experience_range = (
+            _as_range(filters["experience_range"]) if "experience_range" in filters else None
+        )
+        self.near = tuple(float(value) for value in filters["near"]) if "near" in filters else None
+        self.bbox = tuple(float(value) for value in filters["bbox"]) if "bbox" in filters else None
+
+    def execute(self, index: BossJobIndex) -> int:
+        """
+        在索引上执行，返回结果位图（先执行位图条件，关键词最后在候选集上校验）
+
+        Args:
+            index: 职位索引
+
+        Returns:
+            int: 结果位图
+        """
+        bitmap = index._all
+        for field, values in self.equality.items():
+            bitmap &= index._equality(field, values)
+        if self.skills is not None:
+            bitmap &= index._skills_any(self.skills)
+        if self.salary_range is not None:
+            bitmap &= index._salary_range(*self.salary_range)
+        if self.experience_range is not None:
+            bitmap &= index._experience_range(*self.experience_range)
+        if self.bbox is not None and bitmap:
+            bitmap &= _to_bitmap(index.geo.query_bbox(*self.bbox))
+        if self.near is not None and bitmap:
+            bitmap &= _to_bitmap(index.geo.query_radius(*self.near))
+        if self.keywords is not None and bitmap:
+            bitmap = index._keywords(self.keywords, bitmap)
+        return bitmap
+
+    def matches(self, job: Dict) -> bool:
+        """
+        判断单个职位是否匹配
+
+        Args:
+            job: 职位数据
+
+        Returns:
+            bool: 是否匹配
+        """
+        for field, values in self.equality_sets.items():
+            if job.get(field) not in values:
+                return False
+
+        if self.skills is not None:
+            job_skills = {str(skill).lower() for skill in job.get("skills") or ()}
+            if job_skills.isdisjoint(self.skills):
+                return False
+
+        if self.salary_range is not None:
+            lower, upper = self.salary_range
+            salary_min = job.get("salary_min")
+            if salary_min is not None:
+                # 已有数值字段，直接比较
+                if not (job.get("pay_type") == PAY_MONTHLY and salary_min <= upper
+                        and job.get("salary_max") >= lower):
+                    return False
+            else:
+                info = job_salary(job)
+                if not (info and info.pay_type == PAY_MONTHLY and _overlaps(info, lower, upper)):
+                    return False
+
+        if self.experience_range is not None:
+            if not _overlaps(parse_experience_range(job.get("job_experience") or ""), *self.experience_range):
+                return False
+
+        if self.near is not None or self.bbox is not None:
+            coordinates = job_coordinates(job)
+            if coordinates is None:
+                return False
+            longitude, latitude = coordinates
+            if self.bbox is not None:
+                min_longitude, min_latitude, max_longitude, max_latitude = self.bbox
+                if not (min_longitude <= longitude <= max_longitude and min_latitude <= latitude <= max_latitude):
+                    return False
+            if self.near is not None and haversine_km(self.near[0], self.near[1], longitude, latitude) > self.near[2]:
+                return False
+
+        if self.keywords is not None:
+            text = _job_text(job)
+            if not any(keyword in text for keyword in self.keywords):
+                return False
+
+        return True
+
+    def __call__(self, job: Dict) -> bool:
+        return self.matches(job)
@@ -0,0 +1,239 @@
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from .salary import SalaryInfo, parse_salary
+
+
+def _coordinate(value: Any) -> Optional[float]:
+    """经纬度转为浮点数，缺失、无法解析或为0时返回None"""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return None
+    return value or None
+
+
+class JobRecord:
+    """Boss直聘标准化职位记录
+
+    使用 __slots__ 存储字段，不为每个职位分配字典；城市、学历、经验、规模、
+    行业等取值有限的字符串会被驻留（sys.intern），所有职位共享同一个对象。
+    提供 get/[]/keys/items 等只读字典接口，旧代码按字典访问无需修改，
+    需要真正的字典时调用 to_dict()。
+    """
+
+    # (字段名, 原始字段名, 缺省值)，顺序即 to_dict 的键顺序
+    FIELDS: Tuple[Tuple[str, str, Any], ...] = (
+        # 基础信息
+        ("job_name", "jobName", ""),
+        ("salary_desc", "salaryDesc", ""),
+        ("salary_min", None, None),
+        ("salary_max", None, None),
+        ("salary_months", None, None),
+        ("pay_type", None, None),
+        ("job_degree", "jobDegree", ""),
+        ("job_experience", "jobExperience", ""),
+
+        # 地理信息
+        ("city_name", "cityName", ""),
+        ("area_district", "areaDistrict", ""),
+        ("business_district", "businessDistrict", ""),
+        ("longitude", "gps.longitude", None),
+        ("latitude", "gps.latitude", None),
+
+        # 职位详情
+        ("job_type", "jobType", ""),
+        ("job_labels", "jobLabels", None),
+        ("skills", "skills", None),
+        ("welfare_list", "welfareList", None),
+
+        # ID信息
+        ("job_id", "encryptJobId", ""),
+        ("lid", "lid", ""),
+        ("security_id", "securityId", ""),
+        ("expect_id", "expectId", ""),
+
+        # 公司信息
+        ("brand_name", "brandName", ""),
+        ("brand_logo", "brandLogo", ""),
+        ("brand_stage_name", "brandStageName", ""),
+        ("brand_industry", "brandIndustry", ""),
+        ("brand_scale_name", "brandScaleName", ""),
+        ("company_id", "encryptBrandId", ""),
+
+        # HR信息
+        ("boss_name", "bossName", ""),
+        ("boss_title", "bossTitle", ""),
+        ("boss_avatar", "bossAvatar", ""),
+        ("boss_id", "encryptBossId", ""),
+
+        # 状态信息
+        ("job_valid_status", "jobValidStatus", ""),
+        ("job_status_desc", "jobStatusDesc", ""),
+        ("contact_chat_im", "contactChatIm", ""),
+        ("last_modify_time", "lastModifyTime", ""),
+        ("prolong", "prolong", ""),
+        ("icon_word", "iconWord", ""),
+    )
+
+    # 取值有限、在职位间大量重复的字段
+    INTERNED_FIELDS = frozenset((
+        "salary_desc", "pay_type", "job_degree", "job_experience",
+        "city_name", "area_district", "business_district",
+        "brand_stage_name", "brand_industry", "brand_scale_name",
+        "boss_title", "job_status_desc", "icon_word",
+    ))
+
+    # 列表字段缺省时返回新的空列表，避免共享可变对象
+    LIST_FIELDS = frozenset(("job_labels", "skills", "welfare_list"))
+
+    __slots__ = tuple(name for name, _, _ in FIELDS)
+
+    _FIELD_NAMES = __slots__
+    _FIELD_SET = frozenset(__slots__)
+
+    # 原始数据中直接按键读取的字段（坐标在嵌套的 gps 对象中，薪资数值由 salary_desc 解析，单独处理）
+    _FLAT_FIELDS = tuple(field for field in FIELDS if field[1] and "." not in field[1])
+    _SALARY_FIELDS = SalaryInfo._fields
+
+    def __init__(self, **fields):
+        """
+        初始化职位记录
+
+        Args:
+            **fields: 标准化字段，未提供的字段使用缺省值
+        """
+        salary_given = "salary_min" in fields
+        for name, _, default in self.FIELDS:
+            self._set(name, fields.pop(name, default))
+        if fields:
+            raise TypeError(f"未知的职位字段: {', '.join(fields)}")
+        if not salary_given:
+            self._set_salary()
+
+    def _set_salary(self) -> None:
+        """由 salary_desc 填写薪资数值字段（面议等为None）"""
+        info = parse_salary(self.salary_desc or "")
+        for name, value in zip(self._SALARY_FIELDS, info or (None,) * len(self._SALARY_FIELDS)):
+            object.__setattr__(self, name, value)
+
+    def _set(self, name: str, value: Any) -> None:
+        """按字段规则写入（驻留字符串）"""
+        if type(value) is str and name in self.INTERNED_FIELDS:
+            value = sys.intern(value)
+        object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_raw(cls, job: Dict) -> "JobRecord":
+        """
+        从原始职位数据构建记录
+
+        Args:
+            job: 接口返回的原始职位数据
+
+        Returns:
+            JobRecord: 职位记录
+        """
+        record = cls.__new__(cls)
+        interned = cls.INTERNED_FIELDS
+        for name, raw_key, default in cls._FLAT_FIELDS:
+            value = job.get(raw_key, default)
+            if type(value) is str and name in interned:
+                value = sys.intern(value)
+            object.__setattr__(record, name, value)
+
+        record._set_salary()
+        gps = job.get("gps") or {}
+        object.__setattr__(record, "longitude", _coordinate(gps.get("longitude")))
+        object.__setattr__(record, "latitude", _coordinate(gps.get("latitude")))
+        return record
+
+    def _value(self, name: str) -> Any:
+        """读取字段，列表字段缺省时返回空列表"""
+        value = getattr(self, name)
+        if value is None and name in self.LIST_FIELDS:
+            return []
+        return value
+
+    def to_dict(self) -> Dict:
+        """
+        转换为标准化职位字典（与旧版 extract_single_job 返回值一致）
+
+        Returns:
+            Dict: 职位数据
+        """
+        return {name: self._value(name) for name in self._FIELD_NAMES}
+
+    # 只读字典接口
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """按字段名读取，字段不存在返回default"""
+        if key in self._FIELD_SET:
+            return self._value(key)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELD_SET:
+            return self._value(key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._FIELD_SET:
+            raise KeyError(key)
+        self._set(key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._FIELD_SET
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._FIELD_NAMES)
+
+    def __len__(self) -> int:
+        return len(self._FIELD_NAMES)
+
+    def keys(self) -> Tuple[str, ...]:
+        """字段名"""
+        return self._FIELD_NAMES
+
+    def values(self) -> List[Any]:
+        """字段值"""
+        return [self._value(name) for name in self._FIELD_NAMES]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """(字段名, 字段值) 列表"""
+        return [(name, self._value(name)) for name in self._FIELD_NAMES]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, JobRecord):
+            return all(getattr(self, n) == getattr(other, n) for n in self._FIELD_NAMES)
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"JobRecord(job_id={self.job_id!r}, job_name={self.job_name!r}, brand_name={self.brand_name!r})"
+
+    def __getstate__(self) -> Dict:
+        return {name: getattr(self, name) for name in self._FIELD_NAMES}
+
+    def __setstate__(self, state: Dict) -> None:
+        for name, _, default in self.FIELDS:
+            self._set(name, state.get(name, default))
+        if "salary_min" not in state:
+            self._set_salary()
+
+
+def job_to_json(obj: Any) -> Any:
+    """
+    json.dump 的 default 钩子：把 JobRecord 转为字典
+
+    Args:
+        obj: 无法直接序列化的对象
+
+    Returns:
+        可序列化的对象
+    """
+    if isinstance(obj, JobRecord):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
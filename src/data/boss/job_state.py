@@ -0,0 +1,179 @@
+import time
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+STATUS_NEW = "new"
+STATUS_CHANGED = "changed"
+STATUS_UNCHANGED = "unchanged"
+
+
+def _job_state(job: Dict) -> Tuple[str, int, Optional[int]]:
+    """原始职位 -> (职位ID, 最后修改时间, 有效状态)"""
+    try:
+        modified = int(job.get("lastModifyTime") or 0)
+    except (TypeError, ValueError):
+        modified = 0
+    return job.get("encryptJobId") or "", modified, job.get("jobValidStatus")
+
+
+class BossJobStateStore:
+    """Boss直聘职位状态库
+
+    记录每个职位上次抓取时的 lastModifyTime 和 jobValidStatus。增量抓取时按这两个
+    字段把每页职位分为新增、已变化、未变化三类，只提取和保存前两类；整页都未变化
+    说明之后的职位上次已经抓过，可以提前停止翻页。
+    """
+
+    def __init__(self, db_path: str):
+        """
+        初始化职位状态库
+
+        Args:
+            db_path: SQLite数据库文件路径
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS job_state (
+                job_id TEXT PRIMARY KEY,
+                last_modify_time INTEGER NOT NULL,
+                valid_status INTEGER,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                last_changed REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self._conn.commit()
+
+    def classify(self, job_list: List[Dict]) -> Dict[str, str]:
+        """
+        与上次的状态比较，给一页原始职位分类（只读，不更新状态）
+
+        Args:
+            job_list: 接口返回的原始职位列表
+
+        Returns:
+            Dict[str, str]: 职位ID -> "new"、"changed" 或 "unchanged"
+        """
+        states = [_job_state(job) for job in job_list]
+        job_ids = [job_id for job_id, _, _ in states if job_id]
+        if not job_ids:
+            return {}
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT job_id, last_modify_time, valid_status FROM job_state "
+                f"WHERE job_id IN ({','.join('?' * len(job_ids))})",
+                job_ids,
+            ).fetchall()
+        previous = {job_id: (modified, status) for job_id, modified, status in rows}
+
+        result = {}
+        for job_id, modified, status in states:
+            if not job_id:
+                continue
+            before = previous.get(job_id)
+            if before is None:
+                result[job_id] = STATUS_NEW
+            elif before != (modified, status):
+                result[job_id] = STATUS_CHANGED
+            else:
+                result[job_id] = STATUS_UNCHANGED
+        return result
+
+    def record(self, job_list: Iterable[Dict]) -> int:
+        """
+        保存职位的当前状态（在一个事务中；职位数据保存后再调用，崩溃时下次仍会当作变化重新输出）
+
+        Args:
+            job_list: 原始职位列表
+
+        Returns:
+            int: 写入的职位数
+        """
+        now = time.time()
+        rows = [(job_id, modified, status, now, now, now)
+                for job_id, modified, status in map(_job_state, job_list) if job_id]
+        if not rows:
+            return 0
+
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO job_state "
+                    "(job_id, last_modify_time, valid_status, first_seen, last_seen, last_changed) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(job_id) DO UPDATE SET "
+                    "last_changed = CASE WHEN last_modify_time = excluded.last_modify_time "
+                    "AND valid_status IS excluded.valid_status THEN last_changed ELSE excluded.last_seen END, "
+                    "last_modify_time = excluded.last_modify_time, "
+                    "valid_status = excluded.valid_status, "
+                    "last_seen = excluded.last_seen",
+                    rows,
+                )
+        return len(rows)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """
+        获取职位状态
+
+        Args:
+            job_id: 职位ID
+
+        Returns:
+            Dict or None: last_modify_time、valid_status、first_seen、last_seen、last_changed
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_modify_time, valid_status, first_seen, last_seen, last_changed "
+                "FROM job_state WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("last_modify_time", "valid_status", "first_seen", "last_seen", "last_changed"), row))
+
+    def stale_job_ids(self, seen_before: float) -> List[str]:
+        """
+        在某时间之后没有再出现的职位（如已下线）
+
+        Args:
+            seen_before: 时间戳
+
+        Returns:
+            List[str]: 职位ID
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id FROM job_state WHERE last_seen < ?", (seen_before,)
+            ).fetchall()
+        return [job_id for (job_id,) in rows]
+
+    def reset(self) -> None:
+        """清空全部状态（下次抓取时所有职位都视为新增）"""
+        with self._lock:
+            self._conn.execute("DELETE FROM job_state")
+            self._conn.commit()
+
+    def get_stats(self) -> Dict:
+        """
+        获取状态库统计
+
+        Returns:
+            Dict: 职位数、有效职位数
+        """
+        with self._lock:
+            total, valid = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(valid_status = 1), 0) FROM job_state"
+            ).fetchone()
+        return {"jobs": total, "valid": valid, "path": self.db_path}
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        try:
+            self._conn.close()
+        except Exception as e:
+            print(f"关闭职位状态库时出错: {e}")
@@ -0,0 +1,189 @@
+import os
+import io
+import gzip
+import json
+import time
+import threading
+from typing import Dict, Iterator, List, Optional
+from .job_record import job_to_json
+
+
+def _import_zstd():
+    """按需导入zstandard（可选依赖）"""
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        raise ImportError("zstd压缩需要安装 zstandard: pip install zstandard")
+
+
+def detect_compression(file_path: str) -> Optional[str]:
+    """
+    根据扩展名判断压缩格式
+
+    Args:
+        file_path: 文件路径
+
+    Returns:
+        str or None: "gzip"、"zstd" 或 None
+    """
+    if file_path.endswith(".gz"):
+        return "gzip"
+    if file_path.endswith(".zst"):
+        return "zstd"
+    return None
+
+
+class BossJsonlWriter:
+    """Boss直聘职位流式写入模块
+
+    每条职位追加为一行JSON，崩溃时已写入的数据不会丢失。支持gzip/zstd压缩
+    以及三种fsync策略：
+        "always": 每次写入后落盘
+        "batch":  每累计 fsync_every 条或间隔 fsync_interval 秒落盘
+        "never":  只在关闭时落盘
+    """
+
+    FSYNC_POLICIES = ("always", "batch", "never")
+
+    def __init__(self, file_path: str, compression: Optional[str] = None,
+                 fsync: str = "batch", fsync_every: int = 100, fsync_interval: float = 5.0):
+        """
+        初始化流式写入器
+
+        Args:
+            file_path: 输出文件路径（追加写入）
+            compression: 压缩格式 None、"gzip" 或 "zstd"，为空则按扩展名判断
+            fsync: fsync策略
+            fsync_every: batch策略下每多少条落盘一次
+            fsync_interval: batch策略下最长落盘间隔（秒）
+        """
+        if fsync not in self.FSYNC_POLICIES:
+            raise ValueError(f"无效的fsync策略: {fsync}")
+
+        self.file_path = file_path
+        self.compression = compression or detect_compression(file_path)
+        self.fsync = fsync
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+
+        self.jobs_written = 0
+        self._pending = 0
+        self._last_sync = time.time()
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        self._raw = open(file_path, "ab")
+        self._stream = self._open_stream(self._raw)
+
+    def _open_stream(self, raw):
+        """按压缩格式包装底层文件"""
+        if self.compression == "gzip":
+            return gzip.GzipFile(fileobj=raw, mode="ab")
+        if self.compression == "zstd":
+            return _import_zstd().ZstdCompressor().stream_writer(raw, closefd=False)
+        if self.compression:
+            raise ValueError(f"不支持的压缩格式: {self.compression}")
+        return raw
+
+    def write_job(self, job: Dict) -> None:
+        """
+        写入单条职位
+
+        Args:
+            job: 职位数据
+        """
+        self.write_jobs([job])
+
+    def write_jobs(self, jobs: List[Dict]) -> None:
+        """
+        批量写入职位，每条一行
+
+        Args:
+            jobs: 职位数据列表
+        """
+        if not jobs:
+            return
+
+        data = "".join(json.dumps(job, ensure_ascii=False, default=job_to_json) + "\n" for job in jobs).encode("utf-8")
+
+        with self._lock:
+            self._stream.write(data)
+            self.jobs_written += len(jobs)
+            self._pending += len(jobs)
+
+            if self.fsync == "always":
+                self._sync()
+            elif self.fsync == "batch" and (
+                self._pending >= self.fsync_every
+                or time.time() - self._last_sync >= self.fsync_interval
+            ):
+                self._sync()
+
+    def _sync(self) -> None:
+        """刷新压缩缓冲并落盘"""
+        if self.compression == "gzip":
+            self._stream.flush()
+        elif self.compression == "zstd":
+            self._stream.flush(_import_zstd().FLUSH_BLOCK)
+
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+        self._pending = 0
+        self._last_sync = time.time()
+
+    def flush(self) -> None:
+        """立即落盘"""
+        with self._lock:
+            self._sync()
+
+    def close(self) -> None:
+        """落盘并关闭文件"""
+        with self._lock:
+            if self._raw.closed:
+                return
+            if self._stream is not self._raw:
+                self._stream.close()
+            self._raw.flush()
+            os.fsync(self._raw.fileno())
+            self._raw.close()
+
+    def __enter__(self):
+        """上下文管理器入口"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """上下文管理器出口"""
+        self.close()
+
+
+def iter_jsonl_jobs(file_path: str, compression: Optional[str] = None) -> Iterator[Dict]:
+    """
+    逐条读取JSONL职位文件，不一次性载入整个文件
+
+    Args:
+        file_path: 文件路径
+        compression: 压缩格式，为空则按扩展名判断
+
+    Yields:
+        Dict: 职位数据
+    """
+    compression = compression or detect_compression(file_path)
+
+    with open(file_path, "rb") as raw:
+        if compression == "gzip":
+            stream = gzip.GzipFile(fileobj=raw, mode="rb")
+        elif compression == "zstd":
+            stream = _import_zstd().ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+        else:
+            stream = raw
+
+        for line in io.TextIOWrapper(stream, encoding="utf-8"):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # 崩溃时最后一行可能不完整
+                print(f"跳过不完整的行: {line[:50]}")
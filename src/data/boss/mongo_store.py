@@ -0,0 +1,216 @@
+import time
+import threading
+from typing import Dict, Iterable, Optional
+
+
+def _import_pymongo():
+    """按需导入pymongo（可选依赖）"""
+    try:
+        import pymongo
+        import pymongo.errors
+        return pymongo
+    except ImportError:
+        raise ImportError("MongoDB存储需要安装 pymongo: pip install pymongo")
+
+
+class BossMongoStore:
+    """Boss直聘职位MongoDB存储
+
+    抓取线程调用 write_jobs 只把职位放入内存缓冲区（按 job_id 合并，同一职位只保留最新的一条），
+    由后台线程在缓冲区达到 batch_size 或最早的职位已等待 flush_interval 秒时取出一批，
+    以无序 bulk_write 按 job_id upsert，first_seen 只在插入时写入。缓冲区达到 max_buffer 时
+    write_jobs 等待写入线程腾出空间（背压），内存不会无限增长。
+    可传入任意兼容 pymongo 的集合对象（如 mongomock），测试时不需要真实的 mongod。
+    实现 write_jobs/flush/close，可作为 BossDataProcessor 的输出目标。
+    """
+
+    INDEXES = ("city_name", "brand_name", "job_degree", "salary_min", "salary_max")
+
+    def __init__(self, collection=None, uri: str = "mongodb://localhost:27017",
+                 database: str = "boss", collection_name: str = "jobs",
+                 batch_size: int = 1000, flush_interval: float = 1.0, max_buffer: int = 10000):
+        """
+        初始化存储
+
+        Args:
+            collection: 已有的集合对象（pymongo 或 mongomock），为空则按 uri 连接
+            uri: MongoDB连接地址
+            database: 数据库名
+            collection_name: 集合名
+            batch_size: 每次 bulk_write 最多写入的职位数
+            flush_interval: 职位在缓冲区中最长等待秒数
+            max_buffer: 缓冲区上限，达到后 write_jobs 阻塞等待
+        """
+        self._pymongo = _import_pymongo()
+        self._client = None
+        if collection is None:
+            self._client = self._pymongo.MongoClient(uri)
+            collection = self._client[database][collection_name]
+        self.collection = collection
+
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max(max_buffer, batch_size)
+
+        self.written = 0
+        self.batches = 0
+        self.failed = 0
+        self.skipped = 0
+        self.blocked_seconds = 0.0
+
+        self.collection.create_index("job_id", unique=True)
+        for name in self.INDEXES:
+            self.collection.create_index(name)
+
+        self._buffer: Dict[str, Dict] = {}
+        self._buffer_since = 0.0
+        self._in_flight = 0
+        self._flush_requested = False
+        self._closing = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._writer_loop, name="boss-mongo-store", daemon=True)
+        self._thread.start()
+
+    def write_jobs(self, jobs: Iterable[Dict]) -> None:
+        """
+        提交职位（缓冲区已满时等待写入线程）
+
+        Args:
+            jobs: 标准化职位（JobRecord 或字典）
+        """
+        now = time.time()
+        documents = []
+        for job in jobs:
+            document = job.to_dict() if hasattr(job, "to_dict") else dict(job)
+            if not document.get("job_id"):
+                self.skipped += 1
+                continue
+            document["last_seen"] = now
+            documents.append(document)
+        if not documents:
+            return
+
+        with self._cond:
+            was_empty = not self._buffer
+            for document in documents:
+                job_id = document["job_id"]
+                if len(self._buffer) >= self.max_buffer and job_id not in self._buffer:
+                    blocked_since = time.perf_counter()
+                    self._cond.notify_all()
+                    while len(self._buffer) >= self.max_buffer and not self._closing:
+                        self._cond.wait()
+                    self.blocked_seconds += time.perf_counter() - blocked_since
+                if not self._buffer:
+                    self._buffer_since = time.monotonic()
+                self._buffer[job_id] = document
+            # 缓冲区由空变为非空时唤醒写入线程开始计时，达到批大小时唤醒写入
+            if was_empty or len(self._buffer) >= self.batch_size:
+                self._cond.notify_all()
+
+    def _take_batch(self) -> Optional[list]:
+        """等待并取出下一批职位，停止时返回None"""
+        with self._cond:
+            while True:
+                if self._buffer:
+                    waited = time.monotonic() - self._buffer_since
+                    if (len(self._buffer) >= self.batch_size or self._flush_requested
+                            or self._closing or waited >= self.flush_interval):
+                        break
+                    self._cond.wait(self.flush_interval - waited)
+                else:
+                    self._flush_requested = False
+                    self._cond.notify_all()
+                    if self._closing:
+                        return None
+                    self._cond.wait()
+
+            batch = []
+            for job_id in list(self._buffer)[:self.batch_size]:
+                batch.append(self._buffer.pop(job_id))
+            self._buffer_since = time.monotonic()
+            self._in_flight = len(batch)
+            self._cond.notify_all()
+            return batch
+
+    def _writer_loop(self) -> None:
+        """后台写入线程"""
+        while True:
+            batch = self._take_batch()
+            if batch is None:
+                break
+            try:
+                self._write(batch)
+            except Exception as e:
+                self.failed += len(batch)
+                print(f"❌ 写入MongoDB失败: {e}")
+            finally:
+                with self._cond:
+                    self._in_flight = 0
+                    self._cond.notify_all()
+
+    def _write(self, documents: list) -> None:
+        """以一次无序 bulk_write 写入一批职位"""
+        update_one = self._pymongo.UpdateOne
+        now = time.time()
+        operations = [
+            update_one(
+                {"job_id": document["job_id"]},
+                {"$set": document, "$setOnInsert": {"first_seen": now}},
+                upsert=True,
+            )
+            for document in documents
+        ]
+        try:
+            self.collection.bulk_write(operations, ordered=False)
+            self.written += len(documents)
+        except self._pymongo.errors.BulkWriteError as e:
+            # 无序写入时其余操作仍会执行，只统计失败的部分
+            errors = len(e.details.get("writeErrors", []))
+            self.failed += errors
+            self.written += len(documents) - errors
+            print(f"❌ MongoDB批量写入有 {errors} 个职位失败: {e.details['writeErrors'][0].get('errmsg', '')}")
+        self.batches += 1
+
+    def flush(self) -> None:
+        """等待缓冲区中的职位全部写入"""
+        if not self._thread.is_alive():
+            return
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._buffer or self._in_flight:
+                self._cond.wait()
+
+    def get_stats(self) -> Dict:
+        """
+        获取存储统计
+
+        Returns:
+            Dict: 已写入职位数、批次数、失败数、跳过（无职位ID）数、缓冲区职位数、背压等待秒数
+        """
+        return {
+            "written": self.written,
+            "batches": self.batches,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "pending": len(self._buffer),
+            "blocked_seconds": self.blocked_seconds,
+        }
+
+    def close(self) -> None:
+        """写完缓冲区中的职位，停止后台线程，关闭自行创建的连接"""
+        if self._thread.is_alive():
+            with self._cond:
+                self._closing = True
+                self._cond.notify_all()
+            self._thread.join()
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
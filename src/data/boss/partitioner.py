@@ -0,0 +1,204 @@
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+from .code_tables import get_code_registry
+from .dedupe import BossDedupeIndex
+from .summary import BossJobSummary
+
+
+DEFAULT_FACETS = ("salary", "experience", "degree", "scale", "stage", "district")
+
+
+class BossQueryPartitioner:
+    """Boss直聘查询拆分器
+
+    一个查询翻页最多只能取到 max_pages x page_size 个职位，总数（totalCount）更大时
+    其余职位永远取不到。拆分器先请求第1页得到总数，超过上限就按下一个未使用的筛选条件
+    （薪资、经验、学历、规模、融资阶段、区县）拆成互不重叠的子查询，逐层拆到每个分区
+    都在上限以内，再逐个分区批量抓取并跨分区去重。探测时取得的第1页直接作为该分区的
+    第1页，不重复请求。
+    """
+
+    def __init__(self, scraper, max_results: Optional[int] = None,
+                 facets: Optional[Sequence[str]] = None, max_partitions: Optional[int] = None):
+        """
+        初始化查询拆分器
+
+        Args:
+            scraper: 已初始化的 BossScraper 实例
+            max_results: 单个查询翻页能取到的职位数，为空则使用配置
+            facets: 拆分使用的条件及顺序，为空则使用配置
+            max_partitions: 最多拆出的分区数，为空则使用配置
+        """
+        self.scraper = scraper
+        config = scraper.config
+        self.max_results = max_results or config.get_partition_option("max_results") or (
+            config.get_limit("max_pages") * config.get_limit("page_size")
+        )
+        self.facets = list(facets or config.get_partition_option("facets") or DEFAULT_FACETS)
+        self.max_partitions = max_partitions or config.get_partition_option("max_partitions") or 500
+
+    def facet_values(self, facet: str, search_params: Dict) -> List[str]:
+        """
+        条件的全部取值（不含"不限"）
+
+        Args:
+            facet: 条件名称（salary、experience、degree、scale、stage、district）
+            search_params: 当前分区的搜索参数（按区县拆分时需要城市）
+
+        Returns:
+            List[str]: 取值名称
+        """
+        if facet == "district":
+            city_name = search_params.get("city")
+            if not city_name:
+                return []
+            config = self.scraper.config
+            config.warm_up_districts([city_name])
+            return config.district_store.areas(city_name)
+
+        try:
+            table = get_code_registry().conditions()[1].get(facet)
+        except (OSError, ValueError) as e:
+            print(f"❌ 无法加载筛选条件: {e}")
+            return []
+        if not table:
+            return []
+        return [name for name, code in table.items() if code]
+
+    def _next_facet(self, search_params: Dict) -> Tuple[Optional[str], List[str]]:
+        """当前分区下一个可用于拆分的条件及其取值"""
+        for facet in self.facets:
+            if search_params.get(facet):
+                continue
+            values = self.facet_values(facet, search_params)
+            if values:
+                return facet, values
+        return None, []
+
+    def plan(self, search_params: Dict) -> Dict:
+        """
+        逐层探测总数并拆分，直到每个分区都在上限以内（或已无条件可拆）
+
+        Args:
+            search_params: 搜索参数
+
+        Returns:
+            Dict: partitions（params、total_count、first_page、truncated）、
+                failed、probes、total_count（原查询总数）
+        """
+        partitions: List[Dict] = []
+        failed: List[Dict] = []
+        probes = 0
+        root_total = None
+        queue = deque([{k: v for k, v in search_params.items() if k != "page"}])
+
+        while queue:
+            params = queue.popleft()
+            result = self.scraper.search_jobs({**params, "page": 1})
+            probes += 1
+            if not result["success"]:
+                failed.append({"params": params, "message": result["message"]})
+                continue
+
+            data = result["data"]
+            total_count = data.get("totalCount", 0)
+            if root_total is None:
+                root_total = total_count
+            if not data.get("jobList"):
+                continue
+
+            facet, values = (None, []) if total_count <= self.max_results else self._next_facet(params)
+            if facet and len(partitions) + len(queue) + len(values) <= self.max_partitions:
+                print(f"{self._describe(params)} 共 {total_count} 个职位，超过上限 {self.max_results}，"
+                      f"按 {facet} 拆为 {len(values)} 个分区")
+                queue.extend({**params, facet: value} for value in values)
+                continue
+
+            truncated = total_count > self.max_results
+            if truncated:
+                print(f"⚠️ {self._describe(params)} 共 {total_count} 个职位，已无法继续拆分，"
+                      f"只能取到前 {self.max_results} 个")
+            partitions.append({
+                "params": params,
+                "total_count": total_count,
+                "first_page": data,
+                "truncated": truncated,
+            })
+
+        return {"partitions": partitions, "failed": failed, "probes": probes, "total_count": root_total or 0}
+
+    def search(self, search_params: Dict, max_pages: Optional[int] = None, resume: bool = False) -> Dict:
+        """
+        拆分查询并抓取全部分区
+
+        Args:
+            search_params: 搜索参数
+            max_pages: 每个分区最大页数，为空则使用配置
+            resume: 各分区是否从断点继续
+
+        Returns:
+            Dict: 搜索结果（jobs、total_jobs、total_count、coverage、partitions、probes、requests）
+        """
+        if not self.scraper._check_initialized():
+            return {"success": False, "message": "爬虫未初始化"}
+
+        config = self.scraper.config
+        if max_pages is None:
+            max_pages = config.get_limit("max_pages")
+        page_size = search_params.get("page_size") or config.get_limit("page_size")
+
+        plan = self.plan(search_params)
+        partitions = plan["partitions"]
+        print(f"查询拆分为 {len(partitions)} 个分区（探测 {plan['probes']} 次）")
+
+        dedupe_index = BossDedupeIndex()
+        jobs = []
+        # 各分区的职位合并后统一保存，汇总随分区增量更新
+        summary = BossJobSummary()
+        requests = plan["probes"]
+        details = []
+
+        for partition in partitions:
+            pages = min(max_pages, max(1, -(-partition["total_count"] // page_size)))
+            result = self.scraper.batch_search(
+                partition["params"], pages, dedupe_index=dedupe_index, resume=resume,
+                first_page=partition["first_page"], save=False,
+            )
+            if not result["success"]:
+                plan["failed"].append({"params": partition["params"], "message": result["message"]})
+                continue
+
+            jobs.extend(result["jobs"])
+            summary.update(jobs)
+            # 第1页来自探测，不计入额外请求
+            requests += max(0, result.get("pages_fetched", 0) - 1)
+            details.append({
+                "params": partition["params"],
+                "total_count": partition["total_count"],
+                "jobs": result["total_jobs"],
+                "truncated": partition["truncated"],
+            })
+
+        if jobs:
+            self.scraper.data_processor.save_jobs_data(jobs, summary=summary)
+
+        total_count = plan["total_count"]
+        coverage = len(jobs) / total_count if total_count else 1.0
+        print(f"✅ 拆分查询完成: {len(jobs)} / {total_count} 个职位（覆盖率 {coverage:.1%}），共 {requests} 次请求")
+
+        return {
+            "success": True,
+            "jobs": jobs,
+            "total_jobs": len(jobs),
+            "total_count": total_count,
+            "coverage": coverage,
+            "partitions": details,
+            "failed_partitions": plan["failed"],
+            "probes": plan["probes"],
+            "requests": requests,
+        }
+
+    @staticmethod
+    def _describe(search_params: Dict) -> str:
+        """分区的简短描述"""
+        return "/".join(str(v) for k, v in search_params.items() if k != "page_size")
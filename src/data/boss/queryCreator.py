@@ -1,25 +1,13 @@
-import os
-import json
+try:
+    from .code_tables import get_code_registry
+except ImportError:  # 直接运行本文件时
+    from code_tables import get_code_registry
 
 
 class QueryCreater:
     def __init__(self):
-        """初始化查询创建器，加载条件映射数据"""
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        conditions_file = os.path.join(script_dir, "conditions.json")
-        
-        with open(conditions_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        self.conditions = data["zpData"]
-        
-        # 创建名称到代码的映射字典
-        self.mapping = {}
-        for list_name, items in self.conditions.items():
-            category = list_name.replace("List", "")  # 去掉List后缀作为分类名
-            self.mapping[category] = {}
-            for item in items:
-                self.mapping[category][item["name"]] = item["code"]
+        """初始化查询创建器，条件映射来自进程共享的代码表注册中心"""
+        self.conditions, self.mapping = get_code_registry().conditions()
     
     def get_code(self, category, name):
         """
@@ -34,6 +22,20 @@ class QueryCreater:
         """
         return self.mapping.get(category, {}).get(name)
     
+    def get_name(self, category, code):
+        """
+        根据分类和代码反查名称（解码接口响应）
+        
+        Args:
+            category (str): 分类名称
+            code: 代码
+            
+        Returns:
+            str: 对应的名称，如果未找到返回None
+        """
+        table = self.mapping.get(category)
+        return table.name_of(code) if table else None
+    
     def get_pay_type_code(self, name):
         """获取薪资结算方式代码"""
         return self.get_code("payType", name)
@@ -76,7 +78,7 @@ class QueryCreater:
         Returns:
             dict: 名称到代码的映射字典
         """
-        return self.mapping.get(category, {})
+        return dict(self.mapping.get(category, {}))
     
     def list_categories(self):
         """列出所有可用的分类"""
@@ -0,0 +1,285 @@
+import time
+import random
+import threading
+from typing import Dict, Optional
+
+
+class BossRateLimiter:
+    """Boss直聘请求速率限制模块
+
+    线程安全的令牌桶，所有共享同一实例的工作线程合计请求速率
+    不超过 max_rps。
+    """
+
+    def __init__(self, max_rps: float, burst: Optional[int] = None):
+        """
+        初始化速率限制器
+
+        Args:
+            max_rps: 每秒最大请求数（<=0 表示不限速）
+            burst: 令牌桶容量，默认为1（严格均匀间隔）
+        """
+        self.max_rps = max_rps
+        self.capacity = max(1, burst or 1)
+        self._tokens = float(self.capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """按流逝时间补充令牌（暂停期间不补充）"""
+        if now <= self._last_refill:
+            return
+        elapsed = now - self._last_refill
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.max_rps)
+        self._last_refill = now
+
+    def reserve(self) -> float:
+        """
+        预占一个令牌
+
+        Returns:
+            float: 需要等待的秒数（0表示可立即执行）
+        """
+        if self.max_rps <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            delay = max(0.0, self._last_refill - now)
+            if self._tokens >= 0:
+                return delay
+            return delay - self._tokens / self.max_rps
+
+    def acquire(self) -> float:
+        """
+        获取一个令牌，必要时阻塞等待
+
+        Returns:
+            float: 实际等待的秒数
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def set_rate(self, max_rps: float) -> None:
+        """
+        调整速率（已积累的令牌保留）
+
+        Args:
+            max_rps: 新的每秒最大请求数
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.max_rps = max_rps
+
+    def pause_until(self, until: float) -> None:
+        """
+        暂停发放令牌直到指定时刻（之后按当前速率重新开始，不会一次放出积压的请求）
+
+        Args:
+            until: time.monotonic() 时刻
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 1.0)
+            self._last_refill = max(self._last_refill, until)
+
+
+class BossRateScheduler:
+    """Boss直聘请求调度模块
+
+    进程内所有爬虫共享的请求节奏中心：每个主机一个令牌桶（总速率不超过礼貌预算
+    target_qps），每个会话（一组登录cookies）再一个令牌桶。
+    主机速率按 AIMD 自适应：响应 code 37（访问被限制）时速率乘以 backoff 并暂停 cooldown 秒
+    （连续受限时冷却时间加倍），之后每次成功请求加回 recovery，直到回到 target_qps。
+    """
+
+    def __init__(self, target_qps: float = 1.0, session_qps: Optional[float] = None,
+                 burst: int = 1, backoff: float = 0.5, min_qps: float = 0.05,
+                 recovery: float = 0.05, cooldown: float = 30, jitter: float = 0.0):
+        """
+        初始化调度器
+
+        Args:
+            target_qps: 每个主机的目标速率，也是礼貌预算上限（<=0 表示不限速，也不退避）
+            session_qps: 每个会话的速率上限，为空则不单独限制
+            burst: 令牌桶容量
+            backoff: 受限时速率的乘数（0-1）
+            min_qps: 自适应速率下限
+            recovery: 每次成功后速率的增量
+            cooldown: 首次受限时主机暂停的秒数
+            jitter: 随机抖动比例，每次等待额外增加 0~jitter 个请求间隔
+        """
+        self.target_qps = target_qps
+        self.session_qps = session_qps
+        self.burst = burst
+        self.backoff = backoff
+        self.min_qps = min_qps
+        self.recovery = recovery
+        self.cooldown = cooldown
+        self.jitter = jitter
+
+        self._hosts: Dict[str, Dict] = {}
+        self._sessions: Dict[str, BossRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config) -> "BossRateScheduler":
+        """
+        根据配置创建调度器
+
+        Args:
+            config: BossConfig 实例
+
+        Returns:
+            BossRateScheduler: 调度器
+        """
+        options = dict(config.scraper_config.get("rate_limit", {}))
+        if options.get("target_qps") is None:
+            options["target_qps"] = config.get_limit("max_rps")
+        return cls(**options)
+
+    def _host_state(self, host: str) -> Dict:
+        """获取（必要时创建）主机的令牌桶与自适应状态"""
+        state = self._hosts.get(host)
+        if state is None:
+            state = {
+                "limiter": BossRateLimiter(self.target_qps, self.burst),
+                "rate": self.target_qps,
+                "paused_until": 0.0,
+                "strikes": 0,
+                "requests": 0,
+                "limited": 0,
+                "wait_time": 0.0,
+            }
+            self._hosts[host] = state
+        return state
+
+    def reserve(self, host: str, session: Optional[str] = None) -> float:
+        """
+        为一次请求预占主机和会话的令牌
+
+        Args:
+            host: 目标主机
+            session: 会话标识，为空则只按主机限速
+
+        Returns:
+            float: 需要等待的秒数
+        """
+        with self._lock:
+            state = self._host_state(host)
+            limiter = None
+            if session is not None and self.session_qps:
+                limiter = self._sessions.get(session)
+                if limiter is None:
+                    limiter = BossRateLimiter(self.session_qps, self.burst)
+                    self._sessions[session] = limiter
+
+            wait = state["limiter"].reserve()
+            if limiter is not None:
+                wait = max(wait, limiter.reserve())
+            if wait > 0 and self.jitter and state["rate"] > 0:
+                wait += random.uniform(0, self.jitter / state["rate"])
+
+            state["requests"] += 1
+            state["wait_time"] += wait
+            return wait
+
+    def acquire(self, host: str, session: Optional[str] = None) -> float:
+        """
+        获取请求许可，必要时阻塞等待
+
+        Args:
+            host: 目标主机
+            session: 会话标识
+
+        Returns:
+            float: 实际等待的秒数
+        """
+        wait = self.reserve(host, session)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def report_success(self, host: str) -> None:
+        """
+        反馈一次成功请求：速率逐步恢复到目标值
+
+        Args:
+            host: 目标主机
+        """
+        with self._lock:
+            state = self._host_state(host)
+            state["strikes"] = 0
+            if self.target_qps > 0 and state["rate"] < self.target_qps:
+                state["rate"] = min(self.target_qps, state["rate"] + self.recovery)
+                state["limiter"].set_rate(state["rate"])
+
+    def report_limited(self, host: str) -> None:
+        """
+        反馈一次访问受限（code 37）：降低速率并暂停该主机
+
+        Args:
+            host: 目标主机
+        """
+        with self._lock:
+            state = self._host_state(host)
+            state["limited"] += 1
+            state["strikes"] += 1
+            if self.target_qps > 0:
+                state["rate"] = max(self.min_qps, state["rate"] * self.backoff)
+                state["limiter"].set_rate(state["rate"])
+
+            pause = self.cooldown * 2 ** (state["strikes"] - 1)
+            state["paused_until"] = max(state["paused_until"], time.monotonic() + pause)
+            state["limiter"].pause_until(state["paused_until"])
+            rate = state["rate"]
+
+        print(f"⚠️ {host} 访问受限，速率降至 {rate:.2f} 次/秒，暂停 {pause:.0f} 秒")
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        获取各主机的调度统计
+
+        Returns:
+            Dict: 主机 -> 当前速率、请求数、受限次数、累计等待秒数
+        """
+        with self._lock:
+            return {
+                host: {
+                    "rate": state["rate"],
+                    "requests": state["requests"],
+                    "limited": state["limited"],
+                    "wait_time": state["wait_time"],
+                    "paused": state["paused_until"] > time.monotonic(),
+                }
+                for host, state in self._hosts.items()
+            }
+
+
+_scheduler: Optional[BossRateScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_rate_scheduler(config=None) -> BossRateScheduler:
+    """
+    获取进程内共享的请求调度器（第一次调用时按配置创建）
+
+    Args:
+        config: BossConfig 实例，为空则使用默认配置
+
+    Returns:
+        BossRateScheduler: 调度器
+    """
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                if config is None:
+                    from .config import BossConfig
+                    config = BossConfig()
+                _scheduler = BossRateScheduler.from_config(config)
+    return _scheduler
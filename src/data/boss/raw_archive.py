@@ -0,0 +1,336 @@
+import os
+import json
+import time
+import zlib
+import queue
+import random
+import struct
+import hashlib
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class BossRawArchive:
+    """Boss直聘原始响应归档模块
+
+    原始响应由后台线程写入只追加的压缩分段文件，按内容哈希去重，
+    抓取线程只需入队不会被磁盘IO阻塞。每条记录格式为
+    4字节长度（大端）+ zlib压缩的JSON，索引记录在 index.jsonl 中，
+    可用于回放和调试。保留策略在写入线程启动、关闭、分段切换时执行，写入期间每小时
+    也会执行一次；写入量很低时当前分段按时间切换，旧记录同样能按保留时间清理。
+    索引的修改和旧分段的删除在锁内进行，读取时分段已被清理的记录视为不存在。
+    """
+
+    _HEADER = struct.Struct(">I")
+    RETENTION_INTERVAL = 3600  # 写入期间执行保留策略的间隔（秒）
+    SEGMENT_MAX_AGE = 86400  # 当前分段最早记录超过该秒数（或保留时间）后切换新分段
+
+    def __init__(self, archive_dir: str, sample_rate: float = 1.0,
+                 segment_max_bytes: int = 64 * 1024 * 1024,
+                 max_total_bytes: int = 512 * 1024 * 1024,
+                 max_age_days: Optional[float] = 7, queue_size: int = 1000):
+        """
+        初始化归档
+
+        Args:
+            archive_dir: 归档目录
+            sample_rate: 采样率（0-1），按比例随机保留响应
+            segment_max_bytes: 单个分段文件上限，超出后切换新分段
+            max_total_bytes: 归档总大小上限，超出后删除最旧分段
+            max_age_days: 分段最长保留天数，为空则不按时间清理
+            queue_size: 写入队列长度，队列满时丢弃新响应而不阻塞抓取
+        """
+        self.archive_dir = archive_dir
+        self.sample_rate = sample_rate
+        self.segment_max_bytes = segment_max_bytes
+        self.max_total_bytes = max_total_bytes
+        self.max_age_days = max_age_days
+
+        self.archived = 0
+        self.duplicates = 0
+        self.skipped = 0
+        self.dropped = 0
+
+        os.makedirs(archive_dir, exist_ok=True)
+        self._index_path = os.path.join(archive_dir, "index.jsonl")
+        self._index: Dict[str, Dict] = self._load_index()
+        # 保护 _index 和分段删除（写入线程修改，读取方在其他线程）
+        self._lock = threading.Lock()
+
+        self._segment_id = self._latest_segment_id()
+        self._segment = None
+        self._segment_started = min(
+            (e["timestamp"] for e in self._index.values() if e["segment"] == self._segment_id),
+            default=None,
+        )
+        self._next_retention = 0.0
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._writer_loop, name="boss-raw-archive", daemon=True)
+        self._thread.start()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        """载入已有索引"""
+        index = {}
+        if not os.path.exists(self._index_path):
+            return index
+
+        with open(self._index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if os.path.exists(self._segment_path(entry["segment"])):
+                    index[entry["hash"]] = entry
+        return index
+
+    def _segment_path(self, segment_id: int) -> str:
+        """分段文件路径"""
+        return os.path.join(self.archive_dir, f"segment_{segment_id:06d}.seg")
+
+    def _segment_ids(self) -> List[int]:
+        """按编号排列的现有分段"""
+        ids = []
+        for name in os.listdir(self.archive_dir):
+            if name.startswith("segment_") and name.endswith(".seg"):
+                ids.append(int(name[len("segment_"):-len(".seg")]))
+        return sorted(ids)
+
+    def _latest_segment_id(self) -> int:
+        """当前应写入的分段编号"""
+        ids = self._segment_ids()
+        return ids[-1] if ids else 1
+
+    def archive(self, response_data: Any, url: str = "") -> bool:
+        """
+        提交原始响应（非阻塞）
+
+        Args:
+            response_data: 响应数据
+            url: 请求URL
+
+        Returns:
+            bool: 是否已入队（未被采样或队列已满返回False）
+        """
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            self.skipped += 1
+            return False
+
+        try:
+            self._queue.put_nowait((response_data, url, time.time()))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _writer_loop(self) -> None:
+        """后台写入线程"""
+        self._run_retention()
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+
+            try:
+                self._write(*item)
+            except Exception as e:
+                print(f"❌ 归档原始响应失败: {e}")
+            finally:
+                self._queue.task_done()
+
+        if self._segment:
+            self._segment.close()
+            self._segment = None
+        self._run_retention()
+
+    def _write(self, response_data: Any, url: str, timestamp: float) -> None:
+        """写入一条记录"""
+        raw = json.dumps(response_data, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        content_hash = hashlib.sha256(raw).hexdigest()
+
+        if content_hash in self._index:
+            self.duplicates += 1
+            return
+
+        payload = zlib.compress(raw)
+        segment = self._current_segment(len(payload) + self._HEADER.size)
+        offset = segment.tell()
+        segment.write(self._HEADER.pack(len(payload)))
+        segment.write(payload)
+        segment.flush()
+        if self._segment_started is None:
+            self._segment_started = timestamp
+
+        entry = {
+            "hash": content_hash,
+            "segment": self._segment_id,
+            "offset": offset,
+            "length": len(payload),
+            "timestamp": timestamp,
+            "url": url,
+        }
+        with self._lock:
+            with open(self._index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._index[content_hash] = entry
+        self.archived += 1
+
+    def _current_segment(self, record_size: int):
+        """获取可写分段，必要时切换新分段并执行保留策略"""
+        if self._segment is None:
+            self._segment = open(self._segment_path(self._segment_id), "ab")
+
+        now = time.time()
+        max_age = self.SEGMENT_MAX_AGE
+        if self.max_age_days:
+            max_age = min(max_age, self.max_age_days * 86400)
+        too_large = self._segment.tell() + record_size > self.segment_max_bytes
+        too_old = self._segment_started is not None and now - self._segment_started > max_age
+
+        if self._segment.tell() > 0 and (too_large or too_old):
+            self._segment.close()
+            self._segment_id += 1
+            self._segment = open(self._segment_path(self._segment_id), "ab")
+            self._segment_started = None
+            self._run_retention()
+        elif now >= self._next_retention:
+            self._run_retention()
+
+        return self._segment
+
+    def _run_retention(self) -> None:
+        """执行保留策略并安排下一次定时执行（只在写入线程中调用）"""
+        self._next_retention = time.time() + self.RETENTION_INTERVAL
+        try:
+            self._apply_retention()
+        except OSError as e:
+            print(f"❌ 清理旧归档分段失败: {e}")
+
+    def _apply_retention(self) -> None:
+        """删除超出总大小或保留时间的旧分段（不删除正在写入的分段）"""
+        ids = [i for i in self._segment_ids() if self._segment is None or i != self._segment_id]
+        sizes = {i: os.path.getsize(self._segment_path(i)) for i in ids}
+        total = sum(sizes.values())
+        cutoff = time.time() - self.max_age_days * 86400 if self.max_age_days else None
+
+        removed = set()
+        with self._lock:
+            for segment_id in ids:
+                path = self._segment_path(segment_id)
+                expired = cutoff is not None and os.path.getmtime(path) < cutoff
+                if not expired and total <= self.max_total_bytes:
+                    break
+                os.remove(path)
+                total -= sizes[segment_id]
+                removed.add(segment_id)
+
+            if removed:
+                self._index = {h: e for h, e in self._index.items() if e["segment"] not in removed}
+                with open(self._index_path, "w", encoding="utf-8") as f:
+                    for entry in self._index.values():
+                        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+        if removed:
+            if self._segment_id in removed:
+                self._segment_started = None
+            print(f"已清理 {len(removed)} 个旧归档分段")
+
+    def _read_entry(self, entry: Dict) -> Optional[Any]:
+        """根据索引读取一条记录，分段已被清理时返回None"""
+        try:
+            f = open(self._segment_path(entry["segment"]), "rb")
+        except FileNotFoundError:
+            return None
+        # 已打开的分段即使随后被删除也能读完
+        with f:
+            f.seek(entry["offset"])
+            length = self._HEADER.unpack(f.read(self._HEADER.size))[0]
+            return json.loads(zlib.decompress(f.read(length)).decode("utf-8"))
+
+    def get(self, content_hash: str) -> Optional[Any]:
+        """
+        按内容哈希读取响应
+
+        Args:
+            content_hash: 内容哈希
+
+        Returns:
+            响应数据，不存在返回None
+        """
+        with self._lock:
+            entry = self._index.get(content_hash)
+        return self._read_entry(entry) if entry else None
+
+    def latest(self) -> Optional[Any]:
+        """
+        读取最近归档的响应
+
+        Returns:
+            响应数据，没有记录返回None
+        """
+        self.flush()
+        with self._lock:
+            entries = list(self._index.values())
+        for entry in reversed(entries):
+            data = self._read_entry(entry)
+            if data is not None:
+                return data
+        return None
+
+    def iter_responses(self, since: Optional[float] = None) -> Iterator[Dict]:
+        """
+        按归档顺序回放响应
+
+        Args:
+            since: 只返回该时间戳之后归档的响应
+
+        Yields:
+            Dict: {"hash", "timestamp", "url", "data"}
+        """
+        self.flush()
+        with self._lock:
+            entries = list(self._index.values())
+        for entry in entries:
+            if since is not None and entry["timestamp"] < since:
+                continue
+            data = self._read_entry(entry)
+            if data is None:
+                continue
+            yield {
+                "hash": entry["hash"],
+                "timestamp": entry["timestamp"],
+                "url": entry["url"],
+                "data": data,
+            }
+
+    def flush(self) -> None:
+        """等待队列中的响应全部写入"""
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def get_stats(self) -> Dict:
+        """
+        获取归档统计
+
+        Returns:
+            Dict: 归档、重复、未采样、丢弃数量及分段信息
+        """
+        with self._lock:
+            entries = len(self._index)
+        return {
+            "archived": self.archived,
+            "duplicates": self.duplicates,
+            "skipped": self.skipped,
+            "dropped": self.dropped,
+            "pending": self._queue.qsize(),
+            "entries": entries,
+            "segments": len(self._segment_ids()),
+        }
+
+    def close(self) -> None:
+        """写完队列中的响应并停止后台线程"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
@@ -0,0 +1,86 @@
+import re
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+PAY_MONTHLY = "月薪"
+PAY_DAILY = "日薪"
+PAY_HOURLY = "时薪"
+
+# 日薪、时薪折算月薪
+WORK_DAYS_PER_MONTH = 21.75
+WORK_HOURS_PER_DAY = 8
+
+_SALARY_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)\s*(K|k|元/天|元/时)")
+_MONTHS_PATTERN = re.compile(r"(\d+)\s*薪")
+
+
+class SalaryInfo(NamedTuple):
+    """标准化薪资：月薪统一为千元，日薪、时薪按每月工作日折算"""
+    salary_min: float
+    salary_max: float
+    salary_months: int
+    pay_type: str
+
+
+@lru_cache(maxsize=4096)
+def parse_salary_range(salary_desc: str) -> Optional[Tuple[float, float, str]]:
+    """
+    解析薪资描述（相同描述只解析一次）
+
+    Args:
+        salary_desc: 薪资描述，如 "15-25K·14薪"、"150-200元/天"
+
+    Returns:
+        tuple or None: (下限, 上限, 单位)，单位为 "K"（月薪，千元）、"元/天" 或 "元/时"；
+        面议等无法解析时返回None
+    """
+    match = _SALARY_PATTERN.search(salary_desc or "")
+    if not match:
+        return None
+    unit = "K" if match.group(3) in ("K", "k") else match.group(3)
+    return float(match.group(1)), float(match.group(2)), unit
+
+
+@lru_cache(maxsize=4096)
+def parse_salary(salary_desc: str) -> Optional[SalaryInfo]:
+    """
+    把薪资描述标准化为数值（不同的描述只有几百种，每种只解析一次）
+
+    Args:
+        salary_desc: 薪资描述，如 "10-15K"、"15-25K·14薪"、"150-200元/天"
+
+    Returns:
+        SalaryInfo or None: 月薪下限/上限（千元）、每年发薪月数、计薪方式；面议等返回None
+    """
+    parsed = parse_salary_range(salary_desc)
+    if parsed is None:
+        return None
+
+    lower, upper, unit = parsed
+    if unit == "K":
+        pay_type, factor = PAY_MONTHLY, 1.0
+    elif unit == "元/天":
+        pay_type, factor = PAY_DAILY, WORK_DAYS_PER_MONTH / 1000
+    else:
+        pay_type, factor = PAY_HOURLY, WORK_DAYS_PER_MONTH * WORK_HOURS_PER_DAY / 1000
+
+    match = _MONTHS_PATTERN.search(salary_desc)
+    months = int(match.group(1)) if match else 12
+    return SalaryInfo(round(lower * factor, 3), round(upper * factor, 3), months, pay_type)
+
+
+def job_salary(job: Dict) -> Optional[SalaryInfo]:
+    """
+    职位的标准化薪资：优先使用已有的数值字段，旧数据没有时解析 salary_desc
+
+    Args:
+        job: 标准化职位
+
+    Returns:
+        SalaryInfo or None: 标准化薪资
+    """
+    salary_min = job.get("salary_min")
+    if salary_min is not None:
+        return SalaryInfo(salary_min, job.get("salary_max"), job.get("salary_months") or 12, job.get("pay_type"))
+    return parse_salary(job.get("salary_desc") or "")
@@ -1,11 +1,20 @@
+import os
 import time
 import random
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+from urllib.parse import urlparse
 from .auth import BossAuth
 from .browser import BossBrowser
 from .config import BossConfig
 from .url_builder import BossUrlBuilder
 from .data_processor import BossDataProcessor
+from .dedupe import BossDedupeIndex
+from .api_client import BossApiClient
+from .cache import BossResponseCache
+from .checkpoint import BossCheckpointStore
+from .job_state import STATUS_UNCHANGED, BossJobStateStore
+from .rate_limiter import BossRateScheduler, get_rate_scheduler
+from .summary import BossJobSummary
 
 
 class BossScraper:
@@ -23,10 +32,93 @@ class BossScraper:
         self.url_builder = BossUrlBuilder(self.config)
         self.data_processor = BossDataProcessor(self.config)
         
+        self.api_client = BossApiClient(self.config, self.url_builder)
+        self.response_cache = self._create_response_cache()
+        self._checkpoint_store: Optional[BossCheckpointStore] = None
+        self._job_state_store: Optional[BossJobStateStore] = None
+        
+        # 请求节奏由进程内共享的调度器控制：按主机和本爬虫的登录会话分别限速
+        self.rate_scheduler: BossRateScheduler = get_rate_scheduler(self.config)
+        self.host = urlparse(self.config.web_base_url).netloc
+        self.session_id = f"scraper-{id(self):x}"
+        
         self.auth: Optional[BossAuth] = None
         self.page = None
         self._initialized = False
     
+    def _create_response_cache(self) -> Optional[BossResponseCache]:
+        """根据配置创建响应缓存"""
+        if not self.config.get_cache_option("enabled"):
+            return None
+        
+        db_path = self.config.get_cache_option("path") or os.path.join(
+            self.config.get_result_dir(), "response_cache.sqlite3"
+        )
+        return BossResponseCache(
+            db_path,
+            ttl=self.config.get_cache_option("ttl"),
+            max_size_bytes=int(self.config.get_cache_option("max_size_mb") * 1024 * 1024),
+        )
+    
+    @property
+    def checkpoint_store(self) -> BossCheckpointStore:
+        """抓取断点库（第一次使用时打开）"""
+        if self._checkpoint_store is None:
+            db_path = self.config.get_checkpoint_option("path") or os.path.join(
+                self.config.get_result_dir(), "checkpoints.sqlite3"
+            )
+            self._checkpoint_store = BossCheckpointStore(db_path)
+        return self._checkpoint_store
+    
+    @property
+    def job_state_store(self) -> BossJobStateStore:
+        """增量抓取使用的职位状态库（第一次使用时打开）"""
+        if self._job_state_store is None:
+            db_path = self.config.get_delta_option("path") or os.path.join(
+                self.config.get_result_dir(), "job_state.sqlite3"
+            )
+            self._job_state_store = BossJobStateStore(db_path)
+        return self._job_state_store
+    
+    def _open_checkpoint(self, search_params: Dict, kind: str,
+                         resume: bool) -> Tuple[Optional[str], Optional[Dict]]:
+        """
+        开始记录断点（未启用断点且不恢复时返回 (None, None)）
+        
+        Args:
+            search_params: 搜索参数
+            kind: 运行类型
+            resume: 是否从已有断点继续（只续接执行中或失败的运行，已完成的运行重新开始）
+        
+        Returns:
+            tuple: (运行键, 运行状态)
+        """
+        if not (resume or self.config.get_checkpoint_option("enabled")):
+            return None, None
+        
+        run_key = BossCheckpointStore.make_run_key(search_params, kind)
+        state = self.checkpoint_store.start_run(run_key, search_params, kind, resume)
+        if resume and state["completed_units"]:
+            print(f"从断点继续: 已完成 {len(state['completed_units'])} 个单位，{state['job_count']} 个职位")
+        return run_key, state
+    
+    def _restore_checkpoint(self, run_key: Optional[str], dedupe_index: BossDedupeIndex) -> List:
+        """载入断点中已完成单位的职位，并把已见职位ID放回去重索引"""
+        if not run_key:
+            return []
+        for job_id in self.checkpoint_store.seen_job_ids(run_key):
+            dedupe_index.add_job(job_id)
+        return self.checkpoint_store.load_jobs(run_key)
+    
+    def _pace(self) -> float:
+        """
+        发起请求（页面导航、接口请求、滚动加载）前向调度器申请许可
+        
+        Returns:
+            float: 实际等待的秒数
+        """
+        return self.rate_scheduler.acquire(self.host, self.session_id)
+    
     def initialize(self, **auth_params) -> bool:
         """
         初始化爬虫（启动浏览器、认证等）
@@ -62,6 +154,9 @@ class BossScraper:
             # 建立初始访问会话
             self._establish_session()
             
+            # 同步cookies到接口直连会话
+            self.sync_api_cookies()
+            
             self._initialized = True
             print("✅ Boss爬虫初始化完成")
             return True
@@ -76,13 +171,13 @@ class BossScraper:
         
         try:
             # 访问主页
+            self._pace()
             self.page.get(self.config.web_base_url)
-            time.sleep(random.uniform(*self.config.get_delay("initial_access")))
             
             # 访问搜索页面
             search_page = f"{self.config.web_base_url}/web/geek/job"
+            self._pace()
             self.page.get(search_page)
-            time.sleep(random.uniform(*self.config.get_delay("search_access")))
             
             # 模拟用户交互
             try:
@@ -99,12 +194,30 @@ class BossScraper:
         except Exception as e:
             print(f"建立会话失败: {e}")
     
-    def search_jobs(self, search_params: Dict) -> Dict:
+    def sync_api_cookies(self) -> int:
+        """
+        将浏览器当前cookies同步到接口直连会话
+        
+        Returns:
+            int: 同步的cookie数量
+        """
+        if not self.auth:
+            return 0
+        
+        count = self.api_client.load_cookies(self.auth.get_current_cookies())
+        print(f"✅ 已同步 {count} 个cookies到接口会话")
+        return count
+    
+    def search_jobs(self, search_params: Dict, fetch_mode: Optional[str] = None, tab=None,
+                    max_age: Optional[float] = None) -> Dict:
         """
         搜索职位（单页）
         
         Args:
             search_params: 搜索参数
+            fetch_mode: 抓取方式 "browser" 或 "api"，为空则使用配置
+            tab: 浏览器模式使用的标签页，为空则使用主页面
+            max_age: 可接受的缓存时长（秒），为空则使用缓存TTL，0表示强制刷新
         
         Returns:
             Dict: 搜索结果
@@ -112,49 +225,200 @@ class BossScraper:
         if not self._check_initialized():
             return {"success": False, "message": "爬虫未初始化"}
         
+        # 验证搜索参数
+        is_valid, error_msg = self.url_builder.validate_search_params(search_params)
+        if not is_valid:
+            return {"success": False, "message": f"参数验证失败: {error_msg}"}
+        
+        cached = self._get_cached_result(search_params, max_age)
+        if cached:
+            return cached
+        
+        if (fetch_mode or self.config.fetch_mode) == "api":
+            result = self._search_jobs_via_api(search_params)
+            if result["success"]:
+                self._store_cached_result(search_params, result)
+                return result
+            print(f"接口直连失败，回退到浏览器: {result['message']}")
+        
+        # 浏览器捕获的总是搜索页第1页的数据包，与按页码生成的缓存键不对应，不写入缓存
+        return self._search_jobs_via_browser(search_params, tab)
+    
+    def _get_cached_result(self, search_params: Dict, max_age: Optional[float] = None) -> Optional[Dict]:
+        """查询响应缓存，命中时返回搜索结果"""
+        if not self.response_cache:
+            return None
+        
+        key = self.response_cache.make_key(self.url_builder.build_api_url(search_params))
+        data = self.response_cache.get(key, max_age)
+        if data is None:
+            return None
+        
+        return {"success": True, "data": data, "message": "搜索成功（缓存）", "from_cache": True}
+    
+    def _store_cached_result(self, search_params: Dict, result: Dict) -> None:
+        """缓存成功的搜索结果（仅接口直连模式：响应与按页码生成的缓存键一一对应）"""
+        if not self.response_cache or not result.get("success"):
+            return
+        
+        key = self.response_cache.make_key(self.url_builder.build_api_url(search_params))
+        self.response_cache.set(key, result["data"])
+    
+    def _search_jobs_via_api(self, search_params: Dict) -> Dict:
+        """通过HTTP直接请求接口搜索职位"""
+        timings = {"rate_wait": self._pace()}
         try:
-            # 验证搜索参数
-            is_valid, error_msg = self.url_builder.validate_search_params(search_params)
-            if not is_valid:
-                return {"success": False, "message": f"参数验证失败: {error_msg}"}
+            start = time.perf_counter()
+            data = self.api_client.fetch_job_list(search_params)
+            timings["packet"] = time.perf_counter() - start
+        except Exception as e:
+            return {"success": False, "message": f"接口请求失败: {str(e)}", "timings": timings}
+        
+        result = self._process_search_response(data)
+        timings["parsed"] = time.perf_counter() - start
+        result["timings"] = timings
+        return result
+    
+    def _search_jobs_via_browser(self, search_params: Dict, tab=None) -> Dict:
+        """
+        通过浏览器访问页面并监听数据包搜索职位
+        
+        收到并解析出匹配的 joblist.json 响应后立即返回，整体耗时不超过 capture.deadline；
+        请求节奏由共享的请求调度器控制。结果中的 timings 记录本页各阶段耗时（秒）：
+        rate_wait 限速等待、navigate 导航完成、packet 收到数据包、parsed 解析完成（均从导航开始计），
+        first_byte 为接口请求发出到收到响应头的耗时（浏览器网络计时，不可用时缺省）。
+        """
+        page = tab or self.page
+        if self.config.get_capture_option("mode") == "sleep":
+            return self._search_jobs_via_browser_sleep(search_params, page)
+        
+        timings = {}
+        try:
+            timings["rate_wait"] = self._pace()
             
             # 开启数据包监听
-            self.page.listen.start("joblist.json")
+            page.listen.start("joblist.json")
             
             # 构建并访问搜索URL
             web_url = self.url_builder.build_web_url(search_params)
             print(f"访问搜索页面: {web_url}")
             
-            self.page.get(web_url)
+            capture_deadline = self.config.get_capture_option("deadline")
+            start = time.perf_counter()
+            deadline = start + capture_deadline
+            page.get(web_url, timeout=capture_deadline)
+            timings["navigate"] = time.perf_counter() - start
+            
+            result = self._wait_for_job_list(page, start, deadline, timings)
+            
+        except Exception as e:
+            result = {"success": False, "message": f"搜索失败: {str(e)}"}
+        finally:
+            try:
+                page.listen.stop()
+            except Exception:
+                pass
+        
+        result["timings"] = timings
+        return result
+    
+    def _wait_for_job_list(self, page, start: float, deadline: float, timings: Dict) -> Dict:
+        """
+        等待当前页的 joblist.json 数据包，收到即解析返回
+        
+        Args:
+            page: 已开启监听的页面或标签页
+            start: 导航开始时间（perf_counter）
+            deadline: 截止时间（perf_counter）
+            timings: 记录各阶段耗时的字典
+        
+        Returns:
+            Dict: 搜索结果
+        """
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            
+            packet = page.listen.wait(timeout=remaining)
+            if not packet:
+                break
+            
+            # 跳过失败的请求，继续等待页面重试或后续请求
+            if getattr(packet, "is_failed", False):
+                continue
+            
+            timings["packet"] = time.perf_counter() - start
+            first_byte = self._packet_first_byte(packet)
+            if first_byte is not None:
+                timings["first_byte"] = first_byte
+            
+            result = self._process_search_response(packet)
+            timings["parsed"] = time.perf_counter() - start
+            return result
+        
+        return {
+            "success": False,
+            "message": f"{self.config.get_capture_option('deadline')}秒内未监听到API响应数据"
+        }
+    
+    @staticmethod
+    def _packet_first_byte(packet) -> Optional[float]:
+        """从浏览器网络计时（CDP ResourceTiming）取请求发出到收到响应头的秒数"""
+        try:
+            timing = packet.response.timing
+            return max(0.0, (timing["receiveHeadersEnd"] - timing["sendEnd"]) / 1000)
+        except Exception:
+            return None
+    
+    def _search_jobs_via_browser_sleep(self, search_params: Dict, page) -> Dict:
+        """旧版抓取方式：导航后固定等待 page_load，再等待数据包"""
+        timings = {}
+        try:
+            timings["rate_wait"] = self._pace()
+            
+            # 开启数据包监听
+            page.listen.start("joblist.json")
+            
+            # 构建并访问搜索URL
+            web_url = self.url_builder.build_web_url(search_params)
+            print(f"访问搜索页面: {web_url}")
+            
+            start = time.perf_counter()
+            page.get(web_url)
+            timings["navigate"] = time.perf_counter() - start
             time.sleep(random.uniform(*self.config.get_delay("page_load")))
             
             # 等待并获取数据包
-            packets = self.page.listen.wait(timeout=self.config.get_timeout("packet_wait"))
+            packets = page.listen.wait(timeout=self.config.get_timeout("packet_wait"))
             
             if not packets:
-                self.page.listen.stop()
-                return {
+                result = {
                     "success": False,
                     "message": "未监听到API响应数据"
                 }
-            
-            # 处理响应数据
-            result = self._process_search_response(packets)
-            self.page.listen.stop()
-            
-            return result
+            else:
+                timings["packet"] = time.perf_counter() - start
+                # 处理响应数据
+                result = self._process_search_response(packets)
+                timings["parsed"] = time.perf_counter() - start
             
         except Exception as e:
+            result = {"success": False, "message": f"搜索失败: {str(e)}"}
+        finally:
             try:
-                self.page.listen.stop()
-            except:
+                page.listen.stop()
+            except Exception:
                 pass
-            
-            return {"success": False, "message": f"搜索失败: {str(e)}"}
+        
+        result["timings"] = timings
+        return result
     
     def search_jobs_with_scrolling(self, search_params: Dict, 
                                  manual_scroll: bool = False, 
-                                 max_scroll_times: Optional[int] = None) -> Dict:
+                                 max_scroll_times: Optional[int] = None,
+                                 dedupe_index: Optional[BossDedupeIndex] = None,
+                                 resume: bool = False) -> Dict:
         """
         通过滚动页面获取更多职位数据
         
@@ -162,6 +426,8 @@ class BossScraper:
             search_params: 搜索参数
             manual_scroll: 是否手动滚动
             max_scroll_times: 最大滚动次数
+            dedupe_index: 去重索引，为空则为本次会话新建
+            resume: 是否从上次相同参数的断点继续（恢复已收集的职位，并快进到上次的滚动位置），并为本次运行记录断点
         
         Returns:
             Dict: 搜索结果
@@ -172,6 +438,7 @@ class BossScraper:
         if max_scroll_times is None:
             max_scroll_times = self.config.get_limit("max_scroll_times")
         
+        run_key = None
         try:
             # 验证搜索参数
             is_valid, error_msg = self.url_builder.validate_search_params(search_params)
@@ -184,25 +451,44 @@ class BossScraper:
             # 访问搜索页面
             web_url = self.url_builder.build_web_url(search_params)
             print(f"访问搜索页面: {web_url}")
+            self._pace()
             self.page.get(web_url)
-            time.sleep(random.uniform(*self.config.get_delay("page_load")))
+            if self.config.get_capture_option("mode") == "sleep":
+                time.sleep(random.uniform(*self.config.get_delay("page_load")))
             
-            all_jobs = []
             collected_packets = []
+            if dedupe_index is None:
+                dedupe_index = BossDedupeIndex()
+            
+            # 断点：恢复已收集的职位和滚动进度
+            run_key, state = self._open_checkpoint(search_params, BossCheckpointStore.KIND_SCROLL, resume)
+            all_jobs = self._restore_checkpoint(run_key, dedupe_index)
+            progress = {
+                "run_key": run_key,
+                "scroll_count": state["scroll_count"],
+                "base_packets": state["packet_count"],
+            } if run_key else None
             
             # 获取初始数据
             packets = self.page.listen.wait(timeout=self.config.get_timeout("packet_wait"))
             if packets:
-                new_count = self.data_processor.process_packets(packets, collected_packets, all_jobs)
+                old_count = len(all_jobs)
+                new_count = self.data_processor.process_packets(
+                    packets, collected_packets, all_jobs, dedupe_index
+                )
+                self._record_scroll_progress(progress, all_jobs, old_count, collected_packets)
                 print(f"初始数据: 获得 {new_count} 个职位")
             
             if manual_scroll:
-                result = self._handle_manual_scroll(all_jobs, collected_packets)
+                result = self._handle_manual_scroll(all_jobs, collected_packets, dedupe_index, progress)
             else:
-                result = self._handle_auto_scroll(all_jobs, collected_packets, max_scroll_times)
+                result = self._handle_auto_scroll(all_jobs, collected_packets, max_scroll_times,
+                                                  dedupe_index, progress)
             
             # 停止监听
             self.page.listen.stop()
+            if run_key:
+                self.checkpoint_store.finish_run(run_key)
             
             # 保存数据
             if all_jobs:
@@ -221,16 +507,31 @@ class BossScraper:
                 self.page.listen.stop()
             except:
                 pass
+            if run_key:
+                self.checkpoint_store.finish_run(run_key, "failed", str(e))
             
             return {"success": False, "message": f"滚动搜索失败: {str(e)}"}
     
-    def batch_search(self, search_params: Dict, max_pages: Optional[int] = None) -> Dict:
+    def batch_search(self, search_params: Dict, max_pages: Optional[int] = None,
+                     dedupe_index: Optional[BossDedupeIndex] = None,
+                     workers: int = 1, max_age: Optional[float] = None,
+                     resume: bool = False, first_page: Optional[Dict] = None,
+                     save: bool = True, delta: Optional[bool] = None) -> Dict:
         """
         批量搜索多页职位
         
         Args:
             search_params: 搜索参数
             max_pages: 最大页数
+            dedupe_index: 去重索引，为空则为本次批量搜索新建
+            workers: 并发工作数，大于1时各页由工作池并发抓取
+            max_age: 可接受的缓存时长（秒），为空则使用缓存TTL，0表示强制刷新
+            resume: 是否从上次相同参数的断点继续（跳过已完成的页），并为本次运行记录断点
+            first_page: 已取得的第1页响应数据（zpData，如拆分查询时探测总数的响应），
+                提供时不再请求第1页（仅串行抓取）
+            save: 是否保存本次结果（调用方合并多次结果后统一保存时为False）
+            delta: 是否增量抓取（只输出相对上次新增或变化的职位，整页未变化时提前停止），
+                为空则使用配置；并发抓取时各页抓取完成后再按页顺序判断是否提前停止
         
         Returns:
             Dict: 搜索结果
@@ -241,57 +542,325 @@ class BossScraper:
         if max_pages is None:
             max_pages = self.config.get_limit("max_pages")
         
-        all_jobs = []
-        total_count = 0
+        # 商圈代码在开始翻页前预热一次（已缓存且未过期时不访问网络）
+        if search_params.get("district") and search_params.get("city"):
+            self.config.warm_up_districts([search_params["city"]])
+        
+        if dedupe_index is None:
+            dedupe_index = BossDedupeIndex()
+        run_key, state = self._open_checkpoint(search_params, BossCheckpointStore.KIND_BATCH, resume)
+        
+        if delta is None:
+            delta = bool(self.config.get_delta_option("enabled"))
         
-        for page in range(1, max_pages + 1):
+        if workers > 1:
+            return self._parallel_batch_search(search_params, max_pages, workers, dedupe_index, run_key, state,
+                                               save, delta)
+        
+        run = self._start_batch_run(run_key, state, dedupe_index, save, delta)
+        page_timings = []
+        
+        for page in self._pending_pages(run, max_pages):
             search_params_copy = search_params.copy()
             search_params_copy["page"] = page
             
-            result = self.search_jobs(search_params_copy)
+            if page == 1 and first_page is not None:
+                result = {"success": True, "data": first_page}
+            else:
+                result = self.search_jobs(search_params_copy, max_age=max_age)
+            if result.get("timings"):
+                page_timings.append({"page": page, **result["timings"]})
             
             if not result["success"]:
-                print(f"第{page}页搜索失败: {result['message']}")
+                run["error"] = result["message"]
+                print(f"第{page}页搜索失败: {run['error']}")
                 break
             
             data = result["data"]
-            job_list = data.get("jobList", [])
-            
-            if not job_list:
-                print(f"第{page}页无更多职位")
-                break
-            
-            page_jobs = self.data_processor.extract_job_list(job_list)
-            all_jobs.extend(page_jobs)
-            
-            # 获取总数信息（第一页）
-            if page == 1:
-                total_count = data.get("totalCount", 0)
-                print(f"搜索到总计 {total_count} 个职位")
-            
-            print(f"第{page}页获取 {len(page_jobs)} 个职位")
-            
-            # 检查是否还有下一页
-            if not data.get("hasMore", False):
-                print("已到最后一页")
+            if not self._process_batch_page(run, page, data.get("jobList", []), data.get("hasMore", False),
+                                            data.get("totalCount", 0)):
                 break
-            
-            # 随机延时防止被封
-            time.sleep(random.uniform(*self.config.get_delay("request")))
         
-        # 保存数据
-        if all_jobs:
-            self.data_processor.save_jobs_data(all_jobs)
+        return self._finish_batch_run(run, page_timings=page_timings)
+    
+    def _start_batch_run(self, run_key: Optional[str], state: Optional[Dict],
+                         dedupe_index: BossDedupeIndex, save: bool = True, delta: bool = False) -> Dict:
+        """
+        开始一次批量搜索：从断点恢复已完成的页、职位和计数（串行、并发、异步批量搜索共用）
+        
+        Args:
+            run_key: 断点运行键，为空则不记录断点
+            state: 断点中的运行状态（见 BossCheckpointStore.start_run）
+            dedupe_index: 本次运行的去重索引
+            save: 是否在结束时保存结果
+            delta: 是否增量抓取
         
+        Returns:
+            Dict: 运行状态，由 _process_batch_page 逐页更新
+        """
+        completed = set(state["completed_units"]) if state else set()
         return {
+            "run_key": run_key,
+            "dedupe_index": dedupe_index,
+            "jobs": self._restore_checkpoint(run_key, dedupe_index),
+            # 保存时附带的汇总随翻页增量更新，保存时不再重新统计全部职位
+            "summary": BossJobSummary() if save else None,
+            "completed": completed,
+            "finished": bool(completed) and not state["has_more"],
+            "total_count": state["total_count"] if state else 0,
+            "fetched": state["job_count"] if state else 0,
+            "delta": delta,
+            "stop_after": (self.config.get_delta_option("stop_after_unchanged_pages") or 0) if delta else 0,
+            "delta_counts": {"new": 0, "changed": 0, "unchanged": 0},
+            "seen_states": [],
+            "unchanged_pages": 0,
+            "unchanged_stop": False,
+            "error": "",
+        }
+    
+    @staticmethod
+    def _pending_pages(run: Dict, max_pages: int) -> List[int]:
+        """断点中未完成的页（上次运行已到最后一页时为空）"""
+        if run["finished"]:
+            return []
+        return [page for page in range(1, max_pages + 1) if page not in run["completed"]]
+    
+    def _process_batch_page(self, run: Dict, page: int, job_list: List[Dict], has_more: bool,
+                            total_count: int = 0) -> bool:
+        """
+        按页顺序处理一页：增量分类，提取并写入输出目标，更新计数和断点，判断是否继续翻页
+        
+        Args:
+            run: 运行状态（见 _start_batch_run），原地更新
+            page: 页码
+            job_list: 接口返回的原始职位列表
+            has_more: 接口返回的 hasMore
+            total_count: 接口返回的职位总数（只使用第1页的）
+        
+        Returns:
+            bool: 是否继续请求下一页
+        """
+        run_key = run["run_key"]
+        if not job_list:
+            print(f"第{page}页无更多职位")
+            if run_key:
+                self.checkpoint_store.complete_unit(run_key, page, [], has_more=False)
+            run["completed"].add(page)
+            return False
+        
+        if run["delta"]:
+            changed_jobs = self._classify_delta(job_list, run["delta_counts"], run["seen_states"])
+            run["unchanged_pages"] = 0 if changed_jobs else run["unchanged_pages"] + 1
+            page_jobs = self.data_processor.extract_job_list(changed_jobs, run["dedupe_index"])
+        else:
+            page_jobs = self.data_processor.extract_job_list(job_list, run["dedupe_index"])
+        run["jobs"].extend(page_jobs)
+        if run["summary"] is not None:
+            run["summary"].update(run["jobs"])
+        
+        if page == 1:
+            run["total_count"] = total_count
+            print(f"搜索到总计 {total_count} 个职位")
+        print(f"第{page}页获取 {len(page_jobs)} 个职位")
+        
+        # 已取到总数时不再请求下一页（最后一页的 hasMore 有时仍为true）
+        run["fetched"] += len(job_list)
+        total_count = run["total_count"]
+        has_more = has_more and not (total_count and run["fetched"] >= total_count)
+        unchanged_stop = bool(run["stop_after"] and run["unchanged_pages"] >= run["stop_after"] and has_more)
+        if unchanged_stop:
+            run["unchanged_stop"] = True
+            has_more = False
+        if run_key:
+            self.checkpoint_store.complete_unit(
+                run_key, page, page_jobs, has_more=has_more,
+                total_count=total_count if page == 1 else None,
+            )
+        run["completed"].add(page)
+        
+        if not has_more:
+            print(f"连续 {run['unchanged_pages']} 页职位均未变化，停止翻页" if unchanged_stop else "已到最后一页")
+        return has_more
+    
+    def _finish_batch_run(self, run: Dict, **extra) -> Dict:
+        """
+        结束一次批量搜索：记录断点状态，保存结果，写入增量抓取的职位状态
+        
+        Args:
+            run: 运行状态（见 _start_batch_run）
+            **extra: 附加到结果中的字段（如 page_timings、worker_stats）
+        
+        Returns:
+            Dict: 搜索结果
+        """
+        error = run["error"]
+        if run["run_key"]:
+            self.checkpoint_store.finish_run(
+                run["run_key"], BossCheckpointStore.STATUS_FAILED if error else BossCheckpointStore.STATUS_DONE, error
+            )
+        
+        jobs = run["jobs"]
+        if jobs and run["summary"] is not None:
+            self.data_processor.save_jobs_data(jobs, summary=run["summary"])
+        if run["seen_states"]:
+            self.job_state_store.record(run["seen_states"])
+        
+        result = {
             "success": True,
-            "jobs": all_jobs,
-            "total_jobs": len(all_jobs),
-            "total_count": total_count,
-            "pages_fetched": min(page, max_pages),
+            "jobs": jobs,
+            "total_jobs": len(jobs),
+            "total_count": run["total_count"],
+            "pages_fetched": len(run["completed"]),
+            **extra,
+            "completed": not error,
         }
+        if run["delta"]:
+            self._report_delta(result, run["delta_counts"], run["unchanged_stop"])
+        return result
     
-    def _handle_manual_scroll(self, all_jobs: List, collected_packets: List) -> None:
+    def _classify_delta(self, job_list: List[Dict], delta_counts: Dict[str, int],
+                        seen_states: List[Dict]) -> List[Dict]:
+        """
+        增量抓取：给一页原始职位分类并计数（状态在保存数据后统一写入）
+        
+        Args:
+            job_list: 接口返回的原始职位列表
+            delta_counts: 各类职位计数，原地累加
+            seen_states: 待写入状态库的原始职位，原地追加
+        
+        Returns:
+            List[Dict]: 新增和变化的原始职位（未变化的职位不提取也不输出）
+        """
+        statuses = self.job_state_store.classify(job_list)
+        for status in statuses.values():
+            delta_counts[status] += 1
+        seen_states.extend(job_list)
+        return [job for job in job_list if statuses.get(job.get("encryptJobId")) != STATUS_UNCHANGED]
+    
+    @staticmethod
+    def _report_delta(result: Dict, delta_counts: Dict[str, int], stopped_early: bool) -> None:
+        """把增量抓取统计写入结果并打印"""
+        result["delta"] = {**delta_counts, "stopped_early": stopped_early}
+        print(f"增量抓取: 新增 {delta_counts['new']}，变化 {delta_counts['changed']}，"
+              f"未变化 {delta_counts['unchanged']}")
+    
+    def _parallel_batch_search(self, search_params: Dict, max_pages: int, workers: int,
+                               dedupe_index: BossDedupeIndex, run_key: Optional[str] = None,
+                               state: Optional[Dict] = None, save: bool = True,
+                               delta: bool = False) -> Dict:
+        """使用工作池并发抓取多页（跳过断点中已完成的页；增量抓取时各页抓取完成后按页顺序分类）"""
+        run = self._start_batch_run(run_key, state, dedupe_index, save, delta)
+        tasks = []
+        for page in self._pending_pages(run, max_pages):
+            search_params_copy = search_params.copy()
+            search_params_copy["page"] = page
+            tasks.append(search_params_copy)
+        
+        worker_stats = {}
+        if tasks:
+            # 工作池只返回原始职位：这里按页顺序处理，到最后一页为止，用本次运行的索引（含断点中的职位）
+            # 提取并写入输出目标，之后的页（并发时可能已提前抓取）不会输出
+            result = self.search_tasks(tasks, workers=workers, raw=True)
+            if not result["success"]:
+                return result
+            worker_stats = result["worker_stats"]
+            
+            for task_result, task_jobs in zip(result["task_results"], result["jobs_by_task"]):
+                page = task_result["params"]["page"]
+                if not task_result["success"]:
+                    run["error"] = task_result["message"]
+                    print(f"第{page}页搜索失败: {run['error']}")
+                    break
+                if not self._process_batch_page(run, page, task_jobs, task_result["has_more"],
+                                                task_result["total_count"]):
+                    break
+        
+        return self._finish_batch_run(run, worker_stats=worker_stats)
+    
+    def partitioned_search(self, search_params: Dict, max_pages: Optional[int] = None,
+                           resume: bool = False, **options) -> Dict:
+        """
+        拆分查询搜索：总数超过翻页上限时按筛选条件自动拆分，抓取全部分区并去重
+        
+        Args:
+            search_params: 搜索参数
+            max_pages: 每个分区最大页数
+            resume: 各分区是否从断点继续
+            **options: BossQueryPartitioner 参数（max_results、facets、max_partitions）
+        
+        Returns:
+            Dict: 搜索结果
+        """
+        from .partitioner import BossQueryPartitioner
+        
+        return BossQueryPartitioner(self, **options).search(search_params, max_pages, resume=resume)
+    
+    def search_tasks(self, tasks: List[Dict], workers: Optional[int] = None,
+                     mode: str = "tab", max_rps: Optional[float] = None,
+                     fetch_mode: Optional[str] = None, raw: bool = False) -> Dict:
+        """
+        使用工作池并发执行多个单页搜索任务
+        
+        Args:
+            tasks: 搜索参数列表，每项包含 query、city、page 等
+            workers: 并发工作数，为空则使用配置
+            mode: "tab" 多标签页 或 "browser" 多浏览器实例
+            max_rps: 本次工作池每秒最大请求数，为空则只受请求调度器限制
+            fetch_mode: 抓取方式，为空则使用配置
+            raw: 是否只返回各任务的原始职位（jobs_by_task），由调用方筛选后再提取
+        
+        Returns:
+            Dict: 按任务顺序合并的结果，包含各工作线程统计
+        """
+        if not self._check_initialized():
+            return {"success": False, "message": "爬虫未初始化"}
+        
+        from .worker_pool import BossWorkerPool
+        
+        with BossWorkerPool(self, workers=workers, mode=mode, max_rps=max_rps) as pool:
+            result = pool.run(tasks, fetch_mode=fetch_mode)
+        if raw or not result["success"]:
+            return result
+        
+        # 按任务顺序提取并跨任务去重
+        dedupe_index = BossDedupeIndex()
+        jobs_by_task = [self.data_processor.extract_job_list(job_list, dedupe_index)
+                        for job_list in result["jobs_by_task"]]
+        for task_result, page_jobs in zip(result["task_results"], jobs_by_task):
+            task_result["jobs_count"] = len(page_jobs)
+        jobs = [job for page_jobs in jobs_by_task for job in page_jobs]
+        result.update(jobs=jobs, total_jobs=len(jobs), jobs_by_task=jobs_by_task)
+        return result
+    
+    def _record_scroll_progress(self, progress: Optional[Dict], all_jobs: List, old_count: int,
+                                collected_packets: List, scroll_count: Optional[int] = None) -> None:
+        """
+        记录滚动搜索进度：新增职位作为一个单位写入断点，没有新职位时只更新滚动次数
+        
+        Args:
+            progress: 滚动进度（run_key、scroll_count、base_packets），未启用断点时为None
+            all_jobs: 所有职位列表
+            old_count: 本次处理前的职位数
+            collected_packets: 本次运行已处理的数据包
+            scroll_count: 已滚动次数
+        """
+        if not progress:
+            return
+        if scroll_count is not None:
+            progress["scroll_count"] = max(progress["scroll_count"], scroll_count)
+        
+        packet_count = progress["base_packets"] + len(collected_packets)
+        new_jobs = all_jobs[old_count:]
+        if new_jobs:
+            self.checkpoint_store.complete_unit(
+                progress["run_key"], packet_count, new_jobs,
+                scroll_count=progress["scroll_count"], packet_count=packet_count,
+            )
+        else:
+            self.checkpoint_store.update_progress(progress["run_key"], progress["scroll_count"], packet_count)
+    
+    def _handle_manual_scroll(self, all_jobs: List, collected_packets: List,
+                              dedupe_index: BossDedupeIndex, progress: Optional[Dict] = None) -> None:
         """处理手动滚动模式"""
         print("\n=== 手动滚动模式 ===")
         print("请在浏览器中手动滚动页面加载更多职位")
@@ -307,7 +876,10 @@ class BossScraper:
             packets = self.page.listen.wait(timeout=self.config.get_timeout("packet_wait_after_scroll"))
             if packets:
                 old_count = len(all_jobs)
-                new_count = self.data_processor.process_packets(packets, collected_packets, all_jobs)
+                new_count = self.data_processor.process_packets(
+                    packets, collected_packets, all_jobs, dedupe_index
+                )
+                self._record_scroll_progress(progress, all_jobs, old_count, collected_packets)
                 if new_count > 0:
                     print(f"收集到 {new_count} 个新职位，总计: {len(all_jobs)}")
                 else:
@@ -315,8 +887,9 @@ class BossScraper:
             else:
                 print("未监听到新数据包")
     
-    def _handle_auto_scroll(self, all_jobs: List, collected_packets: List, max_scroll_times: int) -> None:
-        """处理自动滚动模式"""
+    def _handle_auto_scroll(self, all_jobs: List, collected_packets: List, max_scroll_times: int,
+                            dedupe_index: BossDedupeIndex, progress: Optional[Dict] = None) -> None:
+        """处理自动滚动模式（从断点恢复时，先快进到上次的滚动次数）"""
         print(f"\n=== 自动滚动模式 (最多{max_scroll_times}次) ===")
         
         # 找到职位列表元素
@@ -326,32 +899,48 @@ class BossScraper:
             print("未找到职位列表元素 .rec-job-list")
             return
         
+        # 上次已完成的滚动只用于回到原位置，其间没有新职位不代表到底
+        replay = progress["scroll_count"] if progress else 0
+        
         for i in range(max_scroll_times):
-            print(f"第 {i+1} 次滚动...")
+            print(f"第 {i+1} 次滚动{'（快进）' if i < replay else ''}...")
             
-            # 滚动到页面底部
+            # 滚动到页面底部（滚动会触发下一页请求，同样需要申请许可）
+            self._pace()
             self.page.scroll.to_bottom()
-            time.sleep(random.uniform(*self.config.get_delay("scroll")))
             
             # 检查新的数据包
             packets = self.page.listen.wait(timeout=self.config.get_timeout("packet_wait_scroll"))
+            old_count = len(all_jobs)
+            new_count = 0
             if packets:
-                old_count = len(all_jobs)
-                new_count = self.data_processor.process_packets(packets, collected_packets, all_jobs)
-                if new_count > 0:
-                    print(f"收集到 {new_count} 个新职位，总计: {len(all_jobs)}")
-                else:
-                    print("未收集到新职位，可能已到底部")
-                    break
-            else:
+                new_count = self.data_processor.process_packets(
+                    packets, collected_packets, all_jobs, dedupe_index
+                )
+            self._record_scroll_progress(progress, all_jobs, old_count, collected_packets, i + 1)
+            
+            if not packets:
                 print("未监听到新数据包")
+            elif new_count > 0:
+                print(f"收集到 {new_count} 个新职位，总计: {len(all_jobs)}")
+            elif i >= replay:
+                print("未收集到新职位，可能已到底部")
+                break
     
     def _process_search_response(self, packets) -> Dict:
-        """处理搜索响应"""
+        """
+        处理搜索响应
+        
+        Args:
+            packets: 数据包或数据包列表，也可以是接口直连得到的响应体
+        """
         latest_packet = packets[-1] if isinstance(packets, list) else packets
         
         try:
-            response_data = latest_packet.response.body
+            if hasattr(latest_packet, "response"):
+                response_data = latest_packet.response.body
+            else:
+                response_data = latest_packet
             
             # 如果是字节类型，转换为字符串
             if isinstance(response_data, bytes):
@@ -364,10 +953,15 @@ class BossScraper:
             else:
                 data = response_data
             
-            # 保存原始响应
-            self.data_processor.save_raw_response(data)
+            # 归档原始响应（后台写入，不阻塞抓取）
+            self.data_processor.archive_raw_response(data, getattr(latest_packet, "url", ""))
+            
+            # 检查响应状态，并反馈给调度器（受限时自动降速）
+            if data.get("code") == 37:
+                self.rate_scheduler.report_limited(self.host)
+            else:
+                self.rate_scheduler.report_success(self.host)
             
-            # 检查响应状态
             if data.get("code") == 0:
                 return {
                     "success": True,
@@ -419,6 +1013,18 @@ class BossScraper:
         try:
             if self.browser:
                 self.browser.close()
+            if self.api_client:
+                self.api_client.close()
+            if self.response_cache:
+                self.response_cache.close()
+            if self._checkpoint_store:
+                self._checkpoint_store.close()
+                self._checkpoint_store = None
+            if self._job_state_store:
+                self._job_state_store.close()
+                self._job_state_store = None
+            if self.data_processor:
+                self.data_processor.close()
             self._initialized = False
             print("✅ 爬虫已关闭")
         except Exception as e:
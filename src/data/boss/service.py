@@ -0,0 +1,376 @@
+import os
+import json
+import time
+import queue
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from typing import Dict, List, Optional
+from .config import BossConfig
+from .boss_scraper import BossJobScraper, build_search_params
+from .job_record import job_to_json
+
+
+class BossScraperService:
+    """Boss直聘常驻爬虫服务
+
+    预先启动并认证若干 BossJobScraper 实例并保持常驻，搜索请求轮流借用
+    已就绪的实例，省去每次调用时启动浏览器、加载cookies、检查登录和
+    建立会话的固定开销。实例失效后立即重建，重建失败时在后台按指数退避
+    继续重试，成功后放回空闲队列，实例数不会因一次重建失败而永久减少。
+    关闭服务时只关闭空闲实例，借出的实例由搜索线程在搜索结束后关闭，不再重建。
+    """
+
+    MAX_RESTART_BACKOFF = 300  # 后台重建的最长间隔（秒）
+
+    def __init__(self, config: Optional[BossConfig] = None, instances: int = 1,
+                 checkout_timeout: float = 300, restart_backoff: float = 5, **auth_params):
+        """
+        初始化爬虫服务
+
+        Args:
+            config: 配置管理器实例
+            instances: 常驻爬虫实例数
+            checkout_timeout: 等待空闲实例的最长时间（秒）
+            restart_backoff: 重建失败后首次后台重试的等待秒数，之后逐次加倍
+            **auth_params: 认证参数（cookies、cookie_string、cookie_file、token）
+        """
+        self.config = config or BossConfig()
+        self.instances = instances
+        self.checkout_timeout = checkout_timeout
+        self.restart_backoff = restart_backoff
+        self.auth_params = auth_params
+
+        self._idle: "queue.Queue[BossJobScraper]" = queue.Queue()
+        self._scrapers: List[BossJobScraper] = []
+        self._lock = threading.Lock()
+        # 实例归还或退役时通知，关闭服务时据此等待借出的实例
+        self._returned = threading.Condition(self._lock)
+
+        self._cold_starts: List[float] = []
+        self._latencies: deque = deque(maxlen=1000)
+        self._requests = 0
+        self._failures = 0
+        self._restarts = 0
+        self._pending_restarts = 0
+        self._started_at: Optional[float] = None
+        self._closed = threading.Event()
+
+    def _create_scraper(self) -> Optional[BossJobScraper]:
+        """启动并认证一个爬虫实例，记录冷启动耗时"""
+        start = time.time()
+        scraper = BossJobScraper(self.config)
+
+        try:
+            initialized = scraper.initialize(**self.auth_params)
+        except Exception as e:
+            print(f"❌ 启动爬虫实例出错: {e}")
+            initialized = False
+        if not initialized:
+            scraper.close()
+            return None
+
+        with self._lock:
+            self._cold_starts.append(time.time() - start)
+        return scraper
+
+    def start(self) -> bool:
+        """
+        启动常驻实例
+
+        Returns:
+            bool: 是否至少有一个实例就绪
+        """
+        self._started_at = time.time()
+
+        for i in range(self.instances):
+            print(f"正在启动爬虫实例 {i + 1}/{self.instances}...")
+            scraper = self._create_scraper()
+            if scraper:
+                self._scrapers.append(scraper)
+                self._idle.put(scraper)
+            else:
+                print(f"❌ 爬虫实例 {i + 1} 启动失败")
+
+        print(f"✅ 爬虫服务就绪: {len(self._scrapers)}/{self.instances} 个实例")
+        return bool(self._scrapers)
+
+    def _release(self, scraper: BossJobScraper) -> None:
+        """归还借出的实例：服务已关闭时关闭实例，否则放回空闲队列"""
+        with self._lock:
+            closed = self._closed.is_set()
+            if closed:
+                if scraper in self._scrapers:
+                    self._scrapers.remove(scraper)
+            else:
+                # 在锁内放回，close() 取走空闲实例时不会漏掉
+                self._idle.put(scraper)
+            self._returned.notify_all()
+        if closed:
+            scraper.close()
+
+    def _restart_scraper(self, scraper: BossJobScraper) -> Optional[BossJobScraper]:
+        """重建失效的爬虫实例，失败时转入后台重试（返回None，实例稍后放回空闲队列）"""
+        print("爬虫实例失效，正在重建...")
+        scraper.close()
+
+        new_scraper = self._create_scraper() if not self._closed.is_set() else None
+        with self._lock:
+            closed = self._closed.is_set()
+            if scraper in self._scrapers:
+                self._scrapers.remove(scraper)
+            if closed:
+                self._returned.notify_all()
+            else:
+                self._restarts += 1
+                if new_scraper:
+                    self._scrapers.append(new_scraper)
+                else:
+                    self._pending_restarts += 1
+
+        if closed:
+            # 重建期间服务已关闭
+            if new_scraper:
+                new_scraper.close()
+            return None
+        if not new_scraper:
+            print(f"❌ 重建爬虫实例失败，{self.restart_backoff}秒后在后台重试")
+            threading.Thread(target=self._restart_in_background, name="boss-service-restart",
+                             daemon=True).start()
+        return new_scraper
+
+    def _restart_in_background(self) -> None:
+        """后台按指数退避重建实例，直到成功（放回空闲队列）或服务关闭"""
+        delay = self.restart_backoff
+        while not self._closed.wait(delay):
+            scraper = self._create_scraper()
+            if not scraper:
+                delay = min(delay * 2, self.MAX_RESTART_BACKOFF)
+                print(f"❌ 重建爬虫实例失败，{delay}秒后重试")
+                continue
+
+            with self._lock:
+                closed = self._closed.is_set()
+                if not closed:
+                    self._pending_restarts -= 1
+                    self._scrapers.append(scraper)
+                    self._idle.put(scraper)
+            if closed:
+                scraper.close()
+            else:
+                print("✅ 爬虫实例已在后台重建")
+            return
+
+    def search(self, params: Dict) -> Dict:
+        """
+        使用常驻实例执行搜索，参数格式同 search_boss_jobs
+
+        Args:
+            params: 搜索参数（可包含 max_pages、resume、partition、delta）
+
+        Returns:
+            Dict: 搜索结果
+        """
+        if self._closed.is_set():
+            return {"success": False, "jobs": [], "total_jobs": 0, "error": "爬虫服务已关闭"}
+        try:
+            scraper = self._idle.get(timeout=self.checkout_timeout)
+        except queue.Empty:
+            return {"success": False, "jobs": [], "total_jobs": 0, "error": "没有空闲的爬虫实例"}
+
+        start = time.time()
+        try:
+            search_params = build_search_params(params)
+            max_pages = params.get("max_pages", 3)
+            if params.get("partition"):
+                result = scraper.partitioned_search(search_params, max_pages, resume=params.get("resume", False))
+            else:
+                result = scraper.batch_search(search_params, max_pages, resume=params.get("resume", False),
+                                              delta=params.get("delta"))
+        except Exception as e:
+            result = {"success": False, "jobs": [], "total_jobs": 0, "error": str(e)}
+        finally:
+            # 服务已关闭时直接关闭实例，不再重建
+            if (not self._closed.is_set()
+                    and (not scraper._initialized or not scraper.scraper.browser.is_browser_running())):
+                scraper = self._restart_scraper(scraper)
+            if scraper:
+                self._release(scraper)
+
+        latency = time.time() - start
+        with self._lock:
+            self._requests += 1
+            self._latencies.append(latency)
+            if not result.get("success"):
+                self._failures += 1
+
+        result["latency"] = latency
+        return result
+
+    @staticmethod
+    def _summarize(values: List[float]) -> Dict:
+        """计算耗时统计"""
+        if not values:
+            return {"count": 0}
+
+        ordered = sorted(values)
+        return {
+            "count": len(ordered),
+            "avg": sum(ordered) / len(ordered),
+            "p50": ordered[len(ordered) // 2],
+            "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            "max": ordered[-1],
+        }
+
+    def get_metrics(self) -> Dict:
+        """
+        获取服务指标
+
+        Returns:
+            Dict: 冷启动与热请求耗时、请求数、失败数等
+        """
+        with self._lock:
+            return {
+                "instances": len(self._scrapers),
+                "idle_instances": self._idle.qsize(),
+                "uptime": time.time() - self._started_at if self._started_at else 0,
+                "requests": self._requests,
+                "failures": self._failures,
+                "restarts": self._restarts,
+                "pending_restarts": self._pending_restarts,
+                "cold_start_latency": self._summarize(self._cold_starts),
+                "warm_request_latency": self._summarize(list(self._latencies)),
+            }
+
+    @property
+    def is_ready(self) -> bool:
+        """是否有可用实例"""
+        return bool(self._scrapers)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        关闭服务：立即关闭空闲实例并停止后台重建，借出的实例在其搜索结束后由搜索线程关闭
+
+        Args:
+            timeout: 等待借出实例归还的最长时间（秒），为空则使用 checkout_timeout
+        """
+        with self._lock:
+            self._closed.set()
+            idle = []
+            while True:
+                try:
+                    idle.append(self._idle.get_nowait())
+                except queue.Empty:
+                    break
+            for scraper in idle:
+                self._scrapers.remove(scraper)
+        for scraper in idle:
+            scraper.close()
+
+        with self._returned:
+            if not self._returned.wait_for(lambda: not self._scrapers,
+                                           self.checkout_timeout if timeout is None else timeout):
+                print(f"⚠️ 仍有 {len(self._scrapers)} 个实例在执行搜索，将在搜索结束后关闭")
+        print("✅ 爬虫服务已关闭")
+
+
+class _UnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    """基于Unix套接字的多线程HTTP服务"""
+
+    daemon_threads = True
+
+
+class BossServiceServer:
+    """Boss直聘爬虫服务HTTP入口
+
+    路由:
+        GET  /health   健康检查
+        GET  /metrics  服务指标
+        POST /search   搜索，请求体为JSON格式的搜索参数
+    """
+
+    def __init__(self, service: BossScraperService, host: str = "0.0.0.0",
+                 port: int = 8080, unix_socket: Optional[str] = None):
+        """
+        初始化HTTP入口
+
+        Args:
+            service: 爬虫服务实例
+            host: 监听地址
+            port: 监听端口
+            unix_socket: Unix套接字路径，设置后忽略host和port
+        """
+        self.service = service
+        self.host = host
+        self.port = port
+        self.unix_socket = unix_socket
+        self._server = None
+
+    def _make_handler(self):
+        """创建请求处理类"""
+        service = self.service
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send_json(self, status: int, data: Dict) -> None:
+                body = json.dumps(data, ensure_ascii=False, default=job_to_json).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json;charset=UTF-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path == "/health":
+                    status = 200 if service.is_ready else 503
+                    self._send_json(status, {"status": "ok" if service.is_ready else "unavailable"})
+                elif self.path == "/metrics":
+                    self._send_json(200, service.get_metrics())
+                else:
+                    self._send_json(404, {"error": "not found"})
+
+            def do_POST(self):
+                if self.path != "/search":
+                    self._send_json(404, {"error": "not found"})
+                    return
+
+                try:
+                    length = int(self.headers.get("Content-Length", 0))
+                    params = json.loads(self.rfile.read(length) or b"{}")
+                except (ValueError, json.JSONDecodeError) as e:
+                    self._send_json(400, {"success": False, "error": f"请求参数错误: {e}"})
+                    return
+
+                self._send_json(200, service.search(params))
+
+            def address_string(self):
+                return self.client_address[0] if self.client_address else "unix"
+
+            def log_message(self, format, *args):
+                print(f"[service] {self.address_string()} {format % args}")
+
+        return Handler
+
+    def serve_forever(self) -> None:
+        """启动HTTP服务（阻塞）"""
+        handler = self._make_handler()
+
+        if self.unix_socket:
+            if os.path.exists(self.unix_socket):
+                os.remove(self.unix_socket)
+            self._server = _UnixHTTPServer(self.unix_socket, handler)
+            print(f"✅ 爬虫服务监听: unix:{self.unix_socket}")
+        else:
+            self._server = ThreadingHTTPServer((self.host, self.port), handler)
+            print(f"✅ 爬虫服务监听: http://{self.host}:{self.port}")
+
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        """停止HTTP服务"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            if self.unix_socket and os.path.exists(self.unix_socket):
+                os.remove(self.unix_socket)
@@ -0,0 +1,283 @@
+import json
+import time
+import queue
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from .job_index import BossJobFilter, BossJobIndex
+from .job_record import JobRecord
+from .salary import PAY_MONTHLY
+
+
+class BossSqliteStore:
+    """Boss直聘职位SQLite存储
+
+    所有批次的职位按 job_id 合并到同一个数据库，跨批次查询不必加载和合并多个JSON文件。
+    抓取线程调用 write_jobs 只把职位放入队列，由后台线程写入：队列中积压的职位合并为
+    一个事务（最多 batch_size 个），用 INSERT ... ON CONFLICT(job_id) DO UPDATE 更新，
+    first_seen 保留首次写入时间。城市、公司、学历和薪资上下限建有索引。
+    实现 write_jobs/flush/close，可作为 BossDataProcessor 的输出目标。
+    """
+
+    FIELDS = tuple(name for name, _, _ in JobRecord.FIELDS)
+    LIST_FIELDS = JobRecord.LIST_FIELDS
+    REAL_FIELDS = ("salary_min", "salary_max", "longitude", "latitude")
+    INDEXES = ("city_name", "brand_name", "job_degree", "salary_min", "salary_max")
+
+    # 查询时转为SQL条件的等值条件（其余条件读出后再由 BossJobFilter 判定）
+    SQL_FILTERS = {**BossJobIndex.EQUALITY_FILTERS, "brands": "brand_name"}
+
+    def __init__(self, db_path: str, batch_size: int = 1000, queue_size: int = 10000):
+        """
+        初始化存储
+
+        Args:
+            db_path: SQLite数据库文件路径
+            batch_size: 每个事务最多写入的职位数
+            queue_size: 写入队列长度（按批计），队列满时 write_jobs 等待写入线程
+        """
+        self.db_path = db_path
+        self.batch_size = batch_size
+
+        self.written = 0
+        self.transactions = 0
+        self.skipped = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_tables()
+
+        columns = self.FIELDS + ("first_seen", "last_seen")
+        updates = ", ".join(f"{name} = excluded.{name}" for name in self.FIELDS if name != "job_id")
+        self._upsert_sql = (
+            f"INSERT INTO jobs ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT(job_id) DO UPDATE SET {updates}, last_seen = excluded.last_seen"
+        )
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._writer_loop, name="boss-sqlite-store", daemon=True)
+        self._thread.start()
+
+    def _create_tables(self) -> None:
+        """建表和索引"""
+        columns = []
+        for name in self.FIELDS:
+            if name == "job_id":
+                columns.append("job_id TEXT PRIMARY KEY")
+            elif name in self.REAL_FIELDS:
+                columns.append(f"{name} REAL")
+            elif name in self.LIST_FIELDS:
+                columns.append(f"{name} TEXT")
+            else:
+                columns.append(name)
+        columns += ["first_seen REAL NOT NULL", "last_seen REAL NOT NULL"]
+
+        with self._conn:
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS jobs ({', '.join(columns)})")
+            for name in self.INDEXES:
+                self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_jobs_{name} ON jobs ({name})")
+
+    def _to_row(self, job: Dict, now: float) -> Optional[Tuple]:
+        """职位 -> 数据库行，没有职位ID返回None"""
+        if not job.get("job_id"):
+            return None
+        row = []
+        for name in self.FIELDS:
+            value = job.get(name)
+            if name in self.LIST_FIELDS and value is not None:
+                value = json.dumps(value, ensure_ascii=False)
+            row.append(value)
+        row += [now, now]
+        return tuple(row)
+
+    def write_jobs(self, jobs: Iterable[Dict]) -> None:
+        """
+        提交职位（放入写入队列后立即返回）
+
+        Args:
+            jobs: 标准化职位（JobRecord 或字典）
+        """
+        jobs = list(jobs)
+        if jobs:
+            self._queue.put(jobs)
+
+    def _writer_loop(self) -> None:
+        """后台写入线程：合并队列中积压的批次，每批一个事务"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                break
+
+            batches = [item]
+            count = len(item)
+            stop = False
+            while count < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batches.append(item)
+                count += len(item)
+
+            try:
+                self._write([job for batch in batches for job in batch])
+            except Exception as e:
+                print(f"❌ 写入SQLite存储失败: {e}")
+            finally:
+                for _ in range(len(batches) + stop):
+                    self._queue.task_done()
+
+            if stop:
+                break
+
+    def _write(self, jobs: List[Dict]) -> None:
+        """在一个事务中写入一批职位"""
+        now = time.time()
+        rows = [row for row in (self._to_row(job, now) for job in jobs) if row is not None]
+        self.skipped += len(jobs) - len(rows)
+        if not rows:
+            return
+
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(self._upsert_sql, rows)
+        self.written += len(rows)
+        self.transactions += 1
+
+    def _to_job(self, row: Tuple) -> JobRecord:
+        """数据库行 -> 职位记录"""
+        fields = {}
+        for name, value in zip(self.FIELDS, row):
+            if name in self.LIST_FIELDS and value is not None:
+                value = json.loads(value)
+            if value is not None:
+                fields[name] = value
+        fields.setdefault("salary_min", None)
+        return JobRecord(**fields)
+
+    def query(self, filters: Optional[Dict] = None, limit: Optional[int] = None,
+              order_by: str = "last_seen DESC") -> List[JobRecord]:
+        """
+        查询已保存的职位（会先等待队列中的职位写入）
+
+        城市、规模、学历、经验、公司（brands）和薪资范围转为SQL条件走索引，
+        关键词、技能、坐标等其余条件读出后再逐个判定。
+
+        Args:
+            filters: 过滤条件，同 BossJobFilter，另支持 brands（公司名称）
+            limit: 最多返回的职位数
+            order_by: 排序（SQL ORDER BY 子句）
+
+        Returns:
+            List[JobRecord]: 职位
+        """
+        self.flush()
+        filters = dict(filters or {})
+
+        where = []
+        args: List = []
+        for name, column in self.SQL_FILTERS.items():
+            if name in filters:
+                values = filters[name] if isinstance(filters[name], (list, tuple, set)) else [filters[name]]
+                where.append(f"{column} IN ({', '.join('?' * len(values))})")
+                args.extend(values)
+        filters.pop("brands", None)
+
+        job_filter = BossJobFilter(filters)
+        if job_filter.salary_range is not None:
+            lower, upper = job_filter.salary_range
+            where.append("pay_type = ? AND salary_min <= ? AND salary_max >= ?")
+            args.extend([PAY_MONTHLY, upper, lower])
+
+        # 只有SQL能完成的条件时才在SQL中限制条数
+        remaining = set(filters) - set(self.SQL_FILTERS) - {"salary_range"}
+        sql = f"SELECT {', '.join(self.FIELDS)} FROM jobs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order_by}"
+        if limit is not None and not remaining:
+            sql += f" LIMIT {int(limit)}"
+
+        with self._lock:
+            rows = self._conn.execute(sql, args).fetchall()
+
+        jobs = []
+        for row in rows:
+            job = self._to_job(row)
+            if remaining and not job_filter.matches(job):
+                continue
+            jobs.append(job)
+            if limit is not None and len(jobs) >= limit:
+                break
+        return jobs
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        """
+        按职位ID读取
+
+        Args:
+            job_id: 职位ID
+
+        Returns:
+            JobRecord or None: 职位
+        """
+        self.flush()
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(self.FIELDS)} FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return self._to_job(row) if row else None
+
+    def count(self) -> int:
+        """
+        已保存的职位数
+
+        Returns:
+            int: 职位数
+        """
+        self.flush()
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def flush(self) -> None:
+        """等待队列中的职位全部写入"""
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def get_stats(self) -> Dict:
+        """
+        获取存储统计
+
+        Returns:
+            Dict: 已写入职位数、事务数、跳过（无职位ID）数、队列积压批数
+        """
+        return {
+            "written": self.written,
+            "transactions": self.transactions,
+            "skipped": self.skipped,
+            "pending": self._queue.qsize(),
+            "path": self.db_path,
+        }
+
+    def close(self) -> None:
+        """写完队列中的职位，停止后台线程并关闭数据库"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        try:
+            self._conn.close()
+        except Exception as e:
+            print(f"关闭SQLite存储时出错: {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -0,0 +1,129 @@
+import os
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlparse, parse_qs
+
+
+class BossStubServer:
+    """Boss直聘本地桩服务
+
+    在本地端口回放录制好的 joblist.json 响应（默认为
+    result/last_search_response.json），用于在无网络、无浏览器的环境下
+    验证接口直连模式和做性能基准。
+    """
+
+    API_PATH = "/wapi/zpgeek/search/joblist.json"
+
+    def __init__(self, payloads: Optional[List[Dict]] = None,
+                 host: str = "127.0.0.1", port: int = 0):
+        """
+        初始化桩服务
+
+        Args:
+            payloads: 录制的响应列表，按页码循环返回；为空则加载 last_search_response.json
+            host: 监听地址
+            port: 监听端口，0 表示自动分配
+        """
+        self.payloads = payloads or [self.load_recorded_payload()]
+        self.host = host
+        self.port = port
+        self.requests: List[Dict] = []
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def load_recorded_payload(file_path: Optional[str] = None) -> Dict:
+        """
+        加载录制的响应文件
+
+        Args:
+            file_path: 响应文件路径，为空则使用 result/last_search_response.json
+
+        Returns:
+            Dict: 响应数据
+
+        Raises:
+            ValueError: 文件不是成功的 joblist.json 响应（如被受限响应覆盖）
+        """
+        if not file_path:
+            script_dir = os.path.dirname(os.path.abspath(__file__))
+            file_path = os.path.join(script_dir, "result", "last_search_response.json")
+
+        with open(file_path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        if not isinstance(payload.get("zpData"), dict) or "jobList" not in payload["zpData"]:
+            raise ValueError(f"录制的响应不包含职位列表（zpData.jobList）: {file_path}")
+        return payload
+
+    def _make_handler(self):
+        """创建请求处理类"""
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+                stub.requests.append({
+                    "path": parsed.path,
+                    "query": query,
+                    "cookie": self.headers.get("Cookie", ""),
+                })
+
+                if parsed.path != stub.API_PATH:
+                    self.send_error(404)
+                    return
+
+                page = int(query.get("page", 1))
+                payload = stub.payloads[(page - 1) % len(stub.payloads)]
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json;charset=UTF-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> str:
+        """
+        启动桩服务（后台线程）
+
+        Returns:
+            str: 接口地址，可直接作为 api_base_url 使用
+        """
+        self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.api_url
+
+    @property
+    def api_url(self) -> str:
+        """接口地址"""
+        return f"http://{self.host}:{self.port}{self.API_PATH}"
+
+    def stop(self) -> None:
+        """停止桩服务"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+
+    def __enter__(self):
+        """上下文管理器入口"""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """上下文管理器出口"""
+        self.stop()
@@ -14,14 +14,26 @@ class BossUrlBuilder:
             config: 配置管理器实例
         """
         self.config = config or BossConfig()
-        
-        # 尝试导入查询创建器
-        try:
-            from .queryCreator import QueryCreater
-            self.query_creator = QueryCreater()
-        except ImportError:
-            print("❌ 无法导入QueryCreater，条件查询功能将受限")
-            self.query_creator = None
+        self._query_creator = None
+        self._query_creator_loaded = False
+    
+    @property
+    def query_creator(self):
+        """查询创建器（第一次使用时加载，条件数据在实例间共享）"""
+        if not self._query_creator_loaded:
+            self._query_creator_loaded = True
+            try:
+                from .queryCreator import QueryCreater
+                self._query_creator = QueryCreater()
+            except (ImportError, OSError, ValueError) as e:
+                print(f"❌ 无法加载QueryCreater，条件查询功能将受限: {e}")
+                self._query_creator = None
+        return self._query_creator
+    
+    @query_creator.setter
+    def query_creator(self, query_creator) -> None:
+        self._query_creator = query_creator
+        self._query_creator_loaded = True
     
     def build_web_url(self, search_params: Dict) -> str:
         """
@@ -96,12 +108,14 @@ class BossUrlBuilder:
             else:
                 print(f"警告: 未找到城市 '{city_name}' 的代码")
         
-        # 商圈代码
+        # 商圈代码（只查本地商圈代码库，构建URL时不访问网络）
         district_name = search_params.get("district")
         if district_name and city_name:
             district_code = self.config.get_business_district_code(city_name, district_name)
             if district_code:
                 params["multiBusinessDistrict"] = district_code
+            else:
+                print(f"警告: 未找到商圈 '{district_name}' 的代码，请先调用 config.warm_up_districts(['{city_name}'])")
     
     def _add_condition_params(self, params: Dict, search_params: Dict) -> None:
         """
@@ -221,7 +235,9 @@ class BossUrlBuilder:
         if city_name:
             city_code = self.config.get_city_code(city_name)
             if not city_code:
-                return False, f"无效的城市名称: {city_name}"
+                candidates = self.config.find_city(city_name, limit=3)
+                hint = f"，是否为: {'、'.join(candidates)}" if candidates else ""
+                return False, f"无效的城市名称: {city_name}{hint}"
         
         # 检查页面参数
         page = search_params.get("page", 1)
@@ -0,0 +1,211 @@
+import time
+import queue
+import threading
+from typing import Dict, List, Optional
+from .auth import BossAuth
+from .browser import BossBrowser
+from .rate_limiter import BossRateLimiter
+
+
+class BossWorkerPool:
+    """Boss直聘并发抓取工作池
+
+    基于已初始化的 BossScraper，持有 N 个标签页（共享同一浏览器的cookies）
+    或 N 个独立浏览器实例（复制主浏览器的cookies），将搜索任务分发给各工作线程，
+    请求节奏由爬虫共享的请求调度器控制（可另外指定本工作池的速率上限）。
+    工作池只返回各任务的原始职位，不提取也不写入输出目标，由调用方决定保留哪些页、
+    按自己的去重索引提取。
+    """
+
+    MODE_TAB = "tab"
+    MODE_BROWSER = "browser"
+
+    def __init__(self, scraper, workers: Optional[int] = None,
+                 mode: str = MODE_TAB, max_rps: Optional[float] = None):
+        """
+        初始化工作池
+
+        Args:
+            scraper: 已初始化的 BossScraper 实例
+            workers: 工作线程数，为空则使用配置
+            mode: "tab" 多标签页 或 "browser" 多浏览器实例
+            max_rps: 本工作池每秒最大请求数，为空则只受请求调度器限制
+        """
+        self.scraper = scraper
+        self.config = scraper.config
+        self.workers = workers or self.config.get_limit("workers")
+        self.mode = mode
+        self.rate_limiter = BossRateLimiter(max_rps) if max_rps is not None else None
+
+        self.tabs: List = []
+        self._browsers: List[BossBrowser] = []
+        self._started = False
+
+    def start(self) -> bool:
+        """
+        创建工作标签页或浏览器实例
+
+        Returns:
+            bool: 是否成功启动
+        """
+        if self._started:
+            return True
+
+        try:
+            if self.mode == self.MODE_BROWSER:
+                self._start_browsers()
+            else:
+                self._start_tabs()
+        except Exception as e:
+            print(f"❌ 工作池启动失败: {e}")
+            self.close()
+            return False
+
+        self._started = True
+        print(f"✅ 工作池已启动: {len(self.tabs)} 个{'浏览器' if self.mode == self.MODE_BROWSER else '标签页'}")
+        return True
+
+    def _start_tabs(self) -> None:
+        """在主浏览器中打开工作标签页（同一浏览器的标签页共享cookies）"""
+        browser = self.scraper.browser.browser
+        self.tabs.append(self.scraper.page)
+        for _ in range(self.workers - 1):
+            self.tabs.append(browser.new_tab())
+
+    def _start_browsers(self) -> None:
+        """启动独立浏览器实例并复制主浏览器的cookies"""
+        cookies = self.scraper.auth.get_current_cookies() if self.scraper.auth else []
+        self.tabs.append(self.scraper.page)
+
+        for _ in range(self.workers - 1):
+            browser = BossBrowser(self.config)
+            if not browser.setup_browser():
+                raise RuntimeError("工作浏览器启动失败")
+            self._browsers.append(browser)
+
+            page = browser.get_page()
+            if cookies:
+                BossAuth(page).load_cookies(cookies)
+            self.tabs.append(page)
+
+    def run(self, tasks: List[Dict], fetch_mode: Optional[str] = None) -> Dict:
+        """
+        并发执行搜索任务
+
+        Args:
+            tasks: 搜索参数列表，每项为一次单页搜索（包含 query、city、page 等）
+            fetch_mode: 抓取方式，为空则使用配置
+
+        Returns:
+            Dict: 按任务顺序排列的原始职位（jobs_by_task）、任务结果及各工作线程统计
+        """
+        if not self.start():
+            return {"success": False, "message": "工作池启动失败"}
+
+        task_queue: "queue.Queue" = queue.Queue()
+        for index, task in enumerate(tasks):
+            task_queue.put((index, task))
+
+        results: List[Optional[Dict]] = [None] * len(tasks)
+        worker_stats: Dict[int, Dict] = {}
+        start_time = time.time()
+
+        def worker(worker_id: int, tab) -> None:
+            stats = {"tasks": 0, "failures": 0, "jobs": 0, "busy_time": 0.0, "wait_time": 0.0}
+            worker_stats[worker_id] = stats
+
+            while True:
+                try:
+                    index, task = task_queue.get_nowait()
+                except queue.Empty:
+                    return
+
+                if self.rate_limiter:
+                    stats["wait_time"] += self.rate_limiter.acquire()
+                task_start = time.time()
+                try:
+                    result = self.scraper.search_jobs(task, fetch_mode=fetch_mode, tab=tab)
+                except Exception as e:
+                    result = {"success": False, "message": f"搜索失败: {str(e)}"}
+                scheduler_wait = result.get("timings", {}).get("rate_wait", 0.0)
+                stats["wait_time"] += scheduler_wait
+                stats["busy_time"] += time.time() - task_start - scheduler_wait
+
+                stats["tasks"] += 1
+                if result["success"]:
+                    stats["jobs"] += len(result["data"].get("jobList", []))
+                else:
+                    stats["failures"] += 1
+
+                result["worker_id"] = worker_id
+                results[index] = result
+                task_queue.task_done()
+
+        threads = [
+            threading.Thread(target=worker, args=(worker_id, tab), daemon=True)
+            for worker_id, tab in enumerate(self.tabs)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return self._merge_results(tasks, results, worker_stats, time.time() - start_time)
+
+    @staticmethod
+    def _merge_results(tasks: List[Dict], results: List[Optional[Dict]],
+                       worker_stats: Dict[int, Dict], elapsed: float) -> Dict:
+        """按任务顺序合并结果（原始职位，不提取）"""
+        jobs_by_task = []
+        task_results = []
+
+        for task, result in zip(tasks, results):
+            result = result or {"success": False, "message": "任务未执行"}
+            page_jobs = []
+
+            if result["success"]:
+                page_jobs = list(result["data"].get("jobList", []))
+            jobs_by_task.append(page_jobs)
+
+            task_results.append({
+                "params": task,
+                "success": result["success"],
+                "message": result.get("message", ""),
+                "worker_id": result.get("worker_id"),
+                "jobs_count": len(page_jobs),
+                "total_count": result.get("data", {}).get("totalCount", 0) if result["success"] else 0,
+                "has_more": result.get("data", {}).get("hasMore", False) if result["success"] else False,
+            })
+
+        return {
+            "success": any(item["success"] for item in task_results),
+            "jobs_by_task": jobs_by_task,
+            "task_results": task_results,
+            "worker_stats": dict(sorted(worker_stats.items())),
+            "elapsed": elapsed,
+        }
+
+    def close(self) -> None:
+        """关闭工作标签页和浏览器实例（主标签页保留）"""
+        for tab in self.tabs[1:]:
+            if self.mode == self.MODE_TAB:
+                try:
+                    tab.close()
+                except Exception as e:
+                    print(f"关闭标签页时出错: {e}")
+
+        for browser in self._browsers:
+            browser.close()
+
+        self.tabs = []
+        self._browsers = []
+        self._started = False
+
+    def __enter__(self):
+        """上下文管理器入口"""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """上下文管理器出口"""
+        self.close()
@@ -0,0 +1,73 @@
+"""
+Boss直聘爬虫常驻服务入口
+
+启动后预热并认证爬虫实例，通过本地HTTP端口（默认8080）或Unix套接字
+对外提供搜索接口，供 Node.js 后台调用。
+
+环境变量:
+    SCRAPER_HOST         监听地址，默认 0.0.0.0
+    SCRAPER_PORT         监听端口，默认 8080
+    SCRAPER_SOCKET       Unix套接字路径，设置后不监听TCP端口
+    SCRAPER_INSTANCES    常驻爬虫实例数，默认 1
+    BOSS_COOKIE_FILE     cookies文件路径
+    BOSS_COOKIE_STRING   cookie字符串
+    BOSS_CONFIG_FILE     爬虫配置文件路径
+"""
+
+import os
+import sys
+import signal
+import threading
+
+# 将项目根目录添加到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.boss.config import BossConfig
+from src.data.boss.service import BossScraperService, BossServiceServer
+
+
+def main() -> int:
+    config = BossConfig()
+    config_file = os.environ.get("BOSS_CONFIG_FILE")
+    if config_file:
+        config.load_config_from_file(config_file)
+
+    auth_params = {}
+    if os.environ.get("BOSS_COOKIE_FILE"):
+        auth_params["cookie_file"] = os.environ["BOSS_COOKIE_FILE"]
+    if os.environ.get("BOSS_COOKIE_STRING"):
+        auth_params["cookie_string"] = os.environ["BOSS_COOKIE_STRING"]
+
+    service = BossScraperService(
+        config,
+        instances=int(os.environ.get("SCRAPER_INSTANCES", 1)),
+        **auth_params
+    )
+    if not service.start():
+        print("❌ 没有可用的爬虫实例，服务退出")
+        return 1
+
+    server = BossServiceServer(
+        service,
+        host=os.environ.get("SCRAPER_HOST", "0.0.0.0"),
+        port=int(os.environ.get("SCRAPER_PORT", 8080)),
+        unix_socket=os.environ.get("SCRAPER_SOCKET"),
+    )
+
+    def handle_signal(signum, frame):
+        print(f"收到信号 {signum}，正在停止服务...")
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    try:
+        server.serve_forever()
+    finally:
+        service.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""接口直连模式测试：对本地桩服务（BossStubServer）请求 joblist.json 并分页抓取
+
+运行方式（项目根目录下）：
+
+    python -m pytest test/test_boss_api_fetch.py
+"""
+
+import copy
+import importlib.util
+import unittest
+
+from src.data.boss.api_client import BossApiClient
+from src.data.boss.config import BossConfig
+from src.data.boss.data_processor import BossDataProcessor
+from src.data.boss.stub_server import BossStubServer
+
+
+def _make_pages(page_count: int = 2):
+    """以录制的响应为模板构造多页响应：每页职位ID不同，最后一页 hasMore 为 False"""
+    recorded = BossStubServer.load_recorded_payload()
+    pages = []
+    for page in range(1, page_count + 1):
+        payload = copy.deepcopy(recorded)
+        for index, job in enumerate(payload["zpData"]["jobList"]):
+            job["encryptJobId"] = f"stub-p{page}-{index}"
+        payload["zpData"]["hasMore"] = page < page_count
+        pages.append(payload)
+    return pages
+
+
+class TestApiClientAgainstStub(unittest.TestCase):
+    """BossApiClient 直接请求桩服务"""
+
+    def setUp(self):
+        self.pages = _make_pages()
+        self.stub = BossStubServer(self.pages)
+        self.stub.start()
+        self.config = BossConfig()
+        self.config.update_scraper_config(api_base_url=self.stub.api_url)
+
+    def tearDown(self):
+        self.stub.stop()
+
+    def test_fetch_pages_and_extract_jobs(self):
+        processor = BossDataProcessor(self.config)
+        with BossApiClient(self.config) as client:
+            # cookie 默认作用于 .zhipin.com，桩服务在本机，需指定域名
+            client.load_cookies([{"name": "wt2", "value": "test-token", "domain": self.stub.host}])
+            jobs = []
+            page = 1
+            while True:
+                data = client.fetch_job_list({"query": "Python", "city": "上海", "page": page})
+                self.assertEqual(data["code"], 0)
+                jobs.extend(processor.extract_job_list(data["zpData"]["jobList"]))
+                if not data["zpData"]["hasMore"]:
+                    break
+                page += 1
+
+        per_page = len(self.pages[0]["zpData"]["jobList"])
+        self.assertGreater(per_page, 0)
+        self.assertEqual(page, 2)
+        self.assertEqual(len(jobs), 2 * per_page)
+        self.assertEqual(jobs[0]["job_id"], "stub-p1-0")
+        self.assertEqual(jobs[-1]["job_id"], f"stub-p2-{per_page - 1}")
+        self.assertEqual(jobs[0]["job_name"], self.pages[0]["zpData"]["jobList"][0]["jobName"])
+
+        # 分页参数和登录cookie都传给了接口
+        self.assertEqual([r["query"]["page"] for r in self.stub.requests], ["1", "2"])
+        self.assertTrue(all(r["query"]["query"] == "Python" for r in self.stub.requests))
+        self.assertTrue(all("wt2=test-token" in r["cookie"] for r in self.stub.requests))
+
+    def test_unknown_path_is_rejected(self):
+        self.config.update_scraper_config(api_base_url=self.stub.api_url.replace("joblist", "missing"))
+        with BossApiClient(self.config) as client:
+            with self.assertRaises(Exception):
+                client.fetch_job_list({"query": "Python", "city": "上海", "page": 1})
+
+
+@unittest.skipUnless(importlib.util.find_spec("DrissionPage"), "需要 DrissionPage")
+class TestScraperApiMode(unittest.TestCase):
+    """BossScraper 在 api 模式下分页抓取，hasMore 为 False 时停止"""
+
+    def test_batch_search_via_api(self):
+        import tempfile
+        from src.data.boss.rate_limiter import BossRateScheduler
+        from src.data.boss.scraper import BossScraper
+
+        pages = _make_pages(3)
+        with BossStubServer(pages) as stub, tempfile.TemporaryDirectory() as tmp_dir:
+            config = BossConfig()
+            config.get_result_dir = lambda: tmp_dir
+            config.update_scraper_config(api_base_url=stub.api_url, fetch_mode="api")
+            config.scraper_config["raw_archive"]["enabled"] = False
+            scraper = BossScraper(config)
+            scraper._initialized = True
+            scraper.rate_scheduler = BossRateScheduler(target_qps=0)
+            try:
+                result = scraper.batch_search({"query": "Python", "city": "上海"}, max_pages=5, save=False)
+            finally:
+                scraper.close()
+
+        per_page = len(pages[0]["zpData"]["jobList"])
+        self.assertTrue(result["success"])
+        self.assertEqual(result["pages_fetched"], 3)
+        self.assertEqual(result["total_jobs"], 3 * per_page)
+        self.assertEqual([r["query"]["page"] for r in stub.requests], ["1", "2", "3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""异步批量搜索测试：与同步批量搜索相同的按总数停止、断点续接
+
+运行方式（项目根目录下）：
+
+    python -m pytest test/test_boss_async_scraper.py
+"""
+
+import asyncio
+import importlib.util
+import tempfile
+import unittest
+
+from src.data.boss.config import BossConfig
+
+HAS_DRISSIONPAGE = importlib.util.find_spec("DrissionPage") is not None
+
+
+@unittest.skipUnless(HAS_DRISSIONPAGE, "需要 DrissionPage")
+class TestAsyncBatchSearch(unittest.TestCase):
+
+    def setUp(self):
+        from src.data.boss.async_scraper import AsyncBossScraper
+        from src.data.boss.rate_limiter import BossRateScheduler
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        config = BossConfig()
+        config.get_result_dir = lambda: self.tmp_dir.name
+        config.scraper_config["raw_archive"]["enabled"] = False
+        self.scraper = AsyncBossScraper(config, max_concurrency=2)
+        self.scraper.scraper._initialized = True
+        self.scraper.scraper.rate_scheduler = BossRateScheduler(target_qps=0)
+        self.scraper._search_jobs = self._search_jobs
+        self.requested = []
+        self.fail_pages = set()
+        self.params = {"query": "Python", "city": "上海"}
+
+    def tearDown(self):
+        asyncio.run(self.scraper.close())
+        self.tmp_dir.cleanup()
+
+    async def _search_jobs(self, params, fetch_mode=None, max_age=None):
+        page = params["page"]
+        self.requested.append(page)
+        if page in self.fail_pages:
+            self.fail_pages.discard(page)
+            return {"success": False, "message": "访问被限制，需要等待或更换IP"}
+        # 最后一页的 hasMore 仍为true，只能按总数停止
+        jobs = [{"encryptJobId": f"p{page}-{i}", "jobName": "Python开发"} for i in range(3)]
+        return {"success": True, "data": {"jobList": jobs, "hasMore": True, "totalCount": 9}}
+
+    def test_stops_at_total_count(self):
+        result = asyncio.run(self.scraper.batch_search(self.params, max_pages=5, save=False))
+        self.assertEqual(self.requested, [1, 2, 3])
+        self.assertEqual((result["total_jobs"], result["pages_fetched"]), (9, 3))
+        self.assertTrue(result["completed"])
+
+    def test_resume_after_failed_page(self):
+        self.fail_pages = {2}
+        first = asyncio.run(self.scraper.batch_search(self.params, max_pages=5, resume=True, save=False))
+        self.assertFalse(first["completed"])
+        self.assertEqual(first["total_jobs"], 3)
+
+        self.requested.clear()
+        second = asyncio.run(self.scraper.batch_search(self.params, max_pages=5, resume=True, save=False))
+        self.assertEqual(self.requested, [2, 3])
+        self.assertEqual([job.job_id for job in second["jobs"]], [f"p{page}-{i}" for page in range(1, 4) for i in range(3)])
+
+
+if __name__ == "__main__":
+    unittest.main()
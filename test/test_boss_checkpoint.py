@@ -0,0 +1,211 @@
+"""抓取断点测试：断点库的续接规则，批量搜索失败后恢复，滚动搜索恢复时快进
+
+运行方式（项目根目录下）：
+
+    python -m pytest test/test_boss_checkpoint.py
+"""
+
+import importlib.util
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from src.data.boss.checkpoint import BossCheckpointStore
+from src.data.boss.config import BossConfig
+
+HAS_DRISSIONPAGE = importlib.util.find_spec("DrissionPage") is not None
+
+
+def _raw_jobs(prefix: str, count: int = 3):
+    """构造接口返回的原始职位"""
+    return [{"encryptJobId": f"{prefix}-{i}", "jobName": f"Python开发{i}", "cityName": "上海"}
+            for i in range(count)]
+
+
+def _make_scraper(tmp_dir: str):
+    """不启动浏览器的爬虫：结果、断点写入临时目录，请求不限速"""
+    from src.data.boss.rate_limiter import BossRateScheduler
+    from src.data.boss.scraper import BossScraper
+
+    config = BossConfig()
+    config.get_result_dir = lambda: tmp_dir
+    config.scraper_config["raw_archive"]["enabled"] = False
+    scraper = BossScraper(config)
+    scraper._initialized = True
+    scraper.rate_scheduler = BossRateScheduler(target_qps=0)
+    return scraper
+
+
+class TestCheckpointStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = BossCheckpointStore(os.path.join(self.tmp_dir.name, "checkpoints.sqlite3"))
+        self.params = {"query": "Python", "city": "101020100"}
+        self.run_key = BossCheckpointStore.make_run_key(self.params)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp_dir.cleanup()
+
+    def _record_two_pages(self):
+        self.store.start_run(self.run_key, self.params)
+        self.store.complete_unit(self.run_key, 1, [{"job_id": "a"}], total_count=30)
+        self.store.complete_unit(self.run_key, 2, [{"job_id": "b"}])
+
+    def test_failed_run_resumes(self):
+        self._record_two_pages()
+        self.store.finish_run(self.run_key, BossCheckpointStore.STATUS_FAILED, "第3页失败")
+
+        state = self.store.start_run(self.run_key, self.params, resume=True)
+        self.assertEqual(state["status"], BossCheckpointStore.STATUS_RUNNING)
+        self.assertEqual(state["completed_units"], [1, 2])
+        self.assertEqual(state["total_count"], 30)
+        self.assertEqual(sorted(self.store.seen_job_ids(self.run_key)), ["a", "b"])
+        self.assertEqual([job.job_id for job in self.store.load_jobs(self.run_key)], ["a", "b"])
+
+    def test_interrupted_run_resumes(self):
+        self._record_two_pages()  # 进程崩溃：状态仍为 running
+        state = self.store.start_run(self.run_key, self.params, resume=True)
+        self.assertEqual(state["completed_units"], [1, 2])
+
+    def test_done_run_starts_fresh(self):
+        self._record_two_pages()
+        self.store.finish_run(self.run_key)
+
+        state = self.store.start_run(self.run_key, self.params, resume=True)
+        self.assertEqual(state["status"], BossCheckpointStore.STATUS_RUNNING)
+        self.assertEqual(state["completed_units"], [])
+        self.assertEqual(self.store.seen_job_ids(self.run_key), [])
+        self.assertEqual(self.store.load_jobs(self.run_key), [])
+
+    def test_without_resume_starts_fresh(self):
+        self._record_two_pages()
+        state = self.store.start_run(self.run_key, self.params)
+        self.assertEqual(state["completed_units"], [])
+
+
+@unittest.skipUnless(HAS_DRISSIONPAGE, "需要 DrissionPage")
+class TestBatchResume(unittest.TestCase):
+    """批量搜索第3页失败后 resume=True 只请求未完成的页"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.scraper = _make_scraper(self.tmp_dir.name)
+        self.requested = []
+        self.fail_pages = {3}
+        self.scraper.search_jobs = self._search_jobs
+
+    def tearDown(self):
+        self.scraper.close()
+        self.tmp_dir.cleanup()
+
+    def _search_jobs(self, params, max_age=None):
+        page = params["page"]
+        self.requested.append(page)
+        if page in self.fail_pages:
+            self.fail_pages.discard(page)
+            return {"success": False, "message": "访问被限制，需要等待或更换IP"}
+        return {"success": True, "data": {"jobList": _raw_jobs(f"p{page}"), "hasMore": page < 4,
+                                          "totalCount": 12}}
+
+    def test_resume_after_failed_page(self):
+        params = {"query": "Python", "city": "上海"}
+        first = self.scraper.batch_search(params, max_pages=5, resume=True, save=False)
+        self.assertFalse(first["completed"])
+        self.assertEqual(first["total_jobs"], 6)
+        self.assertEqual(self.requested, [1, 2, 3])
+
+        self.requested.clear()
+        second = self.scraper.batch_search(params, max_pages=5, resume=True, save=False)
+        self.assertTrue(second["completed"])
+        self.assertEqual(self.requested, [3, 4])
+        self.assertEqual([job.job_id for job in second["jobs"]],
+                         [f"p{page}-{i}" for page in range(1, 5) for i in range(3)])
+
+        # 已完成的运行再次 resume=True 时重新抓取，而不是直接返回上次的职位
+        self.requested.clear()
+        third = self.scraper.batch_search(params, max_pages=5, resume=True, save=False)
+        self.assertEqual(self.requested, [1, 2, 3, 4])
+        self.assertEqual(third["total_jobs"], 12)
+
+
+class _FakePage:
+    """模拟搜索页：每次等待数据包依次返回下一页职位，第 fail_at_scroll 次滚动时抛出异常"""
+
+    def __init__(self, pages: int, fail_at_scroll=None):
+        self.bodies = [{"code": 0, "zpData": {"jobList": _raw_jobs(f"p{page}")}} for page in range(1, pages + 1)]
+        self.fail_at_scroll = fail_at_scroll
+        self.scrolls = 0
+        self.listen = SimpleNamespace(start=lambda *args: None, stop=lambda: None, wait=self._wait)
+        self.scroll = SimpleNamespace(to_bottom=self._to_bottom)
+
+    def get(self, url, **kwargs):
+        pass
+
+    def ele(self, selector, timeout=None):
+        return True
+
+    def _to_bottom(self):
+        self.scrolls += 1
+        if self.scrolls == self.fail_at_scroll:
+            raise RuntimeError("浏览器已断开")
+
+    def _wait(self, timeout=None):
+        if not self.bodies:
+            return None
+        body = self.bodies.pop(0)
+        return SimpleNamespace(url="https://www.zhipin.com/wapi/zpgeek/search/joblist.json",
+                               response=SimpleNamespace(body=body))
+
+
+@unittest.skipUnless(HAS_DRISSIONPAGE, "需要 DrissionPage")
+class TestScrollResume(unittest.TestCase):
+    """滚动搜索中断后恢复：先快进已完成的滚动（其间没有新职位不算到底），再继续收集"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.scraper = _make_scraper(self.tmp_dir.name)
+        self.params = {"query": "Python", "city": "上海"}
+
+    def tearDown(self):
+        self.scraper.close()
+        self.tmp_dir.cleanup()
+
+    def test_fast_forward_to_last_scroll(self):
+        self.scraper.page = _FakePage(pages=5, fail_at_scroll=3)
+        first = self.scraper.search_jobs_with_scrolling(self.params, max_scroll_times=5, resume=True)
+        self.assertFalse(first["success"])
+
+        run_key = BossCheckpointStore.make_run_key(self.params, BossCheckpointStore.KIND_SCROLL)
+        state = self.scraper.checkpoint_store.get_run(run_key)
+        self.assertEqual(state["status"], BossCheckpointStore.STATUS_FAILED)
+        self.assertEqual(state["scroll_count"], 2)
+        self.assertEqual(state["packet_count"], 3)
+        self.assertEqual(state["job_count"], 9)
+
+        # 重新打开页面后前3个数据包都是已见职位，快进期间不能判定为到底
+        page = _FakePage(pages=5)
+        self.scraper.page = page
+        second = self.scraper.search_jobs_with_scrolling(self.params, max_scroll_times=5, resume=True)
+        self.assertTrue(second["success"])
+        self.assertEqual(second["total_jobs"], 15)
+        self.assertEqual(len({job.job_id for job in second["jobs"]}), 15)
+        self.assertGreaterEqual(page.scrolls, 4)
+
+        state = self.scraper.checkpoint_store.get_run(run_key)
+        self.assertEqual(state["status"], BossCheckpointStore.STATUS_DONE)
+        self.assertEqual(state["scroll_count"], 5)
+
+    def test_without_checkpoint_stops_at_first_empty_scroll(self):
+        self.scraper.page = _FakePage(pages=2)
+        self.scraper.page.bodies.insert(1, self.scraper.page.bodies[0])
+        result = self.scraper.search_jobs_with_scrolling(self.params, max_scroll_times=5)
+        self.assertTrue(result["success"])
+        self.assertEqual(result["total_jobs"], 3)
+        self.assertEqual(self.scraper.page.scrolls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
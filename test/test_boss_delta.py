@@ -0,0 +1,141 @@
+"""增量抓取测试：职位状态分类与记录，连续未变化的页后停止翻页（串行和并发）
+
+运行方式（项目根目录下）：
+
+    python -m pytest test/test_boss_delta.py
+"""
+
+import importlib.util
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from src.data.boss.config import BossConfig
+from src.data.boss.job_state import STATUS_CHANGED, STATUS_NEW, STATUS_UNCHANGED, BossJobStateStore
+
+HAS_DRISSIONPAGE = importlib.util.find_spec("DrissionPage") is not None
+
+
+def _raw_job(job_id: str, modified: int = 1000, valid: int = 1):
+    """构造接口返回的原始职位"""
+    return {"encryptJobId": job_id, "jobName": "Python开发", "lastModifyTime": modified, "jobValidStatus": valid}
+
+
+class TestJobStateStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = BossJobStateStore(os.path.join(self.tmp_dir.name, "job_state.sqlite3"))
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp_dir.cleanup()
+
+    def test_classify_against_recorded_state(self):
+        self.store.record([_raw_job("a"), _raw_job("b"), _raw_job("c")])
+        statuses = self.store.classify([
+            _raw_job("a"),
+            _raw_job("b", modified=2000),
+            _raw_job("c", valid=0),
+            _raw_job("d"),
+            {"jobName": "无ID职位"},
+        ])
+        self.assertEqual(statuses, {"a": STATUS_UNCHANGED, "b": STATUS_CHANGED, "c": STATUS_CHANGED, "d": STATUS_NEW})
+
+    def test_classify_is_read_only(self):
+        self.assertEqual(self.store.classify([_raw_job("a")]), {"a": STATUS_NEW})
+        self.assertEqual(self.store.classify([_raw_job("a")]), {"a": STATUS_NEW})
+        self.assertIsNone(self.store.get("a"))
+
+    def test_record_keeps_last_changed_for_unchanged_jobs(self):
+        self.assertEqual(self.store.record([_raw_job("a"), _raw_job("b")]), 2)
+        first = self.store.get("a")
+
+        time.sleep(0.01)
+        self.store.record([_raw_job("a"), _raw_job("b", modified=2000)])
+        unchanged, changed = self.store.get("a"), self.store.get("b")
+        self.assertEqual(unchanged["last_changed"], first["last_changed"])
+        self.assertGreater(unchanged["last_seen"], first["last_seen"])
+        self.assertEqual(changed["last_changed"], changed["last_seen"])
+        self.assertEqual(changed["last_modify_time"], 2000)
+        self.assertEqual(self.store.stale_job_ids(unchanged["last_seen"]), [])
+
+
+def _fake_start(pool):
+    """不启动浏览器：用占位对象代替工作标签页"""
+    pool.tabs = [object() for _ in range(pool.workers)]
+    pool._started = True
+    return True
+
+
+@unittest.skipUnless(HAS_DRISSIONPAGE, "需要 DrissionPage")
+class TestDeltaBatchSearch(unittest.TestCase):
+    """第2次抓取时前2页有变化，第3页起与上次相同：stop_after_unchanged_pages 页未变化后停止"""
+
+    def setUp(self):
+        from src.data.boss.rate_limiter import BossRateScheduler
+        from src.data.boss.scraper import BossScraper
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config = BossConfig()
+        self.config.get_result_dir = lambda: self.tmp_dir.name
+        self.config.scraper_config["raw_archive"]["enabled"] = False
+        self.scraper = BossScraper(self.config)
+        self.scraper._initialized = True
+        self.scraper.rate_scheduler = BossRateScheduler(target_qps=0)
+        self.scraper.search_jobs = self._search_jobs
+        self.requested = []
+        self.modified = 1000
+        self.params = {"query": "Python", "city": "上海"}
+
+        patcher = mock.patch("src.data.boss.worker_pool.BossWorkerPool.start", _fake_start)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.scraper.close()
+        self.tmp_dir.cleanup()
+
+    def _search_jobs(self, params, fetch_mode=None, tab=None, max_age=None):
+        page = params["page"]
+        self.requested.append(page)
+        # 前2页的职位在第2次抓取时已更新
+        modified = self.modified if page <= 2 else 1000
+        jobs = [_raw_job(f"p{page}-{i}", modified=modified) for i in range(3)]
+        return {"success": True, "data": {"jobList": jobs, "hasMore": page < 6, "totalCount": 18}}
+
+    def _search_twice(self, stop_after: int, workers: int = 1):
+        self.config.scraper_config["delta"]["stop_after_unchanged_pages"] = stop_after
+        first = self.scraper.batch_search(self.params, max_pages=6, workers=workers, save=False, delta=True)
+        self.assertEqual(first["delta"]["new"], 18)
+        self.assertFalse(first["delta"]["stopped_early"])
+
+        self.requested.clear()
+        self.modified = 2000
+        return self.scraper.batch_search(self.params, max_pages=6, workers=workers, save=False, delta=True)
+
+    def test_serial_stops_after_unchanged_pages(self):
+        result = self._search_twice(stop_after=2)
+        self.assertEqual(self.requested, [1, 2, 3, 4])
+        self.assertEqual(result["total_jobs"], 6)
+        self.assertEqual(result["pages_fetched"], 4)
+        self.assertEqual(result["delta"], {"new": 0, "changed": 6, "unchanged": 6, "stopped_early": True})
+
+    def test_serial_without_early_stop(self):
+        result = self._search_twice(stop_after=0)
+        self.assertEqual(self.requested, [1, 2, 3, 4, 5, 6])
+        self.assertEqual(result["delta"], {"new": 0, "changed": 6, "unchanged": 12, "stopped_early": False})
+
+    def test_parallel_ignores_pages_after_stop(self):
+        result = self._search_twice(stop_after=2, workers=2)
+        # 各页已并发抓取，但第4页之后的页不分类也不记录
+        self.assertEqual(sorted(self.requested), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(result["pages_fetched"], 4)
+        self.assertEqual([job.job_id for job in result["jobs"]], [f"p{page}-{i}" for page in (1, 2) for i in range(3)])
+        self.assertEqual(result["delta"], {"new": 0, "changed": 6, "unchanged": 6, "stopped_early": True})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""抓取任务队列测试：refresh 重新抓取，失败按指数退避重试，中断后恢复
+
+运行方式（项目根目录下）：
+
+    python -m pytest test/test_boss_frontier.py
+"""
+
+import importlib.util
+import os
+import tempfile
+import time
+import unittest
+
+from src.data.boss.config import BossConfig
+from src.data.boss.frontier import BossCrawlFrontier
+
+HAS_DRISSIONPAGE = importlib.util.find_spec("DrissionPage") is not None
+
+
+class _FakeScraper:
+    """记录每次 batch_search 调用，前 failures 次返回未完成"""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.calls = []
+
+    def batch_search(self, search_params, max_pages=None, resume=False):
+        self.calls.append({"params": search_params, "max_pages": max_pages, "resume": resume})
+        if self.failures:
+            self.failures -= 1
+            return {"success": True, "jobs": [], "total_jobs": 0, "completed": False,
+                    "message": "访问被限制，需要等待或更换IP"}
+        return {"success": True, "jobs": [], "total_jobs": 3, "total_count": 3, "pages_fetched": 1,
+                "completed": True}
+
+
+class TestCrawlFrontier(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "frontier.sqlite3")
+        self.frontier = BossCrawlFrontier(self.db_path, max_attempts=3, backoff=0.05)
+
+    def tearDown(self):
+        self.frontier.close()
+        self.tmp_dir.cleanup()
+
+    def test_add_sweep_dedupes_and_refresh_requeues(self):
+        spec = {"query": ["Python", "Java"], "city": "上海"}
+        self.assertEqual(self.frontier.add_sweep(spec), 2)
+        self.assertEqual(self.frontier.add_sweep(spec), 0)
+
+        scraper = _FakeScraper()
+        self.assertEqual(self.frontier.run([scraper], max_pages=2)["completed"], 2)
+        self.assertEqual(self.frontier.get_stats()["done"], 2)
+
+        # 不带 refresh 时已完成的单元不会重跑，带 refresh 时重新排队
+        self.assertEqual(self.frontier.add_sweep(spec), 0)
+        self.assertEqual(self.frontier.add_sweep(spec, refresh=True), 2)
+        self.assertEqual(self.frontier.run([scraper], max_pages=2)["completed"], 2)
+        self.assertEqual(len(scraper.calls), 4)
+
+    def test_retry_with_backoff(self):
+        self.frontier.add_unit({"query": "Python", "city": "上海"})
+        unit = self.frontier.claim()
+        self.assertEqual(unit["attempts"], 1)
+
+        start = time.time()
+        self.assertTrue(self.frontier.fail(unit["unit_key"], "第1次失败"))
+        self.assertIsNone(self.frontier.claim())
+        self.assertAlmostEqual(self.frontier.next_ready_in(), 0.05, delta=0.04)
+
+        time.sleep(0.06)
+        unit = self.frontier.claim()
+        self.assertEqual(unit["attempts"], 2)
+        self.assertTrue(self.frontier.fail(unit["unit_key"], "第2次失败"))
+        # 第2次失败后等待加倍
+        self.assertGreater(self.frontier.next_ready_in() + (time.time() - start), 0.1)
+
+        time.sleep(0.11)
+        unit = self.frontier.claim()
+        self.assertFalse(self.frontier.fail(unit["unit_key"], "第3次失败"))
+        self.assertEqual(self.frontier.list_units()[0]["status"], BossCrawlFrontier.STATUS_FAILED)
+        self.assertIsNone(self.frontier.next_ready_in())
+
+    def test_run_retries_until_completed(self):
+        self.frontier.add_unit({"query": "Python", "city": "上海"})
+        scraper = _FakeScraper(failures=2)
+        stats = self.frontier.run([scraper])
+
+        self.assertEqual((stats["completed"], stats["retried"], stats["failed"]), (1, 2, 0))
+        self.assertEqual(len(scraper.calls), 3)
+        self.assertTrue(all(call["resume"] for call in scraper.calls))
+        unit = self.frontier.list_units()[0]
+        self.assertEqual((unit["status"], unit["attempts"], unit["jobs"]), (BossCrawlFrontier.STATUS_DONE, 3, 3))
+
+    def test_recover_requeues_running_units(self):
+        self.frontier.add_units([{"query": "Python", "city": "上海"}, {"query": "Go", "city": "上海"}])
+        self.frontier.claim()  # 执行中进程退出
+        self.frontier.close()
+
+        self.frontier = BossCrawlFrontier(self.db_path, max_attempts=3, backoff=0.05)
+        self.assertEqual(self.frontier.get_stats()["running"], 1)
+        self.assertEqual(self.frontier.recover(), 1)
+        self.assertEqual(self.frontier.get_stats()["pending"], 2)
+
+        unit = self.frontier.claim()
+        self.assertEqual(unit["attempts"], 2)
+
+
+@unittest.skipUnless(HAS_DRISSIONPAGE, "需要 DrissionPage")
+class TestFrontierWithScraper(unittest.TestCase):
+    """真实 BossScraper（search_jobs 替换为桩）：refresh 后重新请求各页，重试和恢复时续接断点"""
+
+    def setUp(self):
+        from src.data.boss.rate_limiter import BossRateScheduler
+        from src.data.boss.scraper import BossScraper
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        config = BossConfig()
+        config.get_result_dir = lambda: self.tmp_dir.name
+        config.scraper_config["raw_archive"]["enabled"] = False
+        self.scraper = BossScraper(config)
+        self.scraper._initialized = True
+        self.scraper.rate_scheduler = BossRateScheduler(target_qps=0)
+        self.scraper.search_jobs = self._search_jobs
+        self.requested = []
+        self.fail_pages = set()
+
+        self.frontier = BossCrawlFrontier(os.path.join(self.tmp_dir.name, "frontier.sqlite3"), backoff=0.01)
+        self.spec = {"query": "Python", "city": "上海"}
+
+    def tearDown(self):
+        self.frontier.close()
+        self.scraper.close()
+        self.tmp_dir.cleanup()
+
+    def _search_jobs(self, params, max_age=None):
+        page = params["page"]
+        self.requested.append(page)
+        if page in self.fail_pages:
+            self.fail_pages.discard(page)
+            return {"success": False, "message": "访问被限制，需要等待或更换IP"}
+        jobs = [{"encryptJobId": f"p{page}-{i}", "jobName": "Python开发"} for i in range(3)]
+        return {"success": True, "data": {"jobList": jobs, "hasMore": page < 2, "totalCount": 6}}
+
+    def test_refresh_fetches_again(self):
+        self.frontier.add_sweep(self.spec, max_pages=5)
+        self.assertEqual(self.frontier.run([self.scraper])["jobs"], 6)
+        self.assertEqual(self.requested, [1, 2])
+
+        self.requested.clear()
+        self.assertEqual(self.frontier.add_sweep(self.spec, max_pages=5, refresh=True), 1)
+        stats = self.frontier.run([self.scraper])
+        self.assertEqual(self.requested, [1, 2])
+        self.assertEqual((stats["completed"], stats["jobs"]), (1, 6))
+
+    def test_retry_resumes_and_refresh_discards_failed_checkpoint(self):
+        self.frontier.max_attempts = 1
+        self.fail_pages = {2}
+        self.frontier.add_sweep(self.spec, max_pages=5)
+        self.assertEqual(self.frontier.run([self.scraper])["failed"], 1)
+        self.assertEqual(self.requested, [1, 2])
+
+        # 第二天 refresh：上一轮失败留下的断点不再续接，从第1页抓取
+        self.requested.clear()
+        self.frontier.max_attempts = 3
+        self.fail_pages = {2}
+        self.frontier.add_sweep(self.spec, max_pages=5, refresh=True)
+        stats = self.frontier.run([self.scraper])
+        # 第1次执行第2页失败，重试时跳过已完成的第1页
+        self.assertEqual(self.requested, [1, 2, 2])
+        self.assertEqual((stats["completed"], stats["retried"], stats["jobs"]), (1, 1, 6))
+
+
+if __name__ == "__main__":
+    unittest.main()
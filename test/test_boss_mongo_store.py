@@ -0,0 +1,140 @@
+"""MongoDB存储测试：使用 mongomock 的集合，不需要真实的 mongod
+
+运行方式（项目根目录下）：
+
+    python -m pytest test/test_boss_mongo_store.py
+"""
+
+import threading
+import time
+import unittest
+
+try:
+    import mongomock
+except ImportError:  # 测试依赖见 requirements-dev.txt
+    mongomock = None
+
+from src.data.boss.config import BossConfig
+from src.data.boss.data_processor import BossDataProcessor
+
+
+def _make_jobs(start: int, count: int, salary: str = "10-15K"):
+    """构造标准化职位（字典）"""
+    return [
+        {"job_id": f"job{i:05d}", "job_name": f"Python开发{i}", "city_name": "上海", "salary_desc": salary}
+        for i in range(start, start + count)
+    ]
+
+
+def _wait_until(predicate, timeout: float = 3.0) -> bool:
+    """轮询直到条件成立或超时"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+class _GatedCollection:
+    """包装 mongomock 集合：bulk_write 在 gate 放行前阻塞，模拟写入缓慢的数据库"""
+
+    def __init__(self, collection):
+        self._collection = collection
+        self.gate = threading.Event()
+        self.calls = 0
+
+    def bulk_write(self, operations, ordered=True):
+        self.calls += 1
+        self.gate.wait()
+        return self._collection.bulk_write(operations, ordered=ordered)
+
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+
+
+@unittest.skipIf(mongomock is None, "需要 mongomock")
+class TestMongoStore(unittest.TestCase):
+
+    def setUp(self):
+        from src.data.boss.mongo_store import BossMongoStore
+        self.store_class = BossMongoStore
+        self.collection = mongomock.MongoClient()["boss"]["jobs"]
+
+    def test_upsert_on_job_id(self):
+        with self.store_class(self.collection, batch_size=100, flush_interval=10) as store:
+            store.write_jobs(_make_jobs(0, 5))
+            store.flush()
+            first_seen = self.collection.find_one({"job_id": "job00001"})["first_seen"]
+
+            # 同一批内的重复职位合并，跨批次按 job_id 更新而不是新增
+            store.write_jobs(_make_jobs(3, 5, salary="20-30K") + _make_jobs(3, 1, salary="30-40K"))
+            store.flush()
+
+            self.assertEqual(self.collection.count_documents({}), 8)
+            self.assertEqual(self.collection.find_one({"job_id": "job00003"})["salary_desc"], "30-40K")
+            self.assertEqual(self.collection.find_one({"job_id": "job00007"})["salary_desc"], "20-30K")
+            self.assertEqual(self.collection.find_one({"job_id": "job00001"})["first_seen"], first_seen)
+            self.assertEqual(store.get_stats()["failed"], 0)
+
+            store.write_jobs([{"job_name": "没有ID"}])
+            self.assertEqual(store.get_stats()["skipped"], 1)
+
+        index_keys = {tuple(info["key"]) for info in self.collection.index_information().values()}
+        self.assertIn((("job_id", 1),), index_keys)
+
+    def test_flush_on_interval(self):
+        with self.store_class(self.collection, batch_size=1000, flush_interval=0.1) as store:
+            store.write_jobs(_make_jobs(0, 3))
+            # 不足一批、也不调用 flush，等待 flush_interval 后由写入线程写入
+            self.assertTrue(_wait_until(lambda: self.collection.count_documents({}) == 3))
+            self.assertEqual(store.get_stats()["batches"], 1)
+            self.assertEqual(store.get_stats()["pending"], 0)
+
+    def test_full_buffer_applies_backpressure(self):
+        gated = _GatedCollection(self.collection)
+        store = self.store_class(gated, batch_size=2, flush_interval=0.01, max_buffer=2)
+        try:
+            store.write_jobs(_make_jobs(0, 2))
+            # 写入线程取走第一批后阻塞在 bulk_write 上
+            self.assertTrue(_wait_until(lambda: gated.calls == 1 and store.get_stats()["pending"] == 0))
+            store.write_jobs(_make_jobs(2, 2))  # 缓冲区写满
+
+            writer = threading.Thread(target=store.write_jobs, args=(_make_jobs(4, 1),))
+            writer.start()
+            writer.join(0.3)
+            self.assertTrue(writer.is_alive(), "缓冲区已满时 write_jobs 应等待")
+
+            gated.gate.set()
+            writer.join(3)
+            self.assertFalse(writer.is_alive())
+            store.flush()
+        finally:
+            gated.gate.set()
+            store.close()
+
+        self.assertEqual(self.collection.count_documents({}), 5)
+        self.assertGreater(store.get_stats()["blocked_seconds"], 0.2)
+
+    def test_data_processor_mongo_backend(self):
+        config = BossConfig()
+        config.update_scraper_config(storage={"backend": "mongo", "flush_interval": 10})
+        processor = BossDataProcessor(config)
+        store = processor.open_storage(collection=self.collection)
+        self.assertIsInstance(store, self.store_class)
+
+        processor.extract_job_list([
+            {"encryptJobId": "raw1", "jobName": "Python开发", "salaryDesc": "15-25K·14薪", "skills": ["Python"]},
+            {"encryptJobId": "raw2", "jobName": "Go开发", "salaryDesc": "面议"},
+        ])
+        processor.close()
+
+        document = self.collection.find_one({"job_id": "raw1"})
+        self.assertEqual(self.collection.count_documents({}), 2)
+        self.assertEqual(document["salary_min"], 15.0)
+        self.assertEqual(document["salary_months"], 14)
+        self.assertEqual(document["skills"], ["Python"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""原始响应归档测试：按内容去重，超出总大小或保留时间后清理旧分段，读取与清理并发
+
+运行方式（项目根目录下）：
+
+    python -m pytest test/test_boss_raw_archive.py
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from src.data.boss.raw_archive import BossRawArchive
+
+
+def _response(page: int):
+    """构造一条搜索响应"""
+    return {"code": 0, "zpData": {"jobList": [{"encryptJobId": f"p{page}-{i}"} for i in range(3)]}}
+
+
+class TestRawArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.archive = None
+
+    def tearDown(self):
+        if self.archive:
+            self.archive.close()
+        self.tmp_dir.cleanup()
+
+    def _open(self, **options) -> BossRawArchive:
+        self.archive = BossRawArchive(self.tmp_dir.name, **options)
+        return self.archive
+
+    def test_dedupes_by_content(self):
+        archive = self._open()
+        for page in (1, 2, 1, 1):
+            self.assertTrue(archive.archive(_response(page), url=f"page={page}"))
+        archive.flush()
+
+        stats = archive.get_stats()
+        self.assertEqual((stats["archived"], stats["duplicates"], stats["entries"]), (2, 2, 2))
+        self.assertEqual(archive.latest(), _response(2))
+        self.assertEqual([item["data"] for item in archive.iter_responses()], [_response(1), _response(2)])
+
+        # 重新打开后索引仍能去重
+        archive.close()
+        archive = self._open()
+        archive.archive(_response(1))
+        archive.flush()
+        self.assertEqual((archive.duplicates, archive.get_stats()["entries"]), (1, 2))
+
+    def test_retention_by_total_size(self):
+        # 每条记录单独一个分段
+        archive = self._open(segment_max_bytes=1)
+        for page in range(1, 5):
+            archive.archive(_response(page))
+        archive.flush()
+        hashes = [item["hash"] for item in archive.iter_responses()]
+        archive.close()
+        segment_size = os.path.getsize(archive._segment_path(4))
+
+        # 重新打开时总大小只够保留最新的2个分段，最旧的分段和索引记录一起清理（写入线程启动时执行）
+        archive = self._open(max_total_bytes=2 * segment_size)
+        archive.close()
+        stats = archive.get_stats()
+        self.assertEqual((stats["segments"], stats["entries"]), (2, 2))
+        self.assertIsNone(archive.get(hashes[0]))
+        self.assertEqual(archive.get(hashes[3]), _response(4))
+        self.assertEqual([item["data"] for item in archive.iter_responses()], [_response(3), _response(4)])
+
+    def test_retention_by_age(self):
+        archive = self._open(segment_max_bytes=1, max_age_days=1)
+        archive.archive(_response(1))
+        archive.archive(_response(2))
+        archive.flush()
+        old_hash = next(iter(archive.iter_responses()))["hash"]
+
+        # 第1个分段超过保留时间，写入下一条时切换分段并清理
+        old = time.time() - 2 * 86400
+        os.utime(archive._segment_path(1), (old, old))
+        archive.archive(_response(3))
+        archive.flush()
+
+        self.assertIsNone(archive.get(old_hash))
+        self.assertEqual([item["data"] for item in archive.iter_responses()], [_response(2), _response(3)])
+
+    def test_missing_segment_is_absent(self):
+        archive = self._open(segment_max_bytes=1)
+        archive.archive(_response(1))
+        archive.archive(_response(2))
+        archive.flush()
+        first_hash = next(iter(archive.iter_responses()))["hash"]
+
+        os.remove(archive._segment_path(1))
+        self.assertIsNone(archive.get(first_hash))
+        self.assertEqual([item["data"] for item in archive.iter_responses()], [_response(2)])
+        self.assertEqual(archive.latest(), _response(2))
+
+    def test_read_while_writing_and_cleaning(self):
+        archive = self._open(segment_max_bytes=1, max_total_bytes=2000)
+        errors = []
+        stop = threading.Event()
+
+        def read():
+            while not stop.is_set():
+                try:
+                    for item in archive.iter_responses():
+                        self.assertIsNotNone(item["data"])
+                        archive.get(item["hash"])
+                except Exception as e:
+                    errors.append(e)
+                    return
+
+        readers = [threading.Thread(target=read) for _ in range(3)]
+        for reader in readers:
+            reader.start()
+        for page in range(200):
+            archive.archive(_response(page))
+        archive.flush()
+        stop.set()
+        for reader in readers:
+            reader.join(5)
+
+        self.assertEqual(errors, [])
+        self.assertLess(archive.get_stats()["segments"], 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
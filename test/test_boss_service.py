@@ -0,0 +1,97 @@
+"""常驻爬虫服务测试：关闭服务时正在执行的搜索不会触发重建
+
+运行方式（项目根目录下）：
+
+    python -m pytest test/test_boss_service.py
+"""
+
+import importlib.util
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+HAS_DRISSIONPAGE = importlib.util.find_spec("DrissionPage") is not None
+
+
+class _FakeJobScraper:
+    """不启动浏览器的爬虫实例；gate 不为空时 batch_search 等到 gate 放行，关闭后浏览器视为已断开"""
+
+    created = []
+    gate = None
+    started = None
+
+    def __init__(self, config=None):
+        self._initialized = False
+        self.closed = False
+        self.scraper = SimpleNamespace(browser=SimpleNamespace(is_browser_running=lambda: not self.closed))
+        _FakeJobScraper.created.append(self)
+
+    def initialize(self, **auth_params):
+        self._initialized = True
+        return True
+
+    def batch_search(self, search_params, max_pages, resume=False, delta=None):
+        if _FakeJobScraper.gate is not None:
+            _FakeJobScraper.started.set()
+            _FakeJobScraper.gate.wait(5)
+        return {"success": True, "jobs": [], "total_jobs": 0}
+
+    def close(self):
+        self.closed = True
+        self._initialized = False
+
+
+@unittest.skipUnless(HAS_DRISSIONPAGE, "需要 DrissionPage")
+class TestServiceClose(unittest.TestCase):
+
+    def setUp(self):
+        from src.data.boss.service import BossScraperService
+
+        _FakeJobScraper.created = []
+        _FakeJobScraper.gate = threading.Event()
+        _FakeJobScraper.started = threading.Event()
+        patcher = mock.patch("src.data.boss.service.BossJobScraper", _FakeJobScraper)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.service = BossScraperService(instances=2, checkout_timeout=1)
+        self.assertTrue(self.service.start())
+
+    def test_close_waits_for_in_flight_search(self):
+        results = []
+        search = threading.Thread(target=lambda: results.append(self.service.search({"query": "Python"})))
+        search.start()
+        self.assertTrue(_FakeJobScraper.started.wait(5))
+        busy = next(scraper for scraper in _FakeJobScraper.created if scraper not in self.service._idle.queue)
+
+        closer = threading.Thread(target=self.service.close, kwargs={"timeout": 5})
+        closer.start()
+        closer.join(0.2)
+        # 空闲实例立即关闭，借出的实例仍在使用
+        self.assertTrue(closer.is_alive())
+        self.assertEqual([scraper.closed for scraper in _FakeJobScraper.created],
+                         [scraper is not busy for scraper in _FakeJobScraper.created])
+
+        _FakeJobScraper.gate.set()
+        search.join(5)
+        closer.join(5)
+        self.assertFalse(closer.is_alive())
+        self.assertTrue(results[0]["success"])
+        # 借出的实例由搜索线程关闭，没有新建实例
+        self.assertEqual(len(_FakeJobScraper.created), 2)
+        self.assertTrue(all(scraper.closed for scraper in _FakeJobScraper.created))
+        self.assertEqual(self.service.get_metrics()["restarts"], 0)
+        self.assertFalse(self.service.is_ready)
+
+    def test_search_after_close(self):
+        _FakeJobScraper.gate = None
+        self.service.close()
+        result = self.service.search({"query": "Python"})
+        self.assertFalse(result["success"])
+        self.assertEqual(result["error"], "爬虫服务已关闭")
+        self.assertEqual(len(_FakeJobScraper.created), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""并发抓取测试：工作池只返回原始职位，输出目标只收到结果中的职位
+
+运行方式（项目根目录下）：
+
+    python -m pytest test/test_boss_worker_pool.py
+"""
+
+import importlib.util
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from src.data.boss.config import BossConfig
+
+HAS_DRISSIONPAGE = importlib.util.find_spec("DrissionPage") is not None
+
+
+class _RecordingSink:
+    """记录写入的职位ID"""
+
+    def __init__(self):
+        self.job_ids = []
+
+    def write_jobs(self, jobs):
+        self.job_ids.extend(job.get("job_id") for job in jobs)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def _fake_start(pool):
+    """不启动浏览器：用占位对象代替工作标签页"""
+    pool.tabs = [object() for _ in range(pool.workers)]
+    pool._started = True
+    return True
+
+
+@unittest.skipUnless(HAS_DRISSIONPAGE, "需要 DrissionPage")
+class TestParallelBatchSearch(unittest.TestCase):
+
+    def setUp(self):
+        from src.data.boss.rate_limiter import BossRateScheduler
+        from src.data.boss.scraper import BossScraper
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        config = BossConfig()
+        config.get_result_dir = lambda: self.tmp_dir.name
+        config.scraper_config["raw_archive"]["enabled"] = False
+        self.scraper = BossScraper(config)
+        self.scraper._initialized = True
+        self.scraper.rate_scheduler = BossRateScheduler(target_qps=0)
+        self.scraper.search_jobs = self._search_jobs
+        self.sink = _RecordingSink()
+        self.scraper.data_processor.add_sink(self.sink)
+
+        self.lock = threading.Lock()
+        self.requested = []
+        self.fail_pages = set()
+
+        patcher = mock.patch("src.data.boss.worker_pool.BossWorkerPool.start", _fake_start)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.scraper.close()
+        self.tmp_dir.cleanup()
+
+    def _search_jobs(self, params, fetch_mode=None, tab=None, max_age=None):
+        page = params["page"]
+        with self.lock:
+            self.requested.append(page)
+        if page in self.fail_pages:
+            self.fail_pages.discard(page)
+            return {"success": False, "message": "访问被限制，需要等待或更换IP"}
+        # 共3页，第2页重复出现第1页的一个职位；超出的页仍返回职位（接口有时会这样）
+        jobs = [{"encryptJobId": f"p{page}-{i}", "jobName": "Python开发"} for i in range(3)]
+        if page == 2:
+            jobs.append({"encryptJobId": "p1-0", "jobName": "Python开发"})
+        return {"success": True, "data": {"jobList": jobs, "hasMore": page < 3, "totalCount": 0}}
+
+    def test_sinks_receive_only_returned_jobs(self):
+        result = self.scraper.batch_search({"query": "Python", "city": "上海"}, max_pages=5, workers=2, save=False)
+
+        expected = [f"p{page}-{i}" for page in range(1, 4) for i in range(3)]
+        self.assertEqual(sorted(self.requested), [1, 2, 3, 4, 5])
+        self.assertEqual([job.job_id for job in result["jobs"]], expected)
+        self.assertEqual(result["pages_fetched"], 3)
+        # 第4、5页已抓取但在最后一页之后，重复职位只输出一次
+        self.assertEqual(self.sink.job_ids, expected)
+
+    def test_resumed_jobs_are_not_emitted_again(self):
+        params = {"query": "Python", "city": "上海"}
+        self.fail_pages = {2}
+        first = self.scraper.batch_search(params, max_pages=3, workers=2, resume=True, save=False)
+        self.assertFalse(first["completed"])
+        self.assertEqual(self.sink.job_ids, ["p1-0", "p1-1", "p1-2"])
+
+        self.sink.job_ids.clear()
+        second = self.scraper.batch_search(params, max_pages=3, workers=2, resume=True, save=False)
+        self.assertTrue(second["completed"])
+        self.assertEqual(len(second["jobs"]), 9)
+        # 断点中的第1页职位只从断点恢复，不再写入输出目标
+        self.assertEqual(self.sink.job_ids, [f"p{page}-{i}" for page in (2, 3) for i in range(3)])
+
+    def test_search_tasks_extracts_in_task_order(self):
+        tasks = [{"query": "Python", "city": "上海", "page": page} for page in (1, 2)]
+        result = self.scraper.search_tasks(tasks, workers=2)
+
+        self.assertEqual(result["total_jobs"], 6)
+        self.assertEqual([item["jobs_count"] for item in result["task_results"]], [3, 3])
+        self.assertEqual(self.sink.job_ids, [job.job_id for job in result["jobs"]])
+
+        raw = self.scraper.search_tasks(tasks, workers=2, raw=True)
+        self.assertEqual([len(jobs) for jobs in raw["jobs_by_task"]], [3, 4])
+        self.assertEqual(len(self.sink.job_ids), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()